@@ -39,17 +39,52 @@ Architecture:
 
 __version__ = "0.1.0"
 
-from .client import Client
-from .context import Context, get_default_context, reset_default_context
-from .core.scorer import ScoringResult
-from .core.labels import (
-    Label,
-    LabelSet,
-    VirtualLabelPointer,
-    generate_label_id,
-    compute_content_hash,
-    compute_value_hash,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .client import Client
+    from .context import Context, get_default_context, reset_default_context
+    from .core.scorer import ScoringResult
+    from .core.labels import (
+        Label,
+        LabelSet,
+        VirtualLabelPointer,
+        generate_label_id,
+        compute_content_hash,
+        compute_value_hash,
+    )
+
+# Public names are imported on first access (PEP 562). Importing the client
+# pulls in the whole scanner stack, which commands such as
+# `openlabels --version` never need.
+_LAZY_EXPORTS = {
+    "Client": ".client",
+    "ScoringResult": ".core.scorer",
+    "Context": ".context",
+    "get_default_context": ".context",
+    "reset_default_context": ".context",
+    "Label": ".core.labels",
+    "LabelSet": ".core.labels",
+    "VirtualLabelPointer": ".core.labels",
+    "generate_label_id": ".core.labels",
+    "compute_content_hash": ".core.labels",
+    "compute_value_hash": ".core.labels",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     # Client
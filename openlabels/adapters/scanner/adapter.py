@@ -6,13 +6,16 @@ Part of OpenLabels - where labels are the primitive, risk is derived.
 Detector accepts optional Context for resource isolation.
 """
 
+import dataclasses
 import stat as stat_module
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Union, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Tuple, Union, TYPE_CHECKING
 
-from .types import DetectionResult
+from .types import DetectionResult, Span
 from .config import Config
+from .constants import DETECT_CHUNK_OVERLAP, DETECT_CHUNK_SIZE
 
 if TYPE_CHECKING:
     from ...context import Context
@@ -109,7 +112,11 @@ class Detector:
         normalized_text = normalize_text(text)
 
         # Step 2: Run all detectors and get metadata about failures/degradation
-        raw_spans, metadata = self.orchestrator.detect_with_metadata(normalized_text)
+        threshold = self.config.chunk_threshold
+        if threshold and len(normalized_text) > threshold:
+            raw_spans, metadata = self._detect_chunked(normalized_text)
+        else:
+            raw_spans, metadata = self.orchestrator.detect_with_metadata(normalized_text)
 
         # Step 3: Merge overlapping spans (keep highest confidence/tier)
         merged_spans = merge_spans(raw_spans, text=normalized_text)
@@ -139,6 +146,50 @@ class Detector:
             all_detectors_failed=metadata.all_detectors_failed,
         )
 
+    def _detect_chunked(self, text: str) -> Tuple[List[Span], Any]:
+        """
+        Run the orchestrator over overlapping chunks of text concurrently.
+
+        Chunks end on a newline where possible and share DETECT_CHUNK_OVERLAP
+        characters with their neighbour, so an entity cut at one chunk's
+        edge is found whole in the next. Span offsets are shifted back to
+        the full text and exact duplicates from the overlaps are dropped;
+        merge_spans() resolves the remaining overlaps as usual.
+        """
+        from .detectors.metadata import DetectionMetadata
+
+        chunks = _split_chunks(text, DETECT_CHUNK_SIZE, DETECT_CHUNK_OVERLAP)
+        workers = min(self.config.max_workers, len(chunks))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            outcomes = list(executor.map(
+                lambda chunk: self.orchestrator.detect_with_metadata(chunk[1]),
+                chunks,
+            ))
+
+        spans: Dict[Tuple[int, int, str], Span] = {}
+        metadata = DetectionMetadata()
+        for (offset, _), (chunk_spans, chunk_metadata) in zip(chunks, outcomes):
+            for span in chunk_spans:
+                if offset:
+                    span = dataclasses.replace(
+                        span, start=span.start + offset, end=span.end + offset,
+                    )
+                spans.setdefault((span.start, span.end, span.entity_type), span)
+            metadata.detectors_run.extend(chunk_metadata.detectors_run)
+            metadata.detectors_failed.extend(chunk_metadata.detectors_failed)
+            metadata.detectors_timed_out.extend(chunk_metadata.detectors_timed_out)
+            metadata.warnings.extend(chunk_metadata.warnings)
+            metadata.degraded |= chunk_metadata.degraded
+            metadata.structured_extractor_failed |= chunk_metadata.structured_extractor_failed
+            metadata.runaway_threads += chunk_metadata.runaway_threads
+
+        # Each chunk ran the same detectors: report every name once
+        metadata.detectors_run = list(dict.fromkeys(metadata.detectors_run))
+        metadata.detectors_failed = list(dict.fromkeys(metadata.detectors_failed))
+        metadata.detectors_timed_out = list(dict.fromkeys(metadata.detectors_timed_out))
+        metadata.all_detectors_failed = all(m.all_detectors_failed for _, m in outcomes)
+        return list(spans.values()), metadata
+
     def detect_file(
         self,
         path: Union[str, Path],
@@ -214,6 +265,29 @@ class Detector:
         return result
 
 
+def _split_chunks(text: str, size: int, overlap: int) -> List[Tuple[int, str]]:
+    """
+    Split text into (offset, chunk) pairs of about size characters.
+
+    Each chunk after the first starts overlap characters before the end of
+    the previous one. Chunk ends are moved back to just after a newline in
+    the second half of the chunk, if there is one, so that seams fall
+    between lines.
+    """
+    chunks = []
+    start = 0
+    while start < len(text):
+        end = min(start + size, len(text))
+        if end < len(text):
+            newline = text.rfind("\n", start + size // 2, end)
+            if newline != -1:
+                end = newline + 1
+        offset = max(start - overlap, 0)
+        chunks.append((offset, text[offset:end]))
+        start = end
+    return chunks
+
+
 def _make_config(**kwargs) -> Config:
     """Create Config with optional overrides."""
     config = Config()
@@ -224,6 +298,42 @@ def _make_config(**kwargs) -> Config:
     return config
 
 
+# Detectors shared by the convenience functions, keyed by config overrides
+_shared_detectors: Dict[Tuple[Tuple[str, Any], ...], Detector] = {}
+_MAX_SHARED_DETECTORS = 8
+
+
+def _get_detector(context: Optional["Context"], config_kwargs: Dict[str, Any]) -> Detector:
+    """
+    Detector for the convenience functions.
+
+    Without a context, detectors are shared per set of overrides, so repeated
+    calls (one per file in a scan) don't rebuild the detector orchestrator.
+    A context asks for isolated resources, so it always gets a fresh one.
+    """
+    if context is not None:
+        return Detector(config=_make_config(**config_kwargs), context=context)
+
+    from ...context import get_default_context
+    default_context = get_default_context(warn=False)
+
+    key = tuple(sorted(config_kwargs.items()))
+    try:
+        detector = _shared_detectors.get(key)
+    except TypeError:
+        # Unhashable override value (e.g. a set): don't share
+        return Detector(config=_make_config(**config_kwargs), context=default_context)
+
+    # The default context is replaced on reset; a detector bound to the
+    # previous one would run on a closed thread pool
+    if detector is None or detector._context is not default_context:
+        if len(_shared_detectors) >= _MAX_SHARED_DETECTORS:
+            _shared_detectors.clear()
+        detector = Detector(config=_make_config(**config_kwargs), context=default_context)
+        _shared_detectors[key] = detector
+    return detector
+
+
 def detect(
     text: str,
     context: Optional["Context"] = None,
@@ -251,7 +361,7 @@ def detect(
         >>> ctx = Context()
         >>> result = detect("SSN: 123-45-6789", context=ctx)
     """
-    return Detector(config=_make_config(**config_kwargs), context=context).detect(text)
+    return _get_detector(context, config_kwargs).detect(text)
 
 
 def detect_file(
@@ -270,4 +380,4 @@ def detect_file(
     Returns:
         DetectionResult with detected spans.
     """
-    return Detector(config=_make_config(**config_kwargs), context=context).detect_file(path)
+    return _get_detector(context, config_kwargs).detect_file(path)
@@ -132,6 +132,10 @@ class Config:
 
     # Parallel detection
     max_workers: int = MAX_PAGE_WORKERS  # Max threads for parallel detection
+    # Text longer than this is split into chunks detected concurrently
+    # (0 = off). Opt-in: detectors that read surrounding context can miss
+    # entities that straddle a chunk seam.
+    chunk_threshold: int = 0
 
     # Size limits (prevent OOM from adversarial input)
     max_text_size: int = MAX_TEXT_LENGTH * 10  # Default 10MB, based on MAX_TEXT_LENGTH
@@ -171,6 +175,9 @@ class Config:
         if self.max_workers < 1:
             raise ValueError("max_workers must be at least 1")
 
+        if self.chunk_threshold < 0:
+            raise ValueError("chunk_threshold cannot be negative")
+
         if self.max_text_size < 1:
             raise ValueError("max_text_size must be at least 1")
 
@@ -230,4 +237,10 @@ class Config:
             except ValueError:
                 logger.warning(f"Invalid OPENLABELS_SCANNER_MAX_WORKERS='{env_workers}', using default")
 
+        if env_chunk := os.environ.get("OPENLABELS_SCANNER_CHUNK_THRESHOLD"):
+            try:
+                config.chunk_threshold = int(env_chunk)
+            except ValueError:
+                logger.warning(f"Invalid OPENLABELS_SCANNER_CHUNK_THRESHOLD='{env_chunk}', using default")
+
         return config
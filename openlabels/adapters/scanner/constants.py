@@ -37,6 +37,8 @@ __all__ = [
     "MAX_FILENAME_LENGTH",
     # Detection
     "MAX_DETECTOR_WORKERS",
+    "DETECT_CHUNK_SIZE",
+    "DETECT_CHUNK_OVERLAP",
     "MIN_NAME_LENGTH",
     "MAX_STRUCTURED_VALUE_LENGTH",
     "BERT_MAX_LENGTH",
@@ -104,6 +106,8 @@ MAX_FILENAME_LENGTH = 255
 
 # --- DETECTION ---
 MAX_DETECTOR_WORKERS = 8
+DETECT_CHUNK_SIZE = 128_000  # Chars per chunk when large text is split
+DETECT_CHUNK_OVERLAP = 256  # Chars shared by neighbouring chunks
 MIN_NAME_LENGTH = 3  # "Al" valid, "K." not
 MAX_STRUCTURED_VALUE_LENGTH = 80
 BERT_MAX_LENGTH = 512  # BERT tokenizer sequence length limit
@@ -228,22 +228,23 @@ class AsyncScanner:
             detection = scanner_detect(file_path)
             entities = detection.entity_counts
 
-            # Extract spans with context
-            spans_data = []
+            # Extract spans with context, built in one comprehension since
+            # a dense file can carry thousands of spans. Slicing clamps the
+            # context end to the text, so only the start needs max().
             text = detection.text
-            for span in detection.spans:
-                ctx_start = max(0, span.start - 50)
-                ctx_end = min(len(text), span.end + 50)
-                spans_data.append({
+            spans_data = [
+                {
                     "start": span.start,
                     "end": span.end,
                     "text": span.text,
                     "entity_type": span.entity_type,
                     "confidence": span.confidence,
                     "detector": span.detector,
-                    "context_before": text[ctx_start:span.start],
-                    "context_after": text[span.end:ctx_end],
-                })
+                    "context_before": text[max(0, span.start - 50):span.start],
+                    "context_after": text[span.end:span.end + 50],
+                }
+                for span in detection.spans
+            ]
 
             # Score the file
             score_result = client.score_file(file_path)
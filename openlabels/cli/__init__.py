@@ -11,8 +11,32 @@ Usage:
     openlabels heatmap <path>                  # Visual risk heatmap
 """
 
+import importlib
+from typing import TYPE_CHECKING
+
 from .main import main
-from .filter import Filter, parse_filter, matches_filter, FilterBuilder
+
+if TYPE_CHECKING:
+    from .filter import Filter, parse_filter, matches_filter, FilterBuilder
+
+# The filter language pulls in the scanner package; load it on first use
+# (PEP 562) so CLI startup doesn't pay for it, as in openlabels/__init__.py
+_LAZY_EXPORTS = {
+    "Filter": ".filter",
+    "parse_filter": ".filter",
+    "matches_filter": ".filter",
+    "FilterBuilder": ".filter",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 # CLI display constants
 MAX_PREVIEW_RESULTS = 20  # Max results to show in preview/dry-run mode
@@ -17,22 +17,53 @@ Commands:
     serve       Start the scanner API server
 """
 
-from .scan import add_scan_parser, cmd_scan
-from .read import add_read_parser, cmd_read
-from .find import add_find_parser, cmd_find
-from .quarantine import add_quarantine_parser, cmd_quarantine
-from .tag import add_tag_parser, cmd_tag
-from .encrypt import add_encrypt_parser, cmd_encrypt
-from .restrict import add_restrict_parser, cmd_restrict
-from .report import add_report_parser, cmd_report
-from .heatmap import add_heatmap_parser, cmd_heatmap
-from .shell import add_shell_parser, cmd_shell
-from .health import add_health_parser, cmd_health
-from .gui import add_gui_parser, cmd_gui
-from .inventory import add_inventory_parser, cmd_inventory
-from .config import add_config_parser, cmd_config
-from .export import add_export_parser, cmd_export
-from .serve import add_serve_parser, cmd_serve
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .scan import add_scan_parser, cmd_scan
+    from .read import add_read_parser, cmd_read
+    from .find import add_find_parser, cmd_find
+    from .quarantine import add_quarantine_parser, cmd_quarantine
+    from .tag import add_tag_parser, cmd_tag
+    from .encrypt import add_encrypt_parser, cmd_encrypt
+    from .restrict import add_restrict_parser, cmd_restrict
+    from .report import add_report_parser, cmd_report
+    from .heatmap import add_heatmap_parser, cmd_heatmap
+    from .shell import add_shell_parser, cmd_shell
+    from .health import add_health_parser, cmd_health
+    from .gui import add_gui_parser, cmd_gui
+    from .inventory import add_inventory_parser, cmd_inventory
+    from .config import add_config_parser, cmd_config
+    from .export import add_export_parser, cmd_export
+    from .serve import add_serve_parser, cmd_serve
+
+# Command modules, imported on first access (PEP 562) so running one
+# command doesn't load every other command's dependencies
+COMMAND_MODULES = (
+    "scan", "read", "find", "quarantine", "tag", "encrypt", "restrict", "report",
+    "heatmap", "shell", "health", "gui", "inventory", "config", "export", "serve",
+)
+
+_LAZY_EXPORTS = {
+    f"{prefix}{command}{suffix}": f".{command}"
+    for command in COMMAND_MODULES
+    for prefix, suffix in (("add_", "_parser"), ("cmd_", ""))
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     # Parsers
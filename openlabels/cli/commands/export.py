@@ -17,7 +17,7 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime
 
 from openlabels import Client
-from openlabels.cli.commands.scan import scan_directory, scan_file
+from openlabels.cli.commands.scan import collect_files, scan_directory_parallel, scan_file
 from openlabels.cli.output import echo, error, info, progress, summary_panel
 from openlabels.logging_config import get_logger
 
@@ -86,8 +86,7 @@ def compute_summary(results: List[Dict[str, Any]]) -> Dict[str, Any]:
     tier_counts = Counter(r.get("tier", "UNKNOWN") for r in results)
     entity_counts: Counter = Counter()
     for r in results:
-        for etype, count in r.get("entities", {}).items():
-            entity_counts[etype] += count
+        entity_counts.update(r.get("entities", {}))
 
     scores = [r.get("score", 0) for r in results]
 
@@ -130,27 +129,27 @@ def cmd_export(args) -> int:
         result = scan_file(path, client, args.exposure)
         results.append(result.to_dict())
     else:
-        # Count files for progress
-        if args.recursive:
-            all_files = list(path.rglob("*"))
-        else:
-            all_files = list(path.glob("*"))
-        all_files = [f for f in all_files if is_regular_file(f)]
-        if extensions:
-            exts = {e.lower().lstrip(".") for e in extensions}
-            all_files = [f for f in all_files if f.suffix.lower().lstrip(".") in exts]
+        # One walk both counts files for progress and lists them to scan
+        all_files = collect_files(path, args.recursive, extensions)
+
+        scanned_at = {}
+
+        def on_result(result):
+            scanned_at[result.path] = datetime.now().isoformat()
+            p.advance()
 
         with progress("Scanning files", total=len(all_files)) as p:
-            for result in scan_directory(
-                path, client,
-                recursive=args.recursive,
+            scan_results = scan_directory_parallel(
+                all_files,
                 exposure=args.exposure,
-                extensions=extensions,
-            ):
-                result_dict = result.to_dict()
-                result_dict["scanned_at"] = datetime.now().isoformat()
-                results.append(result_dict)
-                p.advance()
+                callback=on_result,
+                ordered=True,
+            )
+
+        for result in scan_results:
+            result_dict = result.to_dict()
+            result_dict["scanned_at"] = scanned_at[result.path]
+            results.append(result_dict)
 
     if not results:
         echo("No files found to export.")
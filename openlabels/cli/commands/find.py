@@ -11,13 +11,16 @@ Usage:
 
 import json
 import stat as stat_module
+import sys
 from pathlib import Path
 from typing import Iterator, Optional, Dict, Any, List
 
 from openlabels import Client
 from openlabels.cli.filter import Filter, parse_filter
-from openlabels.cli.commands.scan import scan_file, scan_directory, ScanResult
-from openlabels.cli.output import echo, error, dim, progress
+from openlabels.cli.commands.scan import (
+    OUTPUT_BLOCK_SIZE, scan_file, scan_directory, to_jsonl, ScanResult,
+)
+from openlabels.cli.output import echo, error, format_entity_counts, is_terminal
 from openlabels.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -78,12 +81,10 @@ def format_find_result(result: ScanResult, format: str = "text") -> str:
         return json.dumps(result.to_dict(), indent=2)
 
     if format == "jsonl":
-        return json.dumps(result.to_dict())
+        return to_jsonl(result)
 
     # Text format - concise output
-    entities_str = ", ".join(
-        f"{k}({v})" for k, v in sorted(result.entities.items())
-    ) if result.entities else "-"
+    entities_str = format_entity_counts(result.entities, sort=True)
 
     return f"{result.path}\tScore: {result.score}\t{entities_str}"
 
@@ -105,6 +106,16 @@ def cmd_find(args) -> int:
 
     extensions = args.extensions.split(",") if args.extensions else None
     match_count = 0
+    write = sys.stdout.write
+    # A terminal shows each match as it lands; a pipe gets them in blocks,
+    # since every console print is flushed on its own
+    block_size = 1 if is_terminal() else OUTPUT_BLOCK_SIZE
+    pending: List[str] = []
+
+    def flush_pending():
+        """Print buffered text matches in a single write."""
+        echo("\n".join(pending))
+        pending.clear()
 
     try:
         for result in find_matching(
@@ -116,12 +127,20 @@ def cmd_find(args) -> int:
             extensions=extensions,
         ):
             match_count += 1
-            echo(format_find_result(result, args.format))
+            if args.format == "text":
+                pending.append(format_find_result(result, args.format))
+                if len(pending) >= block_size:
+                    flush_pending()
+            else:
+                # JSON goes straight to stdout: Rich would parse it for
+                # markup and wrap long lines, corrupting JSONL
+                write(format_find_result(result, args.format))
+                write("\n")
 
             # Limit output
             if args.limit and match_count >= args.limit:
                 if args.format == "text":
-                    dim(f"\n... (limited to {args.limit} results)")
+                    pending.append(f"[dim]\n... (limited to {args.limit} results)[/dim]")
                 break
 
     except ValueError as e:
@@ -129,6 +148,10 @@ def cmd_find(args) -> int:
         logger.warning(f"Filter error: {e}")
         return 1
 
+    finally:
+        if pending:
+            flush_pending()
+
     # Print summary
     if args.format == "text" and not args.quiet:
         echo("")
@@ -9,11 +9,10 @@ Usage:
     openlabels health --check detector  # Run specific check
 """
 
-import json
 from typing import Optional
 
 from openlabels.health import HealthChecker, CheckStatus
-from openlabels.cli.output import echo, error, warn, success, dim, console
+from openlabels.cli.output import echo, error, warn, success, dim, console, write_json
 from openlabels.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -48,7 +47,7 @@ def cmd_health(args) -> int:
 
     # JSON output
     if args.json:
-        echo(json.dumps(report.to_dict(), indent=2))
+        write_json(report.to_dict())
         return 0 if report.healthy else 1
 
     # Rich output
@@ -9,12 +9,15 @@ Usage:
 """
 
 import stat as stat_module
+from collections import Counter
 from pathlib import Path
 from typing import Dict, List, Optional
 from dataclasses import dataclass, field
 
 from openlabels import Client
-from openlabels.cli.commands.scan import scan_file, ScanResult
+from openlabels.cli.commands.scan import (
+    extension_suffixes, iter_regular_files, scan_file, ScanResult,
+)
 from openlabels.cli.output import echo, error, info, progress, console
 from openlabels.logging_config import get_logger
 from openlabels.core.scorer import TIER_THRESHOLDS
@@ -95,34 +98,24 @@ def build_tree(
         # At max depth, scan all files in this directory recursively
         total_score = 0
         file_count = 0
-        all_entities: Dict[str, int] = {}
-
-        for file_path in path.rglob("*"):
-            try:
-                child_st = file_path.lstat()  # TOCTOU-001
-                if not stat_module.S_ISREG(child_st.st_mode):
-                    continue
-            except OSError as e:
-                # Log file access errors at DEBUG level
-                logger.debug(f"Could not stat file in heatmap scan: {file_path}: {e}")
-                continue
-
-            if extensions:
-                if file_path.suffix.lower().lstrip(".") not in extensions:
-                    continue
+        all_entities: Counter = Counter()
 
+        for file_path in iter_regular_files(path, recursive=True, extensions=extensions):
             scan_result = scan_file(file_path, client, exposure)
             total_score += scan_result.score
             file_count += 1
 
-            for etype, count in scan_result.entities.items():
-                all_entities[etype] = all_entities.get(etype, 0) + count
+            all_entities.update(scan_result.entities)
 
         node.score = total_score // file_count if file_count else 0
         node.file_count = file_count
         node.entity_counts = all_entities
         return node
 
+    # Normalized once per directory, matched against names without a Path
+    # suffix parse per child
+    suffixes = extension_suffixes(extensions)
+
     # Recurse into children
     try:
         def sort_key(p):  # TOCTOU-001: use lstat
@@ -149,10 +142,9 @@ def build_tree(
             logger.debug(f"Could not stat child path in heatmap: {child_path}: {e}")
             continue
 
-        if child_is_file:
-            if extensions:
-                if child_path.suffix.lower().lstrip(".") not in extensions:
-                    continue
+        if child_is_file and suffixes is not None:
+            if not child_path.name.lower().endswith(suffixes):
+                continue
 
         child_node = build_tree(
             child_path,
@@ -166,9 +158,10 @@ def build_tree(
 
     # Aggregate stats
     node.file_count = sum(c.file_count for c in node.children)
+    entity_counts: Counter = Counter()
     for child in node.children:
-        for etype, count in child.entity_counts.items():
-            node.entity_counts[etype] = node.entity_counts.get(etype, 0) + count
+        entity_counts.update(child.entity_counts)
+    node.entity_counts = entity_counts
 
     return node
 
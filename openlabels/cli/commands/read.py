@@ -9,13 +9,12 @@ Usage:
     openlabels read customers.xlsx --verify
 """
 
-import json
 from datetime import datetime
 from pathlib import Path
 
 from openlabels.output.embed import read_embedded_label, supports_embedded_labels
 from openlabels.core.labels import compute_content_hash_file
-from openlabels.cli.output import echo, error, success, console
+from openlabels.cli.output import echo, error, success, console, write_json
 from openlabels.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -46,7 +45,7 @@ def cmd_read(args) -> int:
     # Check if file type supports embedded labels
     if not supports_embedded_labels(path):
         if args.format == "json":
-            echo(json.dumps({"error": "unsupported_format", "path": str(path)}))
+            write_json({"error": "unsupported_format", "path": str(path)}, indent=None)
         else:
             error(f"File type '{path.suffix}' does not support embedded labels")
             echo("")
@@ -58,7 +57,7 @@ def cmd_read(args) -> int:
 
     if label_set is None:
         if args.format == "json":
-            echo(json.dumps({"error": "no_label", "path": str(path)}))
+            write_json({"error": "no_label", "path": str(path)}, indent=None)
         else:
             echo(f"No embedded label found in: {path.name}")
             echo("")
@@ -82,7 +81,7 @@ def cmd_read(args) -> int:
         if args.verify and hash_match is not None:
             output["verified"] = hash_match
             output["current_hash"] = current_hash if hash_match is False else label_set.content_hash
-        echo(json.dumps(output, indent=2))
+        write_json(output)
     else:
         _print_label_text(path, label_set, hash_match, args.verify)
 
@@ -113,11 +112,15 @@ def _print_label_text(path: Path, label_set, hash_match, verify: bool):
 
     # Labels (entities)
     if label_set.labels:
-        console.print("  [bold]Detected Entities:[/bold]")
-        for label in label_set.labels:
-            count_str = f" x{label.count}" if label.count > 1 else ""
-            conf_str = f"{label.confidence:.0%}"
-            console.print(f"    - {label.type}{count_str} ({conf_str}, {label.detector})")
+        # One print for the whole block: each console print is a flush
+        console.print("\n".join([
+            "  [bold]Detected Entities:[/bold]",
+            *[
+                f"    - {label.type}{f' x{label.count}' if label.count > 1 else ''}"
+                f" ({label.confidence:.0%}, {label.detector})"
+                for label in label_set.labels
+            ],
+        ]))
     else:
         console.print("  [dim]No sensitive entities detected[/dim]")
 
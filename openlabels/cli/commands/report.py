@@ -18,8 +18,10 @@ from datetime import datetime
 from collections import Counter
 
 from openlabels import Client
-from openlabels.cli.commands.scan import scan_directory, scan_file, ScanResult
-from openlabels.cli.output import echo, error, info, progress
+from openlabels.cli.commands.scan import (
+    collect_files, scan_directory_parallel, scan_file, ScanResult,
+)
+from openlabels.cli.output import echo, error, format_entity_counts, info, progress
 from openlabels.logging_config import get_logger
 from openlabels.core.scorer import TIER_THRESHOLDS
 
@@ -37,11 +39,12 @@ def generate_summary(results: List[ScanResult]) -> Dict[str, Any]:
             "score_distribution": {},
         }
 
+    # Read each result once; the statistics below work on these lists
+    scores = [r.score for r in results]
     tier_counts = Counter(r.tier for r in results)
     entity_counts: Counter = Counter()
     for r in results:
-        for etype, count in r.entities.items():
-            entity_counts[etype] += count
+        entity_counts.update(r.entities)
 
     # Use actual tier thresholds from scorer for consistent display
     crit = TIER_THRESHOLDS['critical']
@@ -49,19 +52,36 @@ def generate_summary(results: List[ScanResult]) -> Dict[str, Any]:
     med = TIER_THRESHOLDS['medium']
     low = TIER_THRESHOLDS['low']
 
-    score_dist = {
-        f"critical ({crit}-100)": sum(1 for r in results if r.score >= crit),
-        f"high ({high}-{crit-1})": sum(1 for r in results if high <= r.score < crit),
-        f"medium ({med}-{high-1})": sum(1 for r in results if med <= r.score < high),
-        f"low ({low}-{med-1})": sum(1 for r in results if low <= r.score < med),
-        f"minimal (0-{low-1})": sum(1 for r in results if r.score < low),
-    }
+    # Bucket scores in a single pass rather than one scan per bucket
+    buckets = [0, 0, 0, 0, 0]
+    for score in scores:
+        if score >= crit:
+            buckets[0] += 1
+        elif score >= high:
+            buckets[1] += 1
+        elif score >= med:
+            buckets[2] += 1
+        elif score >= low:
+            buckets[3] += 1
+        else:
+            buckets[4] += 1
+
+    score_dist = dict(zip(
+        [
+            f"critical ({crit}-100)",
+            f"high ({high}-{crit-1})",
+            f"medium ({med}-{high-1})",
+            f"low ({low}-{med-1})",
+            f"minimal (0-{low-1})",
+        ],
+        buckets,
+    ))
 
     return {
         "total_files": len(results),
-        "files_at_risk": sum(1 for r in results if r.score > 0),
-        "max_score": max(r.score for r in results) if results else 0,
-        "avg_score": sum(r.score for r in results) / len(results) if results else 0,
+        "files_at_risk": sum(1 for s in scores if s > 0),
+        "max_score": max(scores),
+        "avg_score": sum(scores) / len(scores),
         "by_tier": dict(tier_counts),
         "by_entity": dict(entity_counts.most_common(20)),
         "score_distribution": score_dist,
@@ -138,7 +158,7 @@ def results_to_html(results: List[ScanResult], summary: Dict[str, Any]) -> str:
 
     rows = []
     for r in sorted_results:
-        entities = ", ".join(f"{k}({v})" for k, v in r.entities.items()) if r.entities else "-"
+        entities = format_entity_counts(r.entities)
         color = get_color(r.tier)
         rows.append(f"""
         <tr>
@@ -308,25 +328,16 @@ def cmd_report(args) -> int:
         if not args.quiet:
             info(f"Scanning {path}...")
 
-        # Count files for progress
-        if args.recursive:
-            all_files = list(path.rglob("*"))
-        else:
-            all_files = list(path.glob("*"))
-        all_files = [f for f in all_files if is_regular_file(f)]
-        if extensions:
-            exts = {e.lower().lstrip(".") for e in extensions}
-            all_files = [f for f in all_files if f.suffix.lower().lstrip(".") in exts]
+        # One walk both counts files for progress and lists them to scan
+        all_files = collect_files(path, args.recursive, extensions)
 
         with progress("Scanning files", total=len(all_files)) as p:
-            for result in scan_directory(
-                path, client,
-                recursive=args.recursive,
+            results = scan_directory_parallel(
+                all_files,
                 exposure=args.exposure,
-                extensions=extensions,
-            ):
-                results.append(result)
-                p.advance()
+                callback=lambda _: p.advance(),
+                ordered=True,
+            )
 
     if not args.quiet:
         info(f"Scanned {len(results)} files, generating report...")
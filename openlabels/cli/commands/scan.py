@@ -9,29 +9,85 @@ Usage:
     openlabels scan ./data --recursive
     openlabels scan /path/to/file.csv
     openlabels scan ./data -r --workers 8
+    openlabels scan ./data -r --processes
+    find /data -name '*.csv' | openlabels scan --files-from -
 """
 
 import argparse
+import collections
+import functools
+import itertools
 import json
+import multiprocessing
 import os
 import stat as stat_module
+import sys
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
 from pathlib import Path
-from typing import Iterator, Optional, Dict, Any, List
+from typing import Iterable, Iterator, Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass
 
 from openlabels import Client
+from openlabels.core.constants import DATACLASS_SLOTS
 from openlabels.core.scorer import ScoringResult
-from openlabels.cli.output import echo, error, success, dim, progress, divider, console
+from openlabels.cli.output import (
+    divider, dim, echo, error, format_entity_counts, is_terminal, output_block,
+    progress, success, write_json,
+)
 from openlabels.logging_config import get_logger, get_audit_logger
 
+# Optional orjson for faster JSONL output
+_ORJSON_AVAILABLE = False
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None  # type: ignore
+
 logger = get_logger(__name__)
 audit = get_audit_logger()
 
 # Default number of parallel workers
 DEFAULT_WORKERS = min(os.cpu_count() or 4, 8)
 
+# Default worker processes: detection is CPU-bound, so one per core
+DEFAULT_PROCESS_WORKERS = os.cpu_count() or 4
+
+# Default thread workers for paths on network filesystems, where scanning
+# mostly waits on I/O and more threads than cores keeps the link busy
+DEFAULT_NETWORK_WORKERS = 32
+
+# Filesystem types (as in /proc/self/mounts) treated as network storage
+NETWORK_FS_TYPES = frozenset({
+    "nfs", "nfs4", "cifs", "smb3", "smbfs", "afs", "9p",
+    "ceph", "glusterfs", "lustre", "fuse.sshfs", "fuse.s3fs",
+})
+
+_PROC_MOUNTS = "/proc/self/mounts"
+
+# Directory listings kept in flight while collecting files. Listing blocks
+# on each directory, so overlapping many hides latency on network shares.
+DEFAULT_WALK_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Files ahead of the one being scanned that the kernel is asked to start
+# reading, so sequential scans overlap read latency with detection
+READAHEAD_DEPTH = 8
+
+# Text results rendered per write when stdout is not a terminal, so a
+# pipe sees one write per block rather than one per scanned file.
+OUTPUT_BLOCK_SIZE = 256
+
+
+# One encoder for every JSONL record, with compact separators
+_JSONL_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
 
 # Risk tier to rich color mapping
 TIER_COLORS = {
@@ -43,7 +99,8 @@ TIER_COLORS = {
 }
 
 
-@dataclass
+# Slotted where supported: large scans hold one of these per file
+@dataclass(**DATACLASS_SLOTS)
 class ScanResult:
     """Result of scanning a single file."""
     path: str
@@ -53,6 +110,11 @@ class ScanResult:
     exposure: str
     error: Optional[str] = None
 
+    @property
+    def is_clean(self) -> bool:
+        """True if the file was scanned without error and nothing was found."""
+        return not self.entities and self.error is None
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -65,6 +127,18 @@ class ScanResult:
         }
 
 
+_scanner_module = None
+
+
+def _scanner():
+    """The scanner package, imported on first use since it is slow to load."""
+    global _scanner_module
+    if _scanner_module is None:
+        from openlabels.adapters import scanner
+        _scanner_module = scanner
+    return _scanner_module
+
+
 def scan_file(
     path: Path,
     client: Client,
@@ -73,9 +147,7 @@ def scan_file(
     """Scan a single file and return result."""
     try:
         # First detect to get entity counts
-        from openlabels.adapters.scanner import detect_file as scanner_detect
-
-        detection = scanner_detect(path)
+        detection = _scanner().detect_file(path)
         entities = detection.entity_counts
 
         # Then score
@@ -100,31 +172,204 @@ def scan_file(
         )
 
 
+def _mount_fs_type(path: str) -> Optional[str]:
+    """Filesystem type of the mount containing path, if /proc/self/mounts exists."""
+    try:
+        with open(_PROC_MOUNTS, encoding="utf-8") as f:
+            mounts = [line.split() for line in f]
+    except OSError:
+        return None
+
+    best, fs_type = "", None
+    for fields in mounts:
+        if len(fields) < 3:
+            continue
+        # Mount points escape spaces and tabs as octal \040 and \011
+        mount_point = fields[1].replace("\\040", " ").replace("\\011", "\t")
+        prefix = mount_point.rstrip("/") + "/"
+        if (path == mount_point or path.startswith(prefix)) and len(mount_point) >= len(best):
+            best, fs_type = mount_point, fields[2]
+    return fs_type
+
+
+def is_network_path(path: Path) -> bool:
+    """Best-effort check for a path on a network share (UNC or NFS/SMB mount)."""
+    path_str = str(path)
+    if path_str.startswith(("\\\\", "//")):
+        return True
+    try:
+        resolved = str(path.resolve())
+    except OSError:
+        return False
+    return _mount_fs_type(resolved) in NETWORK_FS_TYPES
+
+
+def extension_suffixes(extensions: Optional[List[str]]) -> Optional[Tuple[str, ...]]:
+    """Normalize extensions ("txt", ".CSV") to lowercase ".ext" suffixes for endswith()."""
+    if not extensions:
+        return None
+    return tuple({
+        "." + ext for ext in (e.strip().lower().lstrip(".") for e in extensions) if ext
+    })
+
+
+_SIZE_UNITS = {"": 1, "K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+
+
+def parse_size(text: str) -> int:
+    """Parse a byte count with an optional K/M/G suffix (e.g. "512", "10M")."""
+    value = text.strip().upper()
+    if value.endswith("B"):
+        value = value[:-1]
+    unit = value[-1:] if value[-1:] in _SIZE_UNITS else ""
+    number = value[:-1] if unit else value
+    try:
+        size = int(float(number) * _SIZE_UNITS[unit])
+    except (ValueError, OverflowError):
+        raise argparse.ArgumentTypeError(f"invalid size: {text!r}") from None
+    if size < 0:
+        raise argparse.ArgumentTypeError(f"size must not be negative: {text!r}")
+    return size
+
+
+def _list_directory(
+    directory: str,
+    suffixes: Optional[Tuple[str, ...]] = None,
+    min_size: int = 0,
+    max_size: Optional[int] = None,
+) -> Tuple[List[str], List[str]]:
+    """
+    List one directory, returning (regular file paths, subdirectory paths).
+
+    If suffixes is given, only files whose lowercased name ends with one of
+    them are returned. Files outside [min_size, max_size] bytes are dropped.
+    """
+    check_size = min_size > 0 or max_size is not None
+    files: List[str] = []
+    subdirs: List[str] = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                # TOCTOU-001: never follow symlinks. DirEntry answers these
+                # from the directory listing, without an lstat per entry.
+                try:
+                    if entry.is_file(follow_symlinks=False):
+                        if suffixes is not None and not entry.name.lower().endswith(suffixes):
+                            continue
+                        if check_size:
+                            # Cached on the entry (free on Windows), and
+                            # cheaper than opening a file we would reject
+                            size = entry.stat(follow_symlinks=False).st_size
+                            if size < min_size or (max_size is not None and size > max_size):
+                                continue
+                        files.append(entry.path)
+                    elif entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                except OSError:
+                    continue
+    except OSError as e:
+        logger.debug(f"Cannot list directory {directory}: {e}")
+    return files, subdirs
+
+
+def iter_regular_files(
+    path: Path,
+    recursive: bool = False,
+    extensions: Optional[List[str]] = None,
+    max_workers: int = DEFAULT_WALK_WORKERS,
+    min_size: int = 0,
+    max_size: Optional[int] = None,
+) -> Iterator[Path]:
+    """
+    Yield the regular files under a directory, in no particular order.
+
+    Symlinks are skipped. Recursive walks list directories concurrently on
+    a thread pool, yielding each directory's files as its listing completes.
+
+    Args:
+        path: Directory to walk
+        recursive: Descend into subdirectories
+        extensions: Optional extensions to keep (with or without the dot)
+        max_workers: Number of directories listed concurrently
+        min_size: Skip files smaller than this many bytes
+        max_size: Skip files larger than this many bytes
+    """
+    # Filtering on the DirEntry means rejected files never become Paths
+    list_directory = functools.partial(
+        _list_directory,
+        suffixes=extension_suffixes(extensions),
+        min_size=min_size,
+        max_size=max_size,
+    )
+
+    if not recursive:
+        files, _ = list_directory(str(path))
+        yield from map(Path, files)
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {executor.submit(list_directory, str(path))}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                files, subdirs = future.result()
+                pending.update(executor.submit(list_directory, d) for d in subdirs)
+                yield from map(Path, files)
+
+
 def collect_files(
     path: Path,
     recursive: bool = False,
     extensions: Optional[List[str]] = None,
+    max_workers: int = DEFAULT_WALK_WORKERS,
+    min_size: int = 0,
+    max_size: Optional[int] = None,
 ) -> List[Path]:
     """Collect all files to scan from a directory."""
-    if recursive:
-        files = list(path.rglob("*"))
-    else:
-        files = list(path.glob("*"))
+    return sorted(iter_regular_files(
+        path, recursive, extensions, max_workers, min_size=min_size, max_size=max_size,
+    ))
 
-    def is_regular_file(p):  # TOCTOU-001: use lstat
-        try:
-            return stat_module.S_ISREG(p.lstat().st_mode)
-        except OSError:
-            return False
 
-    files = [f for f in files if is_regular_file(f)]
+def _advise_willneed(path: Path) -> None:
+    """Ask the kernel to start reading a file into the page cache."""
+    try:
+        # Non-blocking so a FIFO in a file list can't stall the open
+        fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK | os.O_NOFOLLOW)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
 
-    # Apply extension filter
-    if extensions:
-        exts = {e.lower().lstrip(".") for e in extensions}
-        files = [f for f in files if f.suffix.lower().lstrip(".") in exts]
+def iter_readahead(files: Iterable[Path], depth: int = READAHEAD_DEPTH) -> Iterator[Path]:
+    """
+    Yield files in order, keeping reads for the next few in flight.
+
+    Each file is advised to the kernel (POSIX_FADV_WILLNEED) depth files
+    before it is yielded. The kernel reads it in the background while the
+    caller is still detecting on earlier files, so a sequential scan no
+    longer blocks on every read. Platforms without posix_fadvise get the
+    files unchanged.
+    """
+    if depth <= 0 or not hasattr(os, "posix_fadvise"):
+        yield from files
+        return
 
-    return sorted(files)
+    files = iter(files)
+    window: "collections.deque[Path]" = collections.deque()
+    for file_path in itertools.islice(files, depth):
+        _advise_willneed(file_path)
+        window.append(file_path)
+    for file_path in files:
+        _advise_willneed(file_path)
+        window.append(file_path)
+        yield window.popleft()
+    yield from window
 
 
 def scan_directory(
@@ -134,9 +379,14 @@ def scan_directory(
     exposure: str = "PRIVATE",
     extensions: Optional[List[str]] = None,
 ) -> Iterator[ScanResult]:
-    """Scan all files in a directory (sequential)."""
-    files = collect_files(path, recursive, extensions)
-    for file_path in files:
+    """
+    Scan all files in a directory (sequential).
+
+    Files are scanned as the walk finds them rather than after collecting
+    the whole tree, so the first result arrives once the read-ahead window
+    is filled and memory doesn't grow with the tree. Results come in walk order, not sorted.
+    """
+    for file_path in iter_readahead(iter_regular_files(path, recursive, extensions)):
         yield scan_file(file_path, client, exposure)
 
 
@@ -145,6 +395,7 @@ def scan_directory_parallel(
     exposure: str = "PRIVATE",
     max_workers: int = DEFAULT_WORKERS,
     callback=None,
+    ordered: bool = False,
 ) -> List[ScanResult]:
     """Scan files in parallel using ThreadPoolExecutor.
 
@@ -153,6 +404,7 @@ def scan_directory_parallel(
         exposure: Exposure level for scoring
         max_workers: Number of parallel workers
         callback: Optional callback(result) called for each completed file
+        ordered: Return results in input order rather than completion order
 
     Returns:
         List of ScanResult objects
@@ -201,35 +453,187 @@ def scan_directory_parallel(
             if callback:
                 callback(result)
 
+    if ordered:
+        rank = {str(fp): i for i, fp in enumerate(files)}
+        results.sort(key=lambda r: rank[r.path])
     return results
 
 
-def format_scan_result_rich(result: ScanResult) -> None:
-    """Print a scan result using rich formatting."""
+# Per-process Client for process-pool scans, set by _init_scan_worker
+_worker_client: Optional[Client] = None
+
+
+def _init_scan_worker(exposure: str) -> None:
+    """Process-pool initializer: build one Client per worker process."""
+    global _worker_client
+    _worker_client = Client(default_exposure=exposure)
+
+
+def _scan_in_worker(path_str: str, exposure: str) -> ScanResult:
+    """Scan a single file in a worker process."""
+    try:
+        return scan_file(Path(path_str), _worker_client, exposure)
+    except Exception as e:
+        logger.warning(f"Failed to scan {path_str}: {e}")
+        return ScanResult(
+            path=path_str,
+            score=0,
+            tier="UNKNOWN",
+            entities={},
+            exposure=exposure,
+            error=str(e),
+        )
+
+
+def scan_directory_processes(
+    files: List[Path],
+    exposure: str = "PRIVATE",
+    max_workers: int = DEFAULT_WORKERS,
+    callback=None,
+) -> List[ScanResult]:
+    """Scan files in parallel worker processes.
+
+    Detection is CPU-bound pattern matching, which threads share one core
+    for under the GIL; processes use every core. Each worker builds its
+    Client once, and files are handed out in chunks to amortize IPC.
+    Results come back in input order.
+
+    Args:
+        files: List of file paths to scan
+        exposure: Exposure level for scoring
+        max_workers: Number of worker processes
+        callback: Optional callback(result) called for each completed file
+
+    Returns:
+        List of ScanResult objects
+    """
+    if not files:
+        return []
+
+    chunksize = max(1, min(32, len(files) // (max_workers * 4)))
+    results = []
+
+    # Spawn rather than fork: forking a process that has live threads (a
+    # thread pool, logging handlers) can deadlock the children on a
+    # lock held at fork time
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_scan_worker,
+        initargs=(exposure,),
+    ) as executor:
+        scan_task = functools.partial(_scan_in_worker, exposure=exposure)
+        for result in executor.map(scan_task, map(str, files), chunksize=chunksize):
+            results.append(result)
+            if callback:
+                callback(result)
+
+    return results
+
+
+def to_jsonl(result: ScanResult) -> str:
+    """Serialize a scan result as a single compact JSON line (no newline)."""
+    return _JSONL_ENCODER.encode(result.to_dict())
+
+
+def _orjson_line(result: ScanResult) -> bytes:
+    """Encode a scan result as one JSON line of bytes with orjson."""
+    record = result.to_dict()
+    try:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    except orjson.JSONEncodeError:
+        # orjson rejects lone surrogates, which os.scandir and os.fsdecode
+        # produce for non-UTF-8 filenames; the stdlib encoder escapes them
+        return (_JSONL_ENCODER.encode(record) + "\n").encode()
+
+
+def write_jsonl(results: List[ScanResult]) -> None:
+    """
+    Write scan results to stdout as JSON Lines.
+
+    With orjson installed, records are encoded straight to UTF-8 bytes and
+    written to the binary stream, skipping the text layer.
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    if _ORJSON_AVAILABLE and buffer is not None:
+        sys.stdout.flush()
+        buffer.writelines(_orjson_line(r) for r in results)
+        buffer.flush()
+    else:
+        sys.stdout.writelines(to_jsonl(r) + "\n" for r in results)
+
+
+def format_scan_line(result: ScanResult) -> str:
+    """Format a scan result as one line of rich markup."""
     # Handle Optional score/tier fields
     tier_str = result.tier if result.tier is not None else "N/A"
     score_str = str(result.score) if result.score is not None else "N/A"
     color = TIER_COLORS.get(result.tier, "")
 
     if result.error:
-        console.print(f"{result.path}: [red]ERROR[/red] - {result.error}")
-        return
+        return f"{result.path}: [red]ERROR[/red] - {result.error}"
 
-    entities_str = ", ".join(
-        f"{k}({v})" for k, v in sorted(result.entities.items())
-    ) if result.entities else "none"
+    entities_str = format_entity_counts(result.entities, empty="none", sort=True)
+
+    return f"{result.path}: [{color}]{score_str:>3}[/{color}] ({tier_str:<8}) [{entities_str}]"
 
-    console.print(
-        f"{result.path}: [{color}]{score_str:>3}[/{color}] ({tier_str:<8}) [{entities_str}]"
-    )
+
+def format_scan_result_rich(result: ScanResult) -> None:
+    """Print a scan result using rich formatting."""
+    echo(format_scan_line(result))
+
+
+def read_file_list(source: str) -> List[Path]:
+    """
+    Read paths to scan, one per line, from a file or from stdin ("-").
+
+    The input is consumed line by line rather than read into one string,
+    so a long listing is never held in memory twice. Lines are read as
+    bytes and decoded with the filesystem encoding, so names that aren't
+    valid UTF-8 still round-trip to the right file.
+    """
+    if source == "-":
+        stream = getattr(sys.stdin, "buffer", sys.stdin)
+    else:
+        stream = open(source, "rb")
+    try:
+        return [
+            Path(os.fsdecode(entry)) for entry in (line.strip() for line in stream) if entry
+        ]
+    finally:
+        if source != "-":
+            stream.close()
 
 
 def cmd_scan(args) -> int:
     """Execute the scan command with parallel processing."""
-    path = Path(args.path)
-    max_workers = getattr(args, 'workers', DEFAULT_WORKERS)
+    files_from = getattr(args, "files_from", None)
+    if files_from is None and not args.path:
+        error("Provide a path to scan or --files-from")
+        return 1
+    if files_from is not None and (
+        args.extensions
+        or getattr(args, "min_size", None) is not None
+        or getattr(args, "max_size", None) is not None
+    ):
+        # These filter the directory walk; a listing is scanned as given
+        error("--extensions, --min-size and --max-size cannot be used with --files-from")
+        return 1
 
-    if not path.exists():
+    # With --files-from, the list itself stands in for the scan path
+    path = Path(files_from if files_from is not None else args.path)
+    use_processes = getattr(args, "processes", False)
+    max_workers = getattr(args, 'workers', None)
+    if not max_workers:
+        if use_processes:
+            max_workers = DEFAULT_PROCESS_WORKERS
+        elif is_network_path(path):
+            # Network shares are I/O-bound: use more threads than cores
+            max_workers = DEFAULT_NETWORK_WORKERS
+        else:
+            max_workers = DEFAULT_WORKERS
+
+    if files_from != "-" and not path.exists():
         error(f"Path not found: {path}")
         return 1
 
@@ -247,6 +651,7 @@ def cmd_scan(args) -> int:
     total_files = 0
     files_with_risk = 0
     max_score = 0
+    skip_clean = getattr(args, "skip_clean", False)
 
     def is_regular_file_check(p):  # TOCTOU-001: use lstat
         try:
@@ -254,7 +659,7 @@ def cmd_scan(args) -> int:
         except OSError:
             return False
 
-    if is_regular_file_check(path):
+    if files_from is None and is_regular_file_check(path):
         # Single file - no parallelism needed
         client = Client(default_exposure=args.exposure)
         result = scan_file(path, client, args.exposure)
@@ -264,14 +669,22 @@ def cmd_scan(args) -> int:
             files_with_risk = 1
             max_score = result.score
 
-        if args.format == "text" and not args.quiet:
+        if args.format == "text" and not args.quiet and not (skip_clean and result.is_clean):
             format_scan_result_rich(result)
     else:
-        # Directory scan with parallel processing
-        extensions = args.extensions.split(",") if args.extensions else None
-
-        # Collect files
-        all_files = collect_files(path, args.recursive, extensions)
+        # Directory (or file list) scan with parallel processing
+        if files_from is not None:
+            # One Client per worker serves the whole list, so piping many
+            # paths into a single run avoids per-invocation startup cost
+            all_files = read_file_list(files_from)
+        else:
+            extensions = args.extensions.split(",") if args.extensions else None
+            all_files = collect_files(
+                path, args.recursive, extensions,
+                max_workers=getattr(args, "io_workers", None) or DEFAULT_WALK_WORKERS,
+                min_size=getattr(args, "min_size", None) or 0,
+                max_size=getattr(args, "max_size", None),
+            )
 
         if not all_files:
             echo("No files to scan")
@@ -280,6 +693,15 @@ def cmd_scan(args) -> int:
         # Progress tracking with thread safety
         progress_lock = threading.Lock()
         completed = [0]  # Use list for mutability in closure
+        show_results = args.format == "text" and not args.quiet
+        # A terminal shows each result as it lands; a pipe gets them in blocks
+        block_size = 1 if is_terminal() else OUTPUT_BLOCK_SIZE
+        pending: List[ScanResult] = []
+
+        def flush_pending():
+            """Render buffered results in a single write."""
+            echo("\n".join([format_scan_line(r) for r in pending]))
+            pending.clear()
 
         def on_result(result: ScanResult):
             """Callback for each completed scan."""
@@ -292,8 +714,10 @@ def cmd_scan(args) -> int:
                     max_score = max(max_score, result.score)
 
                 # Print progress for text format
-                if args.format == "text" and not args.quiet:
-                    format_scan_result_rich(result)
+                if show_results and not (skip_clean and result.is_clean):
+                    pending.append(result)
+                    if len(pending) >= block_size:
+                        flush_pending()
 
                 p.advance()
 
@@ -301,10 +725,17 @@ def cmd_scan(args) -> int:
             if max_workers == 1:
                 # Sequential mode
                 client = Client(default_exposure=args.exposure)
-                for file_path in all_files:
+                for file_path in iter_readahead(all_files):
                     result = scan_file(file_path, client, args.exposure)
                     results.append(result)
                     on_result(result)
+            elif use_processes:
+                results = scan_directory_processes(
+                    all_files,
+                    exposure=args.exposure,
+                    max_workers=max_workers,
+                    callback=on_result,
+                )
             else:
                 # Parallel mode
                 results = scan_directory_parallel(
@@ -314,8 +745,14 @@ def cmd_scan(args) -> int:
                     callback=on_result,
                 )
 
+        if pending:
+            flush_pending()
         total_files = len(results)
 
+    # Clean files are the common case: with --skip-clean they are only
+    # counted, never formatted or converted to dicts
+    listed = [r for r in results if not r.is_clean] if skip_clean else results
+
     # Output results
     if args.format == "json":
         output = {
@@ -324,25 +761,25 @@ def cmd_scan(args) -> int:
                 "files_with_risk": files_with_risk,
                 "max_score": max_score,
             },
-            "results": [r.to_dict() for r in results],
+            "results": [r.to_dict() for r in listed],
         }
-        echo(json.dumps(output, indent=2))
+        write_json(output)
 
     elif args.format == "jsonl":
-        for result in results:
-            # Use print() directly to avoid Rich console wrapping
-            print(json.dumps(result.to_dict()))
+        # Write directly to avoid Rich console wrapping
+        write_jsonl(listed)
 
     # Print summary for text format
     if args.format == "text":
-        echo("")
-        divider()
-        echo(f"Scanned: {total_files} files")
-        if files_with_risk > 0:
-            echo(f"At risk: [yellow]{files_with_risk}[/yellow] files")
-        else:
-            success(f"At risk: 0 files")
-        echo(f"Max score: {max_score}")
+        with output_block():
+            echo("")
+            divider()
+            echo(f"Scanned: {total_files} files")
+            if files_with_risk > 0:
+                echo(f"At risk: [yellow]{files_with_risk}[/yellow] files")
+            else:
+                success(f"At risk: 0 files")
+            echo(f"Max score: {max_score}")
 
     logger.info(f"Scan complete", extra={
         "total_files": total_files,
@@ -373,8 +810,14 @@ def add_scan_parser(subparsers):
     )
     parser.add_argument(
         "path",
+        nargs="?",
         help="File or directory to scan",
     )
+    parser.add_argument(
+        "--files-from",
+        metavar="PATH",
+        help="Scan the files listed in PATH, one per line ('-' for stdin)",
+    )
     parser.add_argument(
         "--recursive", "-r",
         action="store_true",
@@ -386,6 +829,12 @@ def add_scan_parser(subparsers):
         default="text",
         help="Output format (default: text)",
     )
+    parser.add_argument(
+        "--skip-clean",
+        action="store_true",
+        help="Leave files with no findings out of the per-file output "
+             "(they still count in the summary)",
+    )
     parser.add_argument(
         "--fail-above",
         type=int,
@@ -395,9 +844,38 @@ def add_scan_parser(subparsers):
     parser.add_argument(
         "--workers", "-j",
         type=int,
-        default=DEFAULT_WORKERS,
         metavar="N",
-        help=f"Number of parallel workers (default: {DEFAULT_WORKERS})",
+        help=(
+            f"Number of parallel scan workers (default: {DEFAULT_WORKERS} threads, "
+            f"{DEFAULT_NETWORK_WORKERS} on network shares, or one process per core "
+            f"with --processes)"
+        ),
+    )
+    parser.add_argument(
+        "--processes",
+        action="store_true",
+        help="Run workers as processes instead of threads, for CPU-bound scans",
+    )
+    parser.add_argument(
+        "--io-workers",
+        type=int,
+        metavar="N",
+        help=(
+            f"Number of directories listed concurrently while collecting files "
+            f"(default: {DEFAULT_WALK_WORKERS}); raise for slow network shares"
+        ),
+    )
+    parser.add_argument(
+        "--min-size",
+        type=parse_size,
+        metavar="SIZE",
+        help="Skip files smaller than SIZE bytes (K/M/G suffixes allowed)",
+    )
+    parser.add_argument(
+        "--max-size",
+        type=parse_size,
+        metavar="SIZE",
+        help="Skip files larger than SIZE bytes (K/M/G suffixes allowed)",
     )
     # Hidden options for power users
     parser.add_argument(
@@ -19,6 +19,7 @@ Commands in shell:
 """
 
 import readline  # noqa: F401 - imported for side effect (enables command history)
+from collections import Counter
 from pathlib import Path
 from typing import List
 
@@ -208,14 +209,10 @@ class OpenLabelsShell:
             max_score = max(scores)
             min_score = min(scores)
 
-            tiers = {}
+            tiers = Counter(r.tier for r in results)
+            entity_counts: Counter = Counter()
             for r in results:
-                tiers[r.tier] = tiers.get(r.tier, 0) + 1
-
-            entity_counts = {}
-            for r in results:
-                for k, v in r.entities.items():
-                    entity_counts[k] = entity_counts.get(k, 0) + v
+                entity_counts.update(r.entities)
 
             echo("")
             divider()
@@ -236,8 +233,7 @@ class OpenLabelsShell:
             if entity_counts:
                 echo("")
                 echo("[bold]Top entities:[/bold]")
-                sorted_entities = sorted(entity_counts.items(), key=lambda x: -x[1])[:10]
-                for k, v in sorted_entities:
+                for k, v in entity_counts.most_common(10):
                     echo(f"  {k}: {v}")
 
         except Exception as e:
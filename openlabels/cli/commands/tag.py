@@ -9,6 +9,8 @@ Usage:
     openlabels tag ./data --where "has(SSN)" --force-rescan
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 from openlabels import Client
@@ -17,12 +19,62 @@ from openlabels.cli.commands.find import find_matching
 from openlabels.cli.output import echo, error, warn, success, dim, progress, divider
 from openlabels.logging_config import get_logger, get_audit_logger
 from openlabels.output.virtual import write_virtual_label
-from openlabels.output.embed import write_embedded_label
+from openlabels.output.embed import EMBEDDABLE_EXTENSIONS, write_embedded_label
 from openlabels.output.index import store_label
 
 logger = get_logger(__name__)
 audit = get_audit_logger()
 
+# Label writes are I/O-bound (metadata rewrite, xattr, index insert), so use
+# more threads than CPUs to keep the disk/network queue full.
+DEFAULT_TAG_WORKERS = 32
+
+
+def _resolve_label_set(result, client: Client, args):
+    """Get the LabelSet for a match, re-scanning the file if needed."""
+    label_set = result.label_set if hasattr(result, 'label_set') else None
+
+    if label_set is None:
+        # Re-scan to get label set. result.path is already a normalized path
+        # string from the scanner; avoid building a Path per file.
+        scan_result = client.score_file(
+            result.path,
+            exposure=args.exposure,
+            use_cache=not args.force_rescan,
+        )
+        label_set = scan_result.label_set if hasattr(scan_result, 'label_set') else None
+
+    return label_set
+
+
+def _write_labels(result, label_set, embed: bool) -> bool:
+    """
+    Write labels for one file and record it in the index.
+
+    Runs on a worker thread. Returns True if the label was embedded,
+    False if a virtual label was written instead.
+    """
+    file_path = result.path
+
+    # Try embedded label first (for supported formats). Formats with no
+    # embed writer go straight to virtual, skipping a guaranteed failure.
+    embedded = False
+    ext = os.path.splitext(file_path)[1].lower()
+    if embed and ext in EMBEDDABLE_EXTENSIONS:
+        try:
+            embedded = write_embedded_label(file_path, label_set)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Could not embed label in {file_path}, falling back to virtual: {e}")
+
+    # Write virtual label if not embedded
+    if not embedded:
+        write_virtual_label(file_path, label_set)
+
+    # Store in index
+    store_label(label_set, file_path, result.score, result.tier)
+
+    return embedded
+
 
 def cmd_tag(args) -> int:
     """Execute the tag command."""
@@ -67,68 +119,68 @@ def cmd_tag(args) -> int:
             dim(f"  ... and {len(matches) - MAX_PREVIEW_RESULTS} more")
         return 0
 
-    # Tag files
+    # Tag files. Label lookup/scoring stays on this thread; the label writes
+    # (embedded metadata, xattr, index) are I/O-bound and run in a pool so
+    # per-file latency overlaps, which matters most on network filesystems.
     tagged_count = 0
     embedded_count = 0
     virtual_count = 0
     errors = []
-
-    with progress("Tagging files", total=len(matches)) as p:
-        for i, result in enumerate(matches):
+    max_workers = max(1, getattr(args, 'workers', DEFAULT_TAG_WORKERS))
+
+    def on_error(result, e):
+        errors.append({"path": result.path, "error": str(e)})
+        logger.warning(f"Failed to tag {result.path}: {e}")
+        if not args.quiet:
+            warn(f"Error: {result.path} - {e}")
+
+    with progress("Tagging files", total=len(matches)) as p, \
+            ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
+        for result in matches:
             try:
-                file_path = Path(result.path)
-
-                # Get the label set from the scan result
-                label_set = result.label_set if hasattr(result, 'label_set') else None
-
-                if label_set is None:
-                    # Re-scan to get label set
-                    scan_result = client.score_file(str(file_path), exposure=args.exposure)
-                    label_set = scan_result.label_set if hasattr(scan_result, 'label_set') else None
-
-                if label_set is None:
-                    if not args.quiet:
-                        dim(f"Skipped (no labels): {result.path}")
-                    p.advance()
-                    continue
-
-                # Try embedded label first (for supported formats)
-                embedded = False
-                if args.embed:
-                    try:
-                        write_embedded_label(str(file_path), label_set)
-                        embedded = True
-                        embedded_count += 1
-                    except (OSError, ValueError) as e:
-                        logger.debug(f"Could not embed label in {file_path}, falling back to virtual: {e}")
-
-                # Write virtual label if not embedded
-                if not embedded:
-                    write_virtual_label(str(file_path), label_set.label_id, label_set.content_hash)
-                    virtual_count += 1
-
-                # Store in index
-                store_label(label_set, str(file_path), result.score, result.tier)
-
-                # Audit log for each tagged file
-                audit.file_tag(
-                    path=result.path,
-                    label_id=label_set.label_id,
-                    embedded=embedded,
-                    score=result.score,
-                )
-
-                tagged_count += 1
-                logger.debug(f"Tagged {result.path} ({'embedded' if embedded else 'virtual'})")
+                label_set = _resolve_label_set(result, client, args)
+            except (OSError, ValueError) as e:
+                on_error(result, e)
+                p.advance()
+                continue
 
+            if label_set is None:
                 if not args.quiet:
-                    p.set_description(f"[{i+1}/{len(matches)}] {file_path.name}")
+                    dim(f"Skipped (no labels): {result.path}")
+                p.advance()
+                continue
+
+            future = executor.submit(_write_labels, result, label_set, args.embed)
+            futures[future] = (result, label_set)
 
+        for done, future in enumerate(as_completed(futures), 1):
+            result, label_set = futures[future]
+            try:
+                embedded = future.result()
             except (OSError, ValueError) as e:
-                errors.append({"path": result.path, "error": str(e)})
-                logger.warning(f"Failed to tag {result.path}: {e}")
-                if not args.quiet:
-                    warn(f"Error: {result.path} - {e}")
+                on_error(result, e)
+                p.advance()
+                continue
+
+            if embedded:
+                embedded_count += 1
+            else:
+                virtual_count += 1
+
+            # Audit log for each tagged file
+            audit.file_tag(
+                path=result.path,
+                label_id=label_set.label_id,
+                embedded=embedded,
+                score=result.score,
+            )
+
+            tagged_count += 1
+            logger.debug(f"Tagged {result.path} ({'embedded' if embedded else 'virtual'})")
+
+            if not args.quiet:
+                p.set_description(f"[{done}/{len(futures)}] {os.path.basename(result.path)}")
 
             p.advance()
 
@@ -206,6 +258,13 @@ def add_tag_parser(subparsers, hidden=False):
         action="store_true",
         help="Re-scan files even if already tagged",
     )
+    parser.add_argument(
+        "--workers", "-j",
+        type=int,
+        default=DEFAULT_TAG_WORKERS,
+        metavar="N",
+        help=f"Number of concurrent label writers (default: {DEFAULT_TAG_WORKERS})",
+    )
     parser.add_argument(
         "--dry-run", "-n",
         action="store_true",
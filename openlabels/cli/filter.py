@@ -26,14 +26,18 @@ Examples:
     encryption = none OR exposure = public
 """
 
+import functools
 import logging
+import operator
 import re
+import sys
 import warnings
 from dataclasses import dataclass, field
-from typing import List, Optional, Any, Dict, Set
+from typing import Callable, List, Optional, Any, Dict, Set
 from enum import Enum
 
 from openlabels.adapters.scanner.constants import REGEX_TIMEOUT_MS
+from openlabels.core.constants import DATACLASS_SLOTS
 
 logger = logging.getLogger(__name__)
 
@@ -62,12 +66,36 @@ DURATION_MULTIPLIERS = {
     "y": 365,    # years (approximate)
 }
 
+# Duration literal, e.g. "30d" or "1y" (groups: count, unit)
+_DURATION_RE = re.compile(r'^(\d+)([dwmy])$')
+
+# Lexical patterns, applied with .match(expression, pos) so scanning runs in C
+_WHITESPACE_RE = re.compile(r'[ \t\n\r]+')
+_FIELD_RE = re.compile(r'\w+')
+_VALUE_RE = re.compile(r'[^ \t\n\r]+')
+# Quoted string body (backslash escapes kept verbatim); closing quote optional
+_QUOTED_RE = {
+    '"': re.compile(r'"((?:\\.|[^"])*)"?', re.DOTALL),
+    "'": re.compile(r"'((?:\\.|[^'])*)'?", re.DOTALL),
+}
+
+# Limits and ReDoS guards for user-supplied 'matches' patterns
+_MAX_PATTERN_LENGTH = 500
+_MAX_TEXT_LENGTH_FOR_REGEX = 1_000_000  # 1MB text limit for regex ops
+_REDOS_PATTERNS = (
+    re.compile(r'\([^)]*[+*][^)]*\)[+*]'),  # (a+)+ or (a*)*
+    re.compile(r'\([^)]*\|[^)]*\)[+*]'),     # (a|b)+
+)
+# A 'matches' pattern with none of these is a plain substring search
+_REGEX_METACHAR_RE = re.compile(r'[.^$*+?{}\[\]\\|()]')
+
 
 class TokenType(Enum):
     """Token types for the filter parser."""
     FIELD = "field"
     OPERATOR = "operator"
     VALUE = "value"
+    STRING = "string"  # Quoted value, kept verbatim
     AND = "and"
     OR = "or"
     HAS = "has"
@@ -77,73 +105,168 @@ class TokenType(Enum):
     EOF = "eof"
 
 
-@dataclass
+class LogicalOperator(str, Enum):
+    """
+    Operator joining two filter conditions.
+
+    A str subclass, so members still compare equal to "AND"/"OR".
+    """
+    AND = "AND"
+    OR = "OR"
+
+
+@dataclass(**DATACLASS_SLOTS)
 class Token:
     """A single token from the filter expression."""
     type: TokenType
     value: str
-    position: int = 0
+    position: int
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Condition:
     """A single filter condition."""
     field: str
     operator: str
     value: Any
+    # Numeric form of value for >, <, >=, <= (durations in days, exposure
+    # levels by rank), resolved once when the condition is built
+    _comparable_value: Optional[float] = field(
+        default=None, init=False, repr=False, compare=False,
+    )
+    _compiled: Optional[Callable[[Dict[str, Any]], bool]] = field(
+        default=None, init=False, repr=False, compare=False,
+    )
+
+    def __post_init__(self):
+        if self.operator in _ORDERING_COMPARISONS:
+            self._comparable_value = self._to_comparable(self.value)
 
     def evaluate(self, result: Dict[str, Any]) -> bool:
         """Evaluate this condition against a result dict."""
-        actual = self._get_field_value(result, self.field)
+        return self.compile()(result)
 
-        if actual is None:
-            return self.operator == "missing"
-
-        return self._compare(actual, self.operator, self.value)
+    def compile(self) -> Callable[[Dict[str, Any]], bool]:
+        """
+        Compile this condition into a predicate over result dicts.
 
-    def _get_field_value(self, result: Dict[str, Any], field: str) -> Any:
-        """Get a field value from result, handling nested fields."""
-        # Direct fields
-        if field in result:
-            return result[field]
+        Operator dispatch and normalization of the expected value happen
+        once here rather than on every evaluation. The predicate is cached
+        on the condition.
+        """
+        if self._compiled is None:
+            get_value = self._make_getter(self.field)
 
-        # Nested in context
-        if "context" in result and field in result["context"]:
-            return result["context"][field]
+            if self.operator == "missing":
+                def predicate(result: Dict[str, Any]) -> bool:
+                    return get_value(result) is None
+            else:
+                compare = self._make_comparator()
 
-        # Entity-related fields
-        if field == "entity_count":
-            entities = result.get("entities", [])
-            return sum(e.get("count", 1) for e in entities)
+                def predicate(result: Dict[str, Any]) -> bool:
+                    actual = get_value(result)
+                    return actual is not None and compare(actual)
 
-        if field == "has_entity":
-            # Special handling for has() function
-            entities = result.get("entities", [])
-            return [e.get("type", "").upper() for e in entities]
+            self._compiled = predicate
+        return self._compiled
 
-        return None
+    @staticmethod
+    def _make_getter(field: str) -> Callable[[Dict[str, Any]], Any]:
+        """
+        Build the lookup of a field's value in a result.
 
-    def _compare(self, actual: Any, operator: str, expected: Any) -> bool:
-        """Compare actual value against expected using operator."""
-        normalize = self._normalize
+        Direct fields win, then fields nested in "context"; entity_count and
+        has_entity are derived from the entity list when neither holds them.
+        The field is fixed at compile time, so only the branches that can
+        apply to it are kept.
+        """
+        derive = _DERIVED_FIELDS.get(field)
+
+        if derive is None:
+            def get_value(result: Dict[str, Any]) -> Any:
+                if field in result:
+                    return result[field]
+                context = result.get("context")
+                if context and field in context:
+                    return context[field]
+                return None
+        else:
+            def get_value(result: Dict[str, Any]) -> Any:
+                if field in result:
+                    return result[field]
+                context = result.get("context")
+                if context and field in context:
+                    return context[field]
+                return derive(result)
+
+        return get_value
+
+    def _make_comparator(self) -> Callable[[Any], bool]:
+        """Build a comparison of an actual value against this condition's value."""
+        operator = self.operator
+        expected = self.value
         to_comparable = self._to_comparable
 
-        dispatch = {
-            "=": lambda: normalize(actual) == normalize(expected),
-            "!=": lambda: normalize(actual) != normalize(expected),
-            ">": lambda: to_comparable(actual) > to_comparable(expected),
-            "<": lambda: to_comparable(actual) < to_comparable(expected),
-            ">=": lambda: to_comparable(actual) >= to_comparable(expected),
-            "<=": lambda: to_comparable(actual) <= to_comparable(expected),
-            "contains": lambda: str(expected).lower() in str(actual).lower(),
-            "matches": lambda: self._safe_regex_match(str(expected), str(actual)),
-            "has": lambda: isinstance(actual, list) and expected.upper() in [str(x).upper() for x in actual],
-            "missing": lambda: actual is None,
-        }
+        if operator == "=":
+            return self._make_equals(expected)
+        if operator == "!=":
+            equals = self._make_equals(expected)
+            return lambda actual: not equals(actual)
+        if operator in _ORDERING_COMPARISONS:
+            compare = _ORDERING_COMPARISONS[operator]
+            expected_num = self._comparable_value
+            return lambda actual: compare(to_comparable(actual), expected_num)
+        if operator == "contains" or (
+            operator == "matches" and _is_literal_pattern(str(expected))
+        ):
+            # A pattern without metacharacters matches exactly where a
+            # case-insensitive substring search does, without the regex engine
+            expected_lower = str(expected).lower()
+            return lambda actual: expected_lower in str(actual).lower()
+        if operator == "matches":
+            pattern = str(expected)
+            safe_match = self._safe_regex_match
+            return lambda actual: safe_match(pattern, str(actual))
+        if operator == "has":
+            expected_upper = expected.upper()
+
+            def has(actual: Any) -> bool:
+                # Derived types arrive as an upper-cased frozenset; an
+                # explicit has_entity list in the result is upper-cased here
+                if isinstance(actual, frozenset):
+                    return expected_upper in actual
+                return (
+                    isinstance(actual, list)
+                    and expected_upper in [str(x).upper() for x in actual]
+                )
+            return has
 
-        if operator not in dispatch:
-            return False
-        return dispatch[operator]()
+        return lambda actual: False
+
+    def _make_equals(self, expected: Any) -> Callable[[Any], bool]:
+        """
+        Build an equality test equivalent to comparing _normalize() forms.
+
+        Specialized on the type of the expected value so the common cases
+        (number vs number, string vs string) skip the str() round trip.
+        """
+        normalize = self._normalize
+        expected_norm = normalize(expected)
+        expected_type = type(expected)
+
+        if expected_type in (int, float):
+            # Same-type numbers compare equal exactly when their str() forms do
+            def equals(actual: Any) -> bool:
+                if type(actual) is expected_type:
+                    return actual == expected
+                return normalize(actual) == expected_norm
+        else:
+            def equals(actual: Any) -> bool:
+                if type(actual) is str:
+                    return actual.lower().strip() == expected_norm
+                return normalize(actual) == expected_norm
+
+        return equals
 
     def _normalize(self, value: Any) -> str:
         """Normalize value for comparison."""
@@ -157,7 +280,7 @@ class Condition:
             return float(value)
         if isinstance(value, str):
             # Handle duration strings
-            if re.match(r'^\d+[dwmy]$', value):
+            if _DURATION_RE.match(value):
                 return self._duration_to_days(value)
             # Handle exposure levels
             lower = value.lower()
@@ -172,7 +295,7 @@ class Condition:
 
     def _duration_to_days(self, duration: str) -> float:
         """Convert duration string to days."""
-        match = re.match(r'^(\d+)([dwmy])$', duration)
+        match = _DURATION_RE.match(duration)
         if not match:
             return 0
 
@@ -200,44 +323,13 @@ class Condition:
         """
         global _regex_import_warning_issued
 
-        MAX_PATTERN_LENGTH = 500
-        MAX_TEXT_LENGTH_FOR_REGEX = 1_000_000  # 1MB text limit for regex ops
-
-        if len(pattern) > MAX_PATTERN_LENGTH:
-            logger.debug(f"Regex pattern rejected: exceeds {MAX_PATTERN_LENGTH} chars")
-            return False
-
         # Limit text length to prevent slow regex on huge inputs
-        if len(text) > MAX_TEXT_LENGTH_FOR_REGEX:
-            logger.debug(f"Regex match skipped: text exceeds {MAX_TEXT_LENGTH_FOR_REGEX} chars")
+        if len(text) > _MAX_TEXT_LENGTH_FOR_REGEX:
+            logger.debug(f"Regex match skipped: text exceeds {_MAX_TEXT_LENGTH_FOR_REGEX} chars")
             return False
 
-        # Reject patterns with known ReDoS-prone constructs: nested quantifiers
-        redos_patterns = [
-            r'\([^)]*[+*][^)]*\)[+*]',  # (a+)+ or (a*)*
-            r'\([^)]*\|[^)]*\)[+*]',     # (a|b)+
-        ]
-        for dangerous in redos_patterns:
-            if re.search(dangerous, pattern):
-                logger.debug("Regex pattern rejected: contains ReDoS-prone construct")
-                return False
-
         try:  # CVE-READY-003: require 'regex' module for timeout
-            import regex
-            try:
-                # regex module supports timeout parameter (in seconds)
-                result = regex.search(
-                    pattern, text,
-                    flags=regex.IGNORECASE,
-                    timeout=timeout_ms / 1000.0
-                )
-                return bool(result)
-            except regex.error as e:
-                logger.debug(f"Regex pattern error: {e}")
-                return False
-            except TimeoutError:
-                logger.warning(f"Regex match timed out after {timeout_ms}ms")
-                return False
+            compiled = _compile_user_pattern(pattern)
         except ImportError:  # CVE-READY-003: reject without safe timeout support
             if not _regex_import_warning_issued:
                 logger.error(
@@ -254,31 +346,216 @@ class Condition:
             )
             return False
 
+        if compiled is None:
+            return False
+
+        try:
+            # regex module supports timeout parameter (in seconds)
+            return bool(compiled.search(text, timeout=timeout_ms / 1000.0))
+        except TimeoutError:
+            logger.warning(f"Regex match timed out after {timeout_ms}ms")
+            return False
+
+
+def _sum_entity_counts(result: Dict[str, Any]) -> int:
+    """Total entity count for a result whose entities are {"type", "count"} dicts."""
+    return sum(e.get("count", 1) for e in result.get("entities", []))
+
+
+def _entity_types(result: Dict[str, Any]) -> frozenset:
+    """Upper-cased entity types present in a result, for has() lookups."""
+    return frozenset(e.get("type", "").upper() for e in result.get("entities", []))
+
+
+# Numeric comparison operators
+_ORDERING_COMPARISONS = {
+    ">": operator.gt,
+    "<": operator.lt,
+    ">=": operator.ge,
+    "<=": operator.le,
+}
+
+
+# Relative evaluation cost by operator, for ordering commutative conditions.
+# Plain field comparisons default to 1.
+_OPERATOR_COSTS = {
+    "contains": 2,
+    "has": 3,
+    "matches": 10,
+}
+
+
+def _is_literal_pattern(pattern: str) -> bool:
+    """True if a 'matches' pattern has no regex metacharacters."""
+    return _REGEX_METACHAR_RE.search(pattern) is None
+
+
+def _condition_cost(cond: "Condition") -> int:
+    """Estimated cost of evaluating a condition; derived fields cost extra."""
+    if cond.operator == "matches" and _is_literal_pattern(str(cond.value)):
+        cost = _OPERATOR_COSTS["contains"]
+    else:
+        cost = _OPERATOR_COSTS.get(cond.operator, 1)
+    if cond.field in _DERIVED_FIELDS:
+        cost += 2
+    return cost
+
+
+# Fields computed from a result's entity list rather than read from it
+_DERIVED_FIELDS = {
+    "entity_count": _sum_entity_counts,
+    "has_entity": _entity_types,
+}
+
+
+class _DerivedFieldsRow:
+    """
+    A result whose derived fields are computed once, on first read.
+
+    Supports just the lookups condition getters make: "in", [] and get().
+    Reads of other fields go straight to the result, so a lazy Mapping
+    such as the scanner's result view is never copied.
+    """
+
+    __slots__ = ("_result", "_derive", "_derived")
+
+    def __init__(self, result: Dict[str, Any], derive: Dict[str, Callable[[Dict[str, Any]], Any]]):
+        self._result = result
+        self._derive = derive
+        self._derived: Dict[str, Any] = {}
 
-@dataclass
+    def __contains__(self, key: str) -> bool:
+        if key in self._result:
+            return True
+        if key in self._derive:
+            # A value in context wins over deriving it
+            context = self._result.get("context")
+            return not (context and key in context)
+        return False
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._result:
+            return self._result[key]
+        derived = self._derived
+        if key not in derived:
+            derived[key] = self._derive[key](self._result)
+        return derived[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self[key] if key in self else default
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_user_pattern(pattern: str):
+    """
+    Validate and compile a user-supplied 'matches' pattern.
+
+    Cached so a filter evaluated against many results compiles its pattern
+    once. Returns None if the pattern is rejected (too long, ReDoS-prone,
+    or invalid). Raises ImportError if the 'regex' module is unavailable;
+    exceptions are not cached, so that case is re-checked on every call.
+    """
+    import regex
+
+    if len(pattern) > _MAX_PATTERN_LENGTH:
+        logger.debug(f"Regex pattern rejected: exceeds {_MAX_PATTERN_LENGTH} chars")
+        return None
+
+    # Reject patterns with known ReDoS-prone constructs: nested quantifiers
+    for dangerous in _REDOS_PATTERNS:
+        if dangerous.search(pattern):
+            logger.debug("Regex pattern rejected: contains ReDoS-prone construct")
+            return None
+
+    try:
+        return regex.compile(pattern, flags=regex.IGNORECASE)
+    except regex.error as e:
+        logger.debug(f"Regex pattern error: {e}")
+        return None
+
+
+@dataclass(**DATACLASS_SLOTS)
 class Filter:
     """A complete filter expression."""
     conditions: List[Condition] = field(default_factory=list)
-    operators: List[str] = field(default_factory=list)  # AND/OR between conditions
+    operators: List[str] = field(default_factory=list)  # LogicalOperator between conditions
+    _compiled: Optional[Callable[[Dict[str, Any]], bool]] = field(
+        default=None, init=False, repr=False, compare=False,
+    )
 
     def evaluate(self, result: Dict[str, Any]) -> bool:
         """Evaluate this filter against a result."""
+        return self.compile()(result)
+
+    def compile(self) -> Callable[[Dict[str, Any]], bool]:
+        """
+        Compile this filter into a single predicate over result dicts.
+
+        Conditions are compiled once and chained left to right with
+        short-circuit AND/OR. The predicate is cached on the filter, so
+        conditions and operators must not be changed after evaluation.
+        """
+        if self._compiled is None:
+            self._compiled = self._build_predicate()
+        return self._compiled
+
+    def _build_predicate(self) -> Callable[[Dict[str, Any]], bool]:
         if not self.conditions:
-            return True
+            return lambda result: True
+
+        if len(self.conditions) == 1:
+            return self.conditions[0].compile()
+
+        # Conditions combine strictly left to right, so a run of conditions
+        # joined by the same operator commutes: ((a AND b) AND c) can be
+        # evaluated in any order, as can the run "... OR x OR y" applied to
+        # the value so far. Group the runs and evaluate each group cheapest
+        # condition first so short-circuiting skips the expensive ones.
+        groups: List[tuple] = []  # (is_and, [conditions])
+        is_and_ops = [
+            LogicalOperator(op.upper()) is LogicalOperator.AND for op in self.operators
+        ]
+        first_is_and = is_and_ops[0] if is_and_ops else True
+        groups.append((first_is_and, [self.conditions[0]]))
+        for is_and, cond in zip(is_and_ops, self.conditions[1:]):
+            if is_and == groups[-1][0]:
+                groups[-1][1].append(cond)
+            else:
+                groups.append((is_and, [cond]))
 
-        # Evaluate first condition
-        current = self.conditions[0].evaluate(result)
+        compiled = [
+            (is_and, [c.compile() for c in sorted(conds, key=_condition_cost)])
+            for is_and, conds in groups
+        ]
+        (first_and, first), rest = compiled[0], compiled[1:]
 
-        # Apply remaining conditions with AND/OR
-        for i, (op, cond) in enumerate(zip(self.operators, self.conditions[1:])):
-            cond_result = cond.evaluate(result)
+        def predicate(result: Dict[str, Any]) -> bool:
+            if first_and:
+                current = all(cond(result) for cond in first)
+            else:
+                current = any(cond(result) for cond in first)
+            for is_and, conds in rest:
+                if is_and:
+                    if current:
+                        current = all(cond(result) for cond in conds)
+                elif not current:
+                    current = any(cond(result) for cond in conds)
+            return current
+
+        # entity_count and has_entity are derived from the entity list; when
+        # several conditions read the same one, derive it once per result
+        # rather than once per condition.
+        shared = {
+            name: derive for name, derive in _DERIVED_FIELDS.items()
+            if sum(1 for cond in self.conditions if cond.field == name) > 1
+        }
+        if not shared:
+            return predicate
 
-            if op.upper() == "AND":
-                current = current and cond_result
-            else:  # OR
-                current = current or cond_result
+        def predicate_with_derived(result: Dict[str, Any]) -> bool:
+            return predicate(_DerivedFieldsRow(result, shared))
 
-        return current
+        return predicate_with_derived
 
     @classmethod
     def parse(cls, expression: str) -> "Filter":
@@ -296,16 +573,170 @@ class Filter:
                 {"field": c.field, "operator": c.operator, "value": c.value}
                 for c in self.conditions
             ],
-            "operators": self.operators,
+            "operators": [LogicalOperator(op.upper()).value for op in self.operators],
         }
 
 
+class _Tokenizer:
+    """
+    Single-pass lexer for filter expressions.
+
+    Scans the expression once, left to right, producing the token list that
+    FilterParser consumes. Lexing follows the grammar's shape (a value is
+    only expected after an operator), so unquoted values may contain any
+    non-whitespace characters, e.g. regexes or paths.
+    """
+
+    def __init__(self, expression: str):
+        self.expression = expression
+        self.pos = 0
+        self.length = len(expression)
+
+    def tokenize(self) -> List[Token]:
+        """Tokenize the expression, ending with an EOF token."""
+        tokens: List[Token] = []
+
+        while self._scan_condition(tokens):
+            self._skip_whitespace()
+            token = self._scan_logical_operator()
+            if token is None:
+                # Anything after the last complete condition is ignored
+                break
+            tokens.append(token)
+
+        self._skip_whitespace()
+        tokens.append(Token(TokenType.EOF, "", self.pos))
+        return tokens
+
+    def _skip_whitespace(self):
+        """Skip whitespace and newlines."""
+        match = _WHITESPACE_RE.match(self.expression, self.pos)
+        if match:
+            self.pos = match.end()
+
+    def _lookahead(self, text: str) -> bool:
+        """Check case-insensitively for lowercase text at pos."""
+        # Lowercase only the slice: lowering the whole expression can change
+        # its length (e.g. 'İ'), so offsets into a lowered copy would drift
+        return self.expression[self.pos:self.pos + len(text)].lower() == text
+
+    def _keyword_at(self, keyword: str) -> bool:
+        """Check for a lowercase keyword at pos, ending at a word boundary."""
+        if not self._lookahead(keyword):
+            return False
+        end = self.pos + len(keyword)
+        return end >= self.length or not self.expression[end].isalnum()
+
+    def _scan_logical_operator(self) -> Optional[Token]:
+        """Scan AND or OR."""
+        for keyword, token_type in (("and", TokenType.AND), ("or", TokenType.OR)):
+            if self._keyword_at(keyword):
+                token = Token(token_type, keyword.upper(), self.pos)
+                self.pos += len(keyword)
+                return token
+        return None
+
+    def _scan_condition(self, tokens: List[Token]) -> bool:
+        """Scan the tokens of one condition. Returns False if none found."""
+        self._skip_whitespace()
+
+        if self.pos >= self.length:
+            return False
+
+        # has(entity_type) / missing(field)
+        if self._lookahead("has("):
+            tokens.append(self._scan_function(TokenType.HAS, "has"))
+            return True
+        if self._lookahead("missing("):
+            tokens.append(self._scan_function(TokenType.MISSING, "missing"))
+            return True
+
+        # field operator value
+        match = _FIELD_RE.match(self.expression, self.pos)
+        if not match:
+            return False
+        field = match.group(0)
+        tokens.append(Token(TokenType.FIELD, field.lower(), self.pos))
+        self.pos = match.end()
+
+        self._skip_whitespace()
+        operator = self._scan_operator()
+        if operator is None:
+            raise ValueError(f"Expected operator after '{field.lower()}' at position {self.pos}")
+        tokens.append(operator)
+
+        self._skip_whitespace()
+        tokens.append(self._scan_value())
+        return True
+
+    def _scan_function(self, token_type: TokenType, name: str) -> Token:
+        """Scan name(argument); the token value is the stripped argument."""
+        start = self.pos
+        self.pos += len(name) + 1  # Skip 'name('
+
+        # Find closing paren
+        end = self.expression.find(')', self.pos)
+        if end == -1:
+            raise ValueError(f"Unclosed {name}() at position {start}")
+
+        argument = self.expression[self.pos:end].strip()
+        self.pos = end + 1
+        return Token(token_type, argument, start)
+
+    def _scan_operator(self) -> Optional[Token]:
+        """Scan a comparison operator."""
+        start = self.pos
+
+        # Check two-character operators first
+        two_char = self.expression[start:start+2]
+        if two_char in (">=", "<=", "!="):
+            self.pos += 2
+            return Token(TokenType.OPERATOR, two_char, start)
+
+        # Check single-character operators
+        if start < self.length and self.expression[start] in ("=", ">", "<"):
+            self.pos += 1
+            return Token(TokenType.OPERATOR, self.expression[start], start)
+
+        # Check word operators
+        for op in ("contains", "matches"):
+            if self._keyword_at(op):
+                self.pos += len(op)
+                return Token(TokenType.OPERATOR, op, start)
+
+        return None
+
+    def _scan_value(self) -> Token:
+        """Scan a quoted string or an unquoted value."""
+        start = self.pos
+
+        if start >= self.length:
+            raise ValueError("Expected value at end of expression")
+
+        # Quoted string: taken verbatim, never type-converted
+        quote = self.expression[start]
+        if quote in ('"', "'"):
+            match = _QUOTED_RE[quote].match(self.expression, start)
+            self.pos = match.end()
+            return Token(TokenType.STRING, match.group(1), start)
+
+        # Unquoted value: everything up to the next whitespace, found by a
+        # single regex match. A bare AND/OR here means the value itself is
+        # missing; only short values need the case-folded keyword check.
+        match = _VALUE_RE.match(self.expression, start)
+        value = match.group(0)
+        if len(value) <= 3 and value.upper() in ("AND", "OR"):
+            raise ValueError(f"Expected value before {value.upper()} at position {start}")
+        self.pos = match.end()
+        return Token(TokenType.VALUE, value, start)
+
+
 class FilterParser:
     """
     Recursive descent parser for filter expressions.
 
-    Implements the grammar defined in the module docstring.
-    Uses simple character-by-character parsing with lookahead.
+    Implements the grammar defined in the module docstring. The expression
+    is tokenized once up front; parsing then walks the token list.
     """
 
     # Valid field names for filter conditions
@@ -321,14 +752,21 @@ class FilterParser:
     # Valid enum values (derived from module constants)
     EXPOSURE_VALUES = frozenset(EXPOSURE_LEVEL_VALUES.keys())
     ENCRYPTION_VALUES = frozenset({"none", "platform", "customer_managed"})
+    TIER_VALUES = frozenset({"critical", "high", "medium", "low", "minimal"})
+
+    # All enum literals, lowercased on parse; built once, not per value
+    _ENUM_VALUES = EXPOSURE_VALUES | ENCRYPTION_VALUES | TIER_VALUES
 
     def __init__(self, expression: str):
         self.expression = expression.strip()
-        self.pos = 0
-        self.length = len(self.expression)
+        self._tokens: List[Token] = []
+        self._index = 0
 
     def parse(self) -> Filter:
         """Parse the expression into a Filter object."""
+        self._tokens = _Tokenizer(self.expression).tokenize()
+        self._index = 0
+
         conditions = []
         operators = []
 
@@ -338,14 +776,8 @@ class FilterParser:
             conditions.append(cond)
 
         # Parse remaining conditions with AND/OR
-        while self.pos < self.length:
-            self._skip_whitespace()
-
-            # Check for AND/OR
-            op = self._parse_logical_operator()
-            if not op:
-                break
-
+        while self._peek().type in (TokenType.AND, TokenType.OR):
+            op = LogicalOperator(self._next().value)
             operators.append(op)
 
             # Parse next condition
@@ -353,115 +785,52 @@ class FilterParser:
             if cond:
                 conditions.append(cond)
             else:
-                raise ValueError(f"Expected condition after {op} at position {self.pos}")
+                raise ValueError(
+                    f"Expected condition after {op.value} at position {self._peek().position}"
+                )
 
         return Filter(conditions=conditions, operators=operators)
 
-    def _skip_whitespace(self):
-        """Skip whitespace and newlines."""
-        while self.pos < self.length and self.expression[self.pos] in ' \t\n\r':
-            self.pos += 1
-
-    def _parse_logical_operator(self) -> Optional[str]:
-        """Parse AND or OR."""
-        self._skip_whitespace()
-
-        # Check for AND
-        if self.expression[self.pos:self.pos+3].upper() == "AND":
-            next_char_pos = self.pos + 3
-            if next_char_pos >= self.length or not self.expression[next_char_pos].isalnum():
-                self.pos += 3
-                return "AND"
+    def _peek(self) -> Token:
+        """Return the current token without consuming it."""
+        return self._tokens[self._index]
 
-        # Check for OR
-        if self.expression[self.pos:self.pos+2].upper() == "OR":
-            next_char_pos = self.pos + 2
-            if next_char_pos >= self.length or not self.expression[next_char_pos].isalnum():
-                self.pos += 2
-                return "OR"
-
-        return None
+    def _next(self) -> Token:
+        """Consume and return the current token."""
+        token = self._tokens[self._index]
+        self._index += 1
+        return token
 
     def _parse_condition(self) -> Optional[Condition]:
         """Parse a single condition."""
-        self._skip_whitespace()
+        token = self._peek()
 
-        if self.pos >= self.length:
-            return None
-
-        # Check for has(entity_type)
-        if self.expression[self.pos:self.pos+4].lower() == "has(":
-            return self._parse_has_condition()
+        if token.type is TokenType.HAS:
+            self._next()
+            return Condition(field="has_entity", operator="has", value=token.value)
 
-        # Check for missing(field)
-        if self.expression[self.pos:self.pos+8].lower() == "missing(":
-            return self._parse_missing_condition()
+        if token.type is TokenType.MISSING:
+            self._next()
+            return Condition(field=token.value, operator="missing", value=None)
 
-        # Parse field = operator = value
-        field = self._parse_field()
-        if not field:
+        if token.type is not TokenType.FIELD:
             return None
 
-        self._skip_whitespace()
-
-        operator = self._parse_operator()
-        if not operator:
-            raise ValueError(f"Expected operator after '{field}' at position {self.pos}")
+        # The tokenizer always emits FIELD OPERATOR VALUE together
+        field = self._next().value
+        if field not in self.FIELDS:
+            self._warn_unknown_field(field)
 
-        self._skip_whitespace()
+        operator = self._next().value
 
-        value = self._parse_value()
+        value_token = self._next()
+        if value_token.type is TokenType.STRING:
+            value = value_token.value
+        else:
+            value = _convert_value(value_token.value)
 
         return Condition(field=field, operator=operator, value=value)
 
-    def _parse_has_condition(self) -> Condition:
-        """Parse has(entity_type) condition."""
-        self.pos += 4  # Skip 'has('
-
-        # Find closing paren
-        end = self.expression.find(')', self.pos)
-        if end == -1:
-            raise ValueError("Unclosed has() at position " + str(self.pos - 4))
-
-        entity_type = self.expression[self.pos:end].strip()
-        self.pos = end + 1
-
-        return Condition(field="has_entity", operator="has", value=entity_type)
-
-    def _parse_missing_condition(self) -> Condition:
-        """Parse missing(field) condition."""
-        self.pos += 8  # Skip 'missing('
-
-        # Find closing paren
-        end = self.expression.find(')', self.pos)
-        if end == -1:
-            raise ValueError("Unclosed missing() at position " + str(self.pos - 8))
-
-        field = self.expression[self.pos:end].strip()
-        self.pos = end + 1
-
-        return Condition(field=field, operator="missing", value=None)
-
-    def _parse_field(self) -> Optional[str]:
-        """Parse a field name."""
-        self._skip_whitespace()
-
-        start = self.pos
-        while self.pos < self.length and (
-            self.expression[self.pos].isalnum() or self.expression[self.pos] == '_'
-        ):
-            self.pos += 1
-
-        if self.pos == start:
-            return None
-
-        field = self.expression[start:self.pos].lower()
-
-        if field not in self.FIELDS:
-            self._warn_unknown_field(field)
-
-        return field
-
     def _warn_unknown_field(self, field: str) -> None:
         """Warn about unknown filter field (once per process to avoid spam)."""
         global _unknown_field_warnings_issued
@@ -475,107 +844,53 @@ class FilterParser:
                 stacklevel=4,  # Point to the caller's code
             )
 
-    def _parse_operator(self) -> Optional[str]:
-        """Parse an operator."""
-        self._skip_whitespace()
-
-        # Check two-character operators first
-        if self.pos + 1 < self.length:
-            two_char = self.expression[self.pos:self.pos+2]
-            if two_char in (">=", "<=", "!="):
-                self.pos += 2
-                return two_char
-
-        # Check single-character operators
-        if self.pos < self.length:
-            one_char = self.expression[self.pos]
-            if one_char in ("=", ">", "<"):
-                self.pos += 1
-                return one_char
-
-        # Check word operators
-        for op in ("contains", "matches"):
-            if self.expression[self.pos:self.pos+len(op)].lower() == op:
-                next_pos = self.pos + len(op)
-                if next_pos >= self.length or not self.expression[next_pos].isalnum():
-                    self.pos = next_pos
-                    return op
-
-        return None
-
-    def _parse_value(self) -> Any:
-        """Parse a value (number, duration, enum, or string)."""
-        self._skip_whitespace()
 
-        if self.pos >= self.length:
-            raise ValueError("Expected value at end of expression")
-
-        # Check for quoted string
-        if self.expression[self.pos] in ('"', "'"):
-            return self._parse_quoted_string()
-
-        # Parse unquoted value
-        start = self.pos
-        while self.pos < self.length and self.expression[self.pos] not in ' \t\n\r':
-            # Stop at AND/OR
-            remaining = self.expression[self.pos:].upper()
-            if remaining.startswith("AND ") or remaining.startswith("OR "):
-                break
-            if remaining == "AND" or remaining == "OR":
-                break
-            self.pos += 1
-
-        value = self.expression[start:self.pos].strip()
-
-        # Try to convert to appropriate type
-        return self._convert_value(value)
-
-    def _parse_quoted_string(self) -> str:
-        """Parse a quoted string value."""
-        quote = self.expression[self.pos]
-        self.pos += 1
-
-        start = self.pos
-        while self.pos < self.length and self.expression[self.pos] != quote:
-            # Handle escape
-            if self.expression[self.pos] == '\\' and self.pos + 1 < self.length:
-                self.pos += 2
-            else:
-                self.pos += 1
-
-        value = self.expression[start:self.pos]
-
-        if self.pos < self.length:
-            self.pos += 1  # Skip closing quote
+@functools.lru_cache(maxsize=2048)
+def _convert_value(value: str) -> Any:
+    """
+    Convert an unquoted value literal to its typed form.
 
-        return value
+    Cached because filters reuse the same literals ("public", "1y", "75")
+    over and over; the results (int, float or str) are immutable.
+    """
+    # Check for duration
+    if _DURATION_RE.match(value):
+        return value  # Keep as duration string
+
+    # Check for integer
+    try:
+        return int(value)
+    except ValueError:
+        pass
+
+    # Check for float
+    try:
+        return float(value)
+    except ValueError:
+        pass
+
+    # Return as string (lowercase for enums). Interning the enum keeps
+    # equality checks against other interned literals on the fast path.
+    lower = value.lower()
+    if lower in FilterParser._ENUM_VALUES:
+        return sys.intern(lower)
+    return value
 
-    def _convert_value(self, value: str) -> Any:
-        """Convert string value to appropriate type."""
-        # Check for duration
-        if re.match(r'^\d+[dwmy]$', value):
-            return value  # Keep as duration string
 
-        # Check for integer
-        try:
-            return int(value)
-        except ValueError:
-            pass
-
-        # Check for float
-        try:
-            return float(value)
-        except ValueError:
-            pass
+def parse_filter(expression: str) -> Filter:
+    """Parse a filter expression string."""
+    return Filter.parse(expression)
 
-        # Return as string (lowercase for enums)
-        return value.lower() if value.lower() in (
-            self.EXPOSURE_VALUES | self.ENCRYPTION_VALUES | {"critical", "high", "medium", "low", "minimal"}
-        ) else value
 
+@functools.lru_cache(maxsize=1024)
+def cached_filter(expression: str) -> Filter:
+    """
+    Parse a filter expression, memoized by expression string.
 
-def parse_filter(expression: str) -> Filter:
-    """Parse a filter expression string."""
+    Bounded so a stream of distinct expressions can't grow memory without
+    limit. The returned Filter is shared between callers and must not be
+    mutated.
+    """
     return Filter.parse(expression)
 
 
@@ -584,8 +899,7 @@ def matches_filter(result: Dict[str, Any], filter_expr: str) -> bool:
     if not filter_expr:
         return True
 
-    filter_obj = Filter.parse(filter_expr)
-    return filter_obj.evaluate(result)
+    return cached_filter(filter_expr).evaluate(result)
 
 
 # Helper for programmatic filter building
@@ -604,21 +918,21 @@ class FilterBuilder:
     def and_(self, field: str, operator: str, value: Any) -> "FilterBuilder":
         """Add an AND condition."""
         if self._conditions:
-            self._operators.append("AND")
+            self._operators.append(LogicalOperator.AND)
         self._conditions.append(Condition(field=field, operator=operator, value=value))
         return self
 
     def or_(self, field: str, operator: str, value: Any) -> "FilterBuilder":
         """Add an OR condition."""
         if self._conditions:
-            self._operators.append("OR")
+            self._operators.append(LogicalOperator.OR)
         self._conditions.append(Condition(field=field, operator=operator, value=value))
         return self
 
     def has(self, entity_type: str) -> "FilterBuilder":
         """Add a has(entity_type) condition."""
         if self._conditions:
-            self._operators.append("AND")
+            self._operators.append(LogicalOperator.AND)
         self._conditions.append(
             Condition(field="has_entity", operator="has", value=entity_type)
         )
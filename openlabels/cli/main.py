@@ -13,6 +13,7 @@ Usage:
 """
 
 import argparse
+import importlib
 import sys
 from typing import List, Optional
 
@@ -39,8 +40,42 @@ def cmd_version(args):
     echo("Run 'openlabels --help' for all options.")
 
 
+# Commands offered by the CLI, in help order
+COMMANDS = (
+    "scan", "read", "find", "quarantine", "tag",
+    "report", "heatmap", "gui", "health", "serve",
+)
+
+# Global options that take a value, which must not be mistaken for a command
+_VALUE_OPTIONS = ("--log-file", "--audit-log")
+
+
+def _requested_command(argv: List[str]) -> Optional[str]:
+    """The command named in argv, or None if there isn't exactly one to pick."""
+    expects_value = False
+    for arg in argv:
+        if expects_value:
+            expects_value = False
+        elif arg.startswith("-"):
+            # argparse accepts unambiguous prefixes such as --log
+            expects_value = "=" not in arg and arg.startswith("--") and any(
+                option.startswith(arg) for option in _VALUE_OPTIONS
+            )
+            if arg in ("-h", "--help"):
+                return None
+        else:
+            return arg if arg in COMMANDS else None
+    return None
+
+
 def main(argv: Optional[List[str]] = None):
     """Main CLI entry point."""
+    # A bare version probe needs no parser: answer it before the command
+    # modules (and the scanner they pull in) are imported
+    if list(sys.argv[1:] if argv is None else argv) in (["--version"], ["-V"]):
+        cmd_version(None)
+        return
+
     # Install signal handlers for graceful shutdown (Ctrl+C, SIGTERM)
     install_signal_handlers()
 
@@ -96,30 +131,13 @@ Examples:
 
     subparsers = parser.add_subparsers(dest="command", help="Commands")
 
-    # Core commands
-    from openlabels.cli.commands import (
-        add_scan_parser,
-        add_read_parser,
-        add_find_parser,
-        add_quarantine_parser,
-        add_tag_parser,
-        add_report_parser,
-        add_heatmap_parser,
-        add_gui_parser,
-        add_health_parser,
-        add_serve_parser,
-    )
-
-    add_scan_parser(subparsers)
-    add_read_parser(subparsers)
-    add_find_parser(subparsers)
-    add_quarantine_parser(subparsers)
-    add_tag_parser(subparsers)
-    add_report_parser(subparsers)
-    add_heatmap_parser(subparsers)
-    add_gui_parser(subparsers)
-    add_health_parser(subparsers)
-    add_serve_parser(subparsers)
+    # Register only the selected command when it can be told from argv, so
+    # only its module (and its dependencies) gets imported. Help, errors and
+    # anything ambiguous get the full command list.
+    command = _requested_command(sys.argv[1:] if argv is None else argv)
+    for name in (command,) if command else COMMANDS:
+        module = importlib.import_module(f"openlabels.cli.commands.{name}")
+        getattr(module, f"add_{name}_parser")(subparsers)
 
     args = parser.parse_args(argv)
 
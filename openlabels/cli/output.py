@@ -26,26 +26,76 @@ Usage:
             p.advance()
 """
 
+import functools
+import json
+import re
+import shutil
 import sys
+import threading
 from contextlib import contextmanager
-from typing import List, Optional, Tuple, Any, Generator, Dict
+from typing import TYPE_CHECKING, Any, Dict, Generator, List, Optional, Tuple
 
-from rich.console import Console
-from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-from rich.panel import Panel
-from rich.text import Text
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.progress import Progress
+
+
+class _LazyConsole:
+    """
+    Stand-in for a rich Console that is only built on first use.
+
+    Importing rich costs far more than most commands do when their output
+    is JSON written straight to stdout, so rich is imported the first time
+    the console is actually printed to or inspected.
+    """
+
+    def __init__(self, **kwargs: Any):
+        object.__setattr__(self, "_kwargs", kwargs)
+        object.__setattr__(self, "_console", None)
+
+    def get(self) -> "Console":
+        """Return the underlying rich Console, creating it if needed."""
+        if self._console is None:
+            from rich.console import Console
+            object.__setattr__(self, "_console", Console(**self._kwargs))
+        return self._console
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.get(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self.get(), name, value)
+
+    def __enter__(self) -> "Console":
+        return self.get().__enter__()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.get().__exit__(*exc_info)
 
 
 # Main console for stdout (user output)
-console = Console()
+console = _LazyConsole()
+
+# When stdout is not a terminal, plain messages skip the rich renderer:
+# styles have nothing to render to, and each console print otherwise pays
+# for markup parsing, width detection and a flush
+_fast = not sys.stdout.isatty()
+
+# Rich markup tags, optionally escaped with backslashes (see rich.markup)
+_MARKUP_TAG = re.compile(r"(\\*)\[([a-z#/@][^[]*?)]")
 
 # Error console for stderr
-_err_console = Console(stderr=True)
+_err_console = _LazyConsole(stderr=True)
 
 # Global flag to disable progress bars (set via --no-progress)
 _progress_enabled: bool = True
 
+# Progress display shared by nested progress() calls: the outermost call
+# starts it, inner calls add their task to it, and the last one out stops it
+_shared_progress: Optional["Progress"] = None
+_progress_users = 0
+_progress_lock = threading.Lock()
+
 
 def set_progress_enabled(enabled: bool) -> None:
     """Enable or disable progress bars globally."""
@@ -53,9 +103,56 @@ def set_progress_enabled(enabled: bool) -> None:
     _progress_enabled = enabled
 
 
+def is_terminal() -> bool:
+    """Check if stdout is a terminal, without building the console for a pipe."""
+    return not _fast and console.is_terminal
+
+
 def is_progress_enabled() -> bool:
     """Check if progress bars are enabled."""
-    return _progress_enabled and console.is_terminal
+    return _progress_enabled and is_terminal()
+
+
+@contextmanager
+def output_block() -> Generator[None, None, None]:
+    """
+    Group the messages printed inside the block into one write.
+
+    Piped output is already written plain, so the console is only used,
+    and built, on a terminal.
+    """
+    if _fast:
+        yield
+        return
+    with console:
+        yield
+
+
+def strip_markup(text: str) -> str:
+    """
+    Remove rich markup tags from text, keeping escaped brackets literal.
+
+    Args:
+        text: Text that may contain markup such as "[bold]...[/bold]"
+
+    Returns:
+        The text as rich would render it without styles
+    """
+    if "[" not in text:
+        return text
+
+    def replace(match: "re.Match[str]") -> str:
+        backslashes, escaped = divmod(len(match.group(1)), 2)
+        return "\\" * backslashes + (f"[{match.group(2)}]" if escaped else "")
+
+    return _MARKUP_TAG.sub(replace, text)
+
+
+def _write_plain(message: str, nl: bool = True) -> None:
+    """Write a message to stdout with its markup stripped."""
+    sys.stdout.write(strip_markup(message))
+    if nl:
+        sys.stdout.write("\n")
 
 
 def echo(message: str, style: Optional[str] = None, nl: bool = True) -> None:
@@ -67,9 +164,33 @@ def echo(message: str, style: Optional[str] = None, nl: bool = True) -> None:
         style: Optional rich style (e.g., "bold", "green", "bold red")
         nl: Whether to add a newline (default: True)
     """
+    if _fast:
+        _write_plain(message, nl)
+        return
     console.print(message, style=style, end="\n" if nl else "")
 
 
+def write_json(data: Any, indent: Optional[int] = 2) -> None:
+    """
+    Write data to stdout as JSON, bypassing the rich console.
+
+    The console would parse brackets in the JSON as markup and wrap long
+    lines at the terminal width, corrupting machine-readable output.
+    Indentation is only applied when stdout is a terminal; piped or
+    redirected output is written compact, since it is read by programs.
+
+    Args:
+        data: JSON-serializable data
+        indent: Indentation level on a terminal, or None for compact
+            single-line output everywhere
+    """
+    if not sys.stdout.isatty():
+        indent = None
+    separators = None if indent is not None else (",", ":")
+    sys.stdout.write(json.dumps(data, indent=indent, separators=separators))
+    sys.stdout.write("\n")
+
+
 def error(message: str) -> None:
     """
     Print an error message to stderr.
@@ -87,6 +208,9 @@ def warn(message: str) -> None:
     Args:
         message: The warning message
     """
+    if _fast:
+        _write_plain(f"Warning: {message}")
+        return
     console.print(f"[yellow]Warning:[/yellow] {message}")
 
 
@@ -97,6 +221,9 @@ def success(message: str) -> None:
     Args:
         message: The success message
     """
+    if _fast:
+        _write_plain(message)
+        return
     console.print(f"[green]{message}[/green]")
 
 
@@ -107,6 +234,9 @@ def info(message: str) -> None:
     Args:
         message: The info message
     """
+    if _fast:
+        _write_plain(message)
+        return
     console.print(f"[blue]{message}[/blue]")
 
 
@@ -117,6 +247,9 @@ def dim(message: str) -> None:
     Args:
         message: The message
     """
+    if _fast:
+        _write_plain(message)
+        return
     console.print(f"[dim]{message}[/dim]")
 
 
@@ -135,6 +268,8 @@ def table(
         title: Optional table title
         show_lines: Show row separator lines
     """
+    from rich.table import Table
+
     t = Table(title=title, show_lines=show_lines)
 
     for header in headers:
@@ -161,6 +296,8 @@ def results_table(
         title: Optional table title
         max_rows: Maximum rows to display (shows "and N more" if exceeded)
     """
+    from rich.table import Table
+
     t = Table(title=title)
 
     for header, _ in columns:
@@ -184,7 +321,7 @@ def results_table(
 class ProgressContext:
     """Context wrapper for progress bar operations."""
 
-    def __init__(self, progress: Progress, task_id: int):
+    def __init__(self, progress: "Progress", task_id: int):
         self._progress = progress
         self._task_id = task_id
 
@@ -201,6 +338,54 @@ class ProgressContext:
         self._progress.update(self._task_id, description=description)
 
 
+class _NoOpProgress:
+    """Progress stand-in used when progress bars are disabled."""
+
+    def advance(self, amount: int = 1) -> None:
+        pass
+
+    def update(self, completed: int) -> None:
+        pass
+
+    def set_description(self, description: str) -> None:
+        pass
+
+
+@functools.lru_cache(maxsize=2)
+def _progress_columns(determinate: bool) -> Tuple[Any, ...]:
+    """
+    Progress bar columns, built once per kind on first use.
+
+    Built lazily rather than at import so rich stays unloaded until a
+    progress bar is actually shown.
+    """
+    from rich.progress import BarColumn, SpinnerColumn, TaskProgressColumn, TextColumn
+
+    if not determinate:
+        # Indeterminate progress (spinner)
+        return (
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+        )
+    # Determinate progress (bar)
+    return (
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TaskProgressColumn(),
+    )
+
+
+def _start_progress(total: Optional[int], transient: bool) -> "Progress":
+    """Create and start a progress display on the main console."""
+    from rich.progress import Progress
+
+    columns = _progress_columns(total is not None)
+    p = Progress(*columns, console=console.get(), transient=transient)
+    p.start()
+    return p
+
+
 @contextmanager
 def progress(
     description: str,
@@ -210,6 +395,9 @@ def progress(
     """
     Context manager for progress bars.
 
+    Nested calls add a task to the display started by the outermost call
+    rather than starting another one, which would fight over the terminal.
+
     Args:
         description: Description of the operation
         total: Total number of items (None for indeterminate spinner)
@@ -224,39 +412,29 @@ def progress(
                 process(file)
                 p.advance()
     """
+    global _shared_progress, _progress_users
+
     if not is_progress_enabled():
         # Progress disabled - yield a no-op context
-        class NoOpProgress:
-            def advance(self, amount: int = 1) -> None:
-                pass
-
-            def update(self, completed: int) -> None:
-                pass
-
-            def set_description(self, description: str) -> None:
-                pass
-
-        yield NoOpProgress()
+        yield _NoOpProgress()
         return
 
-    if total is None:
-        # Indeterminate progress (spinner)
-        columns = [
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-        ]
-    else:
-        # Determinate progress (bar)
-        columns = [
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-        ]
+    with _progress_lock:
+        if _shared_progress is None:
+            _shared_progress = _start_progress(total, transient)
+        _progress_users += 1
+        shared = _shared_progress
+        task_id = shared.add_task(description, total=total)
 
-    with Progress(*columns, console=console, transient=transient) as p:
-        task_id = p.add_task(description, total=total)
-        yield ProgressContext(p, task_id)
+    try:
+        yield ProgressContext(shared, task_id)
+    finally:
+        with _progress_lock:
+            shared.remove_task(task_id)
+            _progress_users -= 1
+            if _progress_users == 0:
+                _shared_progress = None
+                shared.stop()
 
 
 def summary_box(title: str, items: List[Tuple[str, Any]]) -> None:
@@ -267,14 +445,25 @@ def summary_box(title: str, items: List[Tuple[str, Any]]) -> None:
         title: Box title
         items: List of (label, value) tuples
     """
+    from rich.panel import Panel
+
     content = "\n".join(f"[bold]{label}:[/bold] {value}" for label, value in items)
     console.print(Panel(content, title=title, border_style="blue"))
 
 
+@functools.lru_cache(maxsize=8)
+def _bar(char: str, width: int) -> str:
+    """Divider line of a given character and width, built once per pair."""
+    return char * width
+
+
 def divider(char: str = "─", style: str = "dim") -> None:
     """Print a horizontal divider line."""
+    if _fast:
+        sys.stdout.write(_bar(char, shutil.get_terminal_size().columns) + "\n")
+        return
     width = console.width or 60
-    console.print(char * width, style=style)
+    console.print(_bar(char, width), style=style)
 
 
 def confirm(message: str, default: bool = False) -> bool:
@@ -315,6 +504,29 @@ def confirm_destructive(message: str, confirmation_word: str = "DELETE") -> bool
     return response == confirmation_word
 
 
+def format_entity_counts(
+    entities: Dict[str, int],
+    sep: str = ", ",
+    empty: str = "-",
+    sort: bool = False,
+) -> str:
+    """
+    Format entity counts as "TYPE(count)" items, e.g. "EMAIL(2), SSN(1)".
+
+    Args:
+        entities: Dictionary of entity type -> count
+        sep: Separator between items
+        empty: Text returned when there are no entities
+        sort: Order items by entity type
+    """
+    if not entities:
+        return empty
+    items = sorted(entities.items()) if sort else entities.items()
+    # One %-template applied over a list comprehension: cheaper than an
+    # f-string per item inside a generator on large entity maps
+    return sep.join(["%s(%s)" % item for item in items])
+
+
 # Risk tier colors for Rich
 TIER_STYLES = {
     "CRITICAL": "bold white on red",
@@ -350,6 +562,8 @@ def risk_table(
         max_rows: Maximum rows to display
         show_entities: Whether to show entities column
     """
+    from rich.table import Table
+
     t = Table(title=title, show_lines=False)
 
     t.add_column("Path", style="cyan", no_wrap=True, max_width=50)
@@ -384,7 +598,7 @@ def risk_table(
         # Format entities
         if show_entities:
             if isinstance(entities, dict):
-                entities_str = " ".join(f"{k}({v})" for k, v in entities.items()) if entities else "-"
+                entities_str = format_entity_counts(entities, sep=" ")
             else:
                 entities_str = str(entities) if entities else "-"
             t.add_row(path, score_text, tier_text, entities_str)
@@ -410,14 +624,13 @@ def summary_panel(
         stats: Dictionary of stat name -> value
         style: Border style color
     """
-    lines = []
-    for key, value in stats.items():
-        if isinstance(value, float):
-            lines.append(f"[bold]{key}:[/bold] {value:.1f}")
-        else:
-            lines.append(f"[bold]{key}:[/bold] {value}")
+    from rich.panel import Panel
 
-    content = " | ".join(lines)
+    content = " | ".join([
+        f"[bold]{key}:[/bold] {value:.1f}" if isinstance(value, float)
+        else f"[bold]{key}:[/bold] {value}"
+        for key, value in stats.items()
+    ])
     console.print(Panel(content, title=title, border_style=style))
 
 
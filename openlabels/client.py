@@ -48,11 +48,14 @@ Architecture:
     >>> result = scorer.score_text("SSN: 123-45-6789")
 """
 
+import functools
+import os
 from pathlib import Path
 from typing import Any, Callable, Dict, Iterator, List, Optional, Union
 
 from .context import Context, get_default_context
 from .adapters.base import Adapter, NormalizedInput
+from .core.constants import SCORE_FILE_CACHE_SIZE
 from .core.scorer import ScoringResult
 from .core.types import (
     ScanResult,
@@ -64,6 +67,7 @@ from .core.types import (
 )
 from .components.scorer import Scorer
 from .components.scanner import Scanner
+from .components.scan_cache import ScanCache
 from .components.fileops import FileOps, QuarantineResult, DeleteResult
 from .components.reporter import Reporter
 
@@ -106,6 +110,7 @@ class Client:
         self,
         context: Optional[Context] = None,
         default_exposure: str = "PRIVATE",
+        cache_path: Optional[Union[str, Path]] = None,
     ):
         """
         Initialize the client.
@@ -115,6 +120,10 @@ class Client:
                     If None, uses the default shared context.
             default_exposure: Default exposure level when not specified.
                              One of: PRIVATE, INTERNAL, ORG_WIDE, PUBLIC
+            cache_path: Optional SQLite file caching scan results on disk.
+                       Rescans skip detection for files whose mtime and
+                       size are unchanged. Call close(), or use the client
+                       as a context manager, to commit and release it.
 
         Note:
             If both context and a non-default exposure are specified,
@@ -132,10 +141,35 @@ class Client:
 
         # Initialize components
         self._scorer = Scorer(context)
-        self._scanner = Scanner(context, self._scorer)
+        self._scan_cache = ScanCache(cache_path) if cache_path else None
+        self._scanner = Scanner(context, self._scorer, cache=self._scan_cache)
         self._fileops = FileOps(context, self._scanner)
         self._reporter = Reporter(context, self._scanner)
 
+        # Per-instance memo for score_file(); bound here rather than as a
+        # class-level decorator so the cache doesn't keep the Client alive.
+        self._score_file_cached = functools.lru_cache(
+            maxsize=SCORE_FILE_CACHE_SIZE,
+        )(self._score_file_keyed)
+
+    def close(self) -> None:
+        """
+        Commit and close the on-disk scan cache, if any.
+
+        The context is left open, since it may be shared with other
+        clients. Don't scan with the client after closing it.
+        """
+        if self._scan_cache is not None:
+            self._scan_cache.close()
+            self._scan_cache = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
     @property
     def context(self) -> Context:
         """Access the underlying context."""
@@ -171,21 +205,50 @@ class Client:
         path: Union[str, Path],
         adapters: Optional[List[Adapter]] = None,
         exposure: Optional[str] = None,
+        use_cache: bool = True,
     ) -> ScoringResult:
         """
         Score a local file for data risk.
 
         If no adapters specified, uses the built-in scanner for detection.
+        Scanner results are memoized per (path, mtime, size, exposure), so
+        repeat calls for an unchanged file return the cached result.
 
         Args:
             path: Path to file to scan
             adapters: Optional list of adapters to use. If None, uses scanner.
             exposure: Exposure level override (PRIVATE, INTERNAL, ORG_WIDE, PUBLIC).
+            use_cache: If False, always re-scan the file (default True)
 
         Returns:
             ScoringResult with score, tier, and breakdown
         """
-        return self._scorer.score_file(path, adapters=adapters, exposure=exposure)
+        if adapters or not use_cache:
+            return self._scorer.score_file(path, adapters=adapters, exposure=exposure)
+
+        abs_path = os.path.abspath(os.fspath(path))
+        try:
+            st = os.stat(abs_path)
+        except OSError:
+            # Let the scorer raise its usual FileNotFoundError
+            return self._scorer.score_file(path, exposure=exposure)
+
+        exposure = (exposure or self.default_exposure).upper()
+        return self._score_file_cached(abs_path, st.st_mtime_ns, st.st_size, exposure)
+
+    def _score_file_keyed(
+        self,
+        path: str,
+        mtime_ns: int,
+        size: int,
+        exposure: str,
+    ) -> ScoringResult:
+        """Uncached scoring target for the score_file() memo (mtime_ns/size are cache keys only)."""
+        return self._scorer.score_file(path, exposure=exposure)
+
+    def clear_score_cache(self) -> None:
+        """Drop all memoized score_file() results."""
+        self._score_file_cached.cache_clear()
 
     def score_text(
         self,
@@ -230,6 +293,8 @@ class Client:
         include_hidden: bool = False,
         max_files: Optional[int] = None,
         on_progress: Optional[Callable[[str], None]] = None,
+        max_workers: int = 1,
+        preserve_order: bool = False,
     ) -> Iterator[ScanResult]:
         """
         Scan files and yield results as they complete.
@@ -242,6 +307,8 @@ class Client:
             include_hidden: Include hidden files/directories (default False)
             max_files: Maximum number of files to scan (None = unlimited)
             on_progress: Optional callback for progress updates
+            max_workers: Threads scanning files concurrently (default 1, serial)
+            preserve_order: With several workers, yield results in walk order
 
         Yields:
             ScanResult for each file scanned
@@ -254,6 +321,8 @@ class Client:
             include_hidden=include_hidden,
             max_files=max_files,
             on_progress=on_progress,
+            max_workers=max_workers,
+            preserve_order=preserve_order,
         )
 
     def find(
@@ -289,6 +358,7 @@ class Client:
         self,
         path: Union[str, Path],
         max_depth: Optional[int] = None,
+        max_workers: int = 1,
     ) -> TreeNode:
         """
         Build a risk tree for directory visualization.
@@ -296,11 +366,12 @@ class Client:
         Args:
             path: Root directory to scan
             max_depth: Maximum depth to recurse (None = unlimited)
+            max_workers: Threads scanning files concurrently (default 1, serial)
 
         Returns:
             TreeNode representing the directory tree with risk data
         """
-        return self._scanner.scan_tree(path, max_depth=max_depth)
+        return self._scanner.scan_tree(path, max_depth=max_depth, max_workers=max_workers)
 
     def quarantine(
         self,
@@ -311,6 +382,7 @@ class Client:
         min_score: Optional[int] = None,
         recursive: bool = True,
         dry_run: bool = False,
+        max_workers: int = 1,
     ) -> QuarantineResult:
         """
         Move files matching criteria to quarantine.
@@ -323,6 +395,7 @@ class Client:
             min_score: Minimum score to quarantine
             recursive: Recurse into subdirectories
             dry_run: If True, don't actually move files
+            max_workers: Threads moving files concurrently (default 1, serial)
 
         Returns:
             QuarantineResult with counts and moved file list
@@ -335,6 +408,7 @@ class Client:
             min_score=min_score,
             recursive=recursive,
             dry_run=dry_run,
+            max_workers=max_workers,
         )
 
     def move(
@@ -363,6 +437,7 @@ class Client:
         recursive: bool = True,
         confirm: bool = True,
         dry_run: bool = False,
+        max_workers: int = 1,
     ) -> DeleteResult:
         """
         Delete files matching criteria.
@@ -377,6 +452,7 @@ class Client:
             recursive: Recurse into subdirectories
             confirm: If True, requires explicit confirmation
             dry_run: If True, don't actually delete files
+            max_workers: Threads deleting files concurrently (default 1, serial)
 
         Returns:
             DeleteResult with counts and deleted file list
@@ -389,6 +465,7 @@ class Client:
             recursive=recursive,
             confirm=confirm,
             dry_run=dry_run,
+            max_workers=max_workers,
         )
 
     def report(
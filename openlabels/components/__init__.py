@@ -6,11 +6,13 @@ Focused classes extracted from the monolithic Client:
 - Scanner: File/directory scanning
 - FileOps: File operations (quarantine, move, delete)
 - Reporter: Report generation
+- ScanCache: On-disk cache of scan results for incremental rescans
 """
 
 from .scorer import Scorer
 from .scanner import Scanner
 from .fileops import FileOps
 from .reporter import Reporter
+from .scan_cache import ScanCache
 
-__all__ = ["Scorer", "Scanner", "FileOps", "Reporter"]
+__all__ = ["Scorer", "Scanner", "FileOps", "Reporter", "ScanCache"]
@@ -5,18 +5,26 @@ Handles file operations: quarantine, move, delete.
 Provides structured error classification with retryability information.
 """
 
+import collections
 import errno
+import functools
 import json
 import logging
 import os
 import shutil
 import stat as stat_module
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union, TYPE_CHECKING
+from typing import (
+    Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, TypeVar,
+    Union, TYPE_CHECKING,
+)
 
-from ..core.types import FilterCriteria, OperationResult
+from ..core.constants import DATACLASS_SLOTS
+from ..core.types import FilterCriteria, OperationResult, ScanResult
 from ..core.exceptions import FileErrorType, FileOperationError
 from ..utils.hashing import quick_hash
 
@@ -30,6 +38,42 @@ logger = logging.getLogger(__name__)
 # Manifest file for tracking idempotent operations
 QUARANTINE_MANIFEST = ".quarantine_manifest.json"
 
+# Operations queued per worker thread, so a large scan can't outrun the pool
+_IN_FLIGHT_PER_WORKER = 4
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+def _map_bounded(
+    func: Callable[[_T], _R],
+    items: Iterable[_T],
+    max_workers: int,
+) -> Iterator[_R]:
+    """
+    Map func over items on a thread pool, yielding results in input order.
+
+    At most max_workers * _IN_FLIGHT_PER_WORKER calls are queued at once,
+    so items are pulled from the iterator only as results are consumed.
+    With one worker, func runs inline.
+    """
+    if max_workers <= 1:
+        yield from map(func, items)
+        return
+
+    window = max_workers * _IN_FLIGHT_PER_WORKER
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        queue: "collections.deque" = collections.deque()
+        for item in items:
+            queue.append(executor.submit(func, item))
+            if len(queue) >= window:
+                yield queue.popleft().result()
+        while queue:
+            yield queue.popleft().result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
 
 @dataclass
 class FileError:
@@ -60,7 +104,7 @@ class FileError:
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class QuarantineResult:
     """Result of a quarantine operation."""
     moved_count: int
@@ -81,7 +125,7 @@ class QuarantineResult:
         self.permanent_errors = self.error_count - self.retryable_errors
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DeleteResult:
     """Result of a delete operation."""
     deleted_count: int
@@ -124,6 +168,8 @@ class FileOps:
     def __init__(self, context: "Context", scanner: "Scanner"):
         self._ctx = context
         self._scanner = scanner
+        # Serializes manifest read-modify-write when moves run in parallel
+        self._manifest_lock = threading.Lock()
 
     def _load_manifest(self, manifest_path: Path) -> Dict[str, Any]:
         """Load quarantine manifest file."""
@@ -168,10 +214,16 @@ class FileOps:
         source: Path,
         dest: Path,
         manifest_path: Path,
+        created_dirs: Optional[Set[Path]] = None,
+        same_device: bool = False,
     ) -> tuple[bool, Optional[FileError]]:
         """
         Perform idempotent file move operation.
 
+        created_dirs holds destination directories already made in this
+        run, so their mkdir is skipped. same_device says source and dest
+        share a filesystem, so the move can be a single rename.
+
         Handles retry scenarios where:
         - Source is gone but dest exists (already moved)
         - Source is gone and in manifest (already processed)
@@ -276,22 +328,45 @@ class FileOps:
 
         # Case 4: Normal case - source exists, dest doesn't
         try:
-            dest.parent.mkdir(parents=True, exist_ok=True)
+            if created_dirs is None or dest.parent not in created_dirs:
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                if created_dirs is not None:
+                    created_dirs.add(dest.parent)
             source_hash = quick_hash(source)
-            shutil.move(str(source), str(dest))
+            self._move_file(source, dest, same_device)
 
             # Record in manifest (hash may be None if file was unreadable)
-            manifest = self._load_manifest(manifest_path)
-            manifest.setdefault("processed", {})[str(source)] = {
-                "dest": str(dest),
-                "hash": source_hash,
-            }
-            self._save_manifest(manifest_path, manifest)
+            with self._manifest_lock:
+                manifest = self._load_manifest(manifest_path)
+                manifest.setdefault("processed", {})[str(source)] = {
+                    "dest": str(dest),
+                    "hash": source_hash,
+                }
+                self._save_manifest(manifest_path, manifest)
 
             return True, None
         except OSError as e:
             return False, FileError.from_exception(e, str(source))
 
+    @staticmethod
+    def _move_file(source: Path, dest: Path, same_device: bool = True) -> None:
+        """
+        Move a file, as one rename unless the ends are known to be on
+        different filesystems.
+
+        Falls back to shutil.move when the rename crosses devices, or when
+        dest is an existing directory, which shutil.move moves into.
+        """
+        if same_device:
+            try:
+                os.replace(source, dest)
+                return
+            except OSError as e:
+                # A mount point inside the tree can still cross devices
+                if e.errno != errno.EXDEV and not dest.is_dir():
+                    raise
+        shutil.move(str(source), str(dest))
+
     def quarantine(
         self,
         source: Union[str, Path],
@@ -301,6 +376,7 @@ class FileOps:
         min_score: Optional[int] = None,
         recursive: bool = True,
         dry_run: bool = False,
+        max_workers: int = 1,
     ) -> QuarantineResult:
         """
         Move files matching criteria to quarantine.
@@ -313,6 +389,7 @@ class FileOps:
             min_score: Minimum score to quarantine
             recursive: Recurse into subdirectories
             dry_run: If True, don't actually move files
+            max_workers: Threads moving files concurrently (1 = serial)
 
         Returns:
             QuarantineResult with counts and moved file list
@@ -324,62 +401,40 @@ class FileOps:
         moved_files: List[Dict[str, Any]] = []
         errors: List[Dict[str, str]] = []
 
+        created_dirs: Set[Path] = set()
+        same_device = False
         if not dry_run:
             destination.mkdir(parents=True, exist_ok=True)
-
-        for result in self._scanner.scan(
+            created_dirs.add(destination)
+            try:
+                same_device = source.stat().st_dev == destination.stat().st_dev
+            except OSError:
+                pass
+
+        manifest_path = destination / QUARANTINE_MANIFEST
+        quarantine_one = functools.partial(
+            self._quarantine_one,
+            source=source,
+            destination=destination,
+            manifest_path=manifest_path,
+            created_dirs=created_dirs,
+            same_device=same_device,
+            dry_run=dry_run,
+        )
+        results = self._scanner.scan(
             source,
             recursive=recursive,
             filter_criteria=filter_criteria,
             filter_expr=filter_expr,
-        ):
-            if result.error:
-                # Scan errors are not file operation errors
-                errors.append({
-                    "path": result.path,
-                    "error_type": FileErrorType.UNKNOWN.value,
-                    "message": result.error,
-                    "retryable": False,
-                })
-                continue
-
-            try:
-                rel_path = Path(result.path).relative_to(source)
-            except ValueError:
-                rel_path = Path(result.path).name
-
-            dest_path = destination / rel_path
+        )
 
-            if dry_run:
-                moved_files.append({
-                    "source": result.path,
-                    "destination": str(dest_path),
-                    "score": result.score,
-                    "tier": result.tier,
-                    "dry_run": True,
-                })
-            else:
-                manifest_path = destination / QUARANTINE_MANIFEST
-                success, file_error = self._idempotent_move(
-                    Path(result.path), dest_path, manifest_path
-                )
-                if success:
-                    moved_files.append({
-                        "source": result.path,
-                        "destination": str(dest_path),
-                        "score": result.score,
-                        "tier": result.tier,
-                    })
-                else:
-                    if file_error:
-                        errors.append(file_error.to_dict())
-                    else:
-                        errors.append({
-                            "path": result.path,
-                            "error_type": FileErrorType.UNKNOWN.value,
-                            "message": "Unknown error",
-                            "retryable": False,
-                        })
+        # Dry runs touch nothing, so only real moves go to the pool
+        workers = 1 if dry_run else max_workers
+        for moved, error in _map_bounded(quarantine_one, results, workers):
+            if moved is not None:
+                moved_files.append(moved)
+            if error is not None:
+                errors.append(error)
 
         return QuarantineResult(
             moved_count=len(moved_files),
@@ -389,6 +444,62 @@ class FileOps:
             destination=str(destination),
         )
 
+    def _quarantine_one(
+        self,
+        result: ScanResult,
+        source: Path,
+        destination: Path,
+        manifest_path: Path,
+        created_dirs: Set[Path],
+        same_device: bool,
+        dry_run: bool,
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """Quarantine one scan result, returning (moved entry, error)."""
+        if result.error:
+            # Scan errors are not file operation errors
+            return None, {
+                "path": result.path,
+                "error_type": FileErrorType.UNKNOWN.value,
+                "message": result.error,
+                "retryable": False,
+            }
+
+        try:
+            rel_path = Path(result.path).relative_to(source)
+        except ValueError:
+            rel_path = Path(result.path).name
+
+        dest_path = destination / rel_path
+
+        if dry_run:
+            return {
+                "source": result.path,
+                "destination": str(dest_path),
+                "score": result.score,
+                "tier": result.tier,
+                "dry_run": True,
+            }, None
+
+        success, file_error = self._idempotent_move(
+            Path(result.path), dest_path, manifest_path,
+            created_dirs=created_dirs, same_device=same_device,
+        )
+        if success:
+            return {
+                "source": result.path,
+                "destination": str(dest_path),
+                "score": result.score,
+                "tier": result.tier,
+            }, None
+        if file_error:
+            return None, file_error.to_dict()
+        return None, {
+            "path": result.path,
+            "error_type": FileErrorType.UNKNOWN.value,
+            "message": "Unknown error",
+            "retryable": False,
+        }
+
     def move(
         self,
         source: Union[str, Path],
@@ -451,7 +562,7 @@ class FileOps:
                 )
 
             destination.parent.mkdir(parents=True, exist_ok=True)  # CVE-READY-002: no exists() check
-            shutil.move(str(source), str(destination))
+            self._move_file(source, destination)
 
             return OperationResult(
                 success=True,
@@ -482,6 +593,7 @@ class FileOps:
         recursive: bool = True,
         confirm: bool = True,
         dry_run: bool = False,
+        max_workers: int = 1,
     ) -> DeleteResult:
         """
         Delete files matching criteria.
@@ -496,6 +608,7 @@ class FileOps:
             recursive: Recurse into subdirectories
             confirm: If True, requires explicit confirmation
             dry_run: If True, don't actually delete files
+            max_workers: Threads deleting files concurrently (1 = serial)
 
         Returns:
             DeleteResult with counts and deleted file list
@@ -574,31 +687,19 @@ class FileOps:
                 )
 
         # Directory
-        for result in self._scanner.scan(
+        results = self._scanner.scan(
             path,
             recursive=recursive,
             filter_criteria=filter_criteria,
             filter_expr=filter_expr,
-        ):
-            if result.error:
-                # Scan errors
-                errors.append({
-                    "path": result.path,
-                    "error_type": FileErrorType.UNKNOWN.value,
-                    "message": result.error,
-                    "retryable": False,
-                })
-                continue
-
-            if dry_run:
-                deleted_files.append(result.path)
-            else:
-                try:
-                    Path(result.path).unlink()
-                    deleted_files.append(result.path)
-                except OSError as e:
-                    file_error = FileError.from_exception(e, result.path)
-                    errors.append(file_error.to_dict())
+        )
+        delete_one = functools.partial(self._delete_one, dry_run=dry_run)
+        workers = 1 if dry_run else max_workers
+        for deleted, error in _map_bounded(delete_one, results, workers):
+            if deleted is not None:
+                deleted_files.append(deleted)
+            if error is not None:
+                errors.append(error)
 
         return DeleteResult(
             deleted_count=len(deleted_files),
@@ -607,6 +708,29 @@ class FileOps:
             errors=errors,
         )
 
+    @staticmethod
+    def _delete_one(
+        result: ScanResult,
+        dry_run: bool,
+    ) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """Delete one scan result's file, returning (deleted path, error)."""
+        if result.error:
+            # Scan errors
+            return None, {
+                "path": result.path,
+                "error_type": FileErrorType.UNKNOWN.value,
+                "message": result.error,
+                "retryable": False,
+            }
+
+        if dry_run:
+            return result.path, None
+        try:
+            Path(result.path).unlink()
+            return result.path, None
+        except OSError as e:
+            return None, FileError.from_exception(e, result.path).to_dict()
+
     def _build_filter_criteria(
         self,
         filter_criteria: Optional[FilterCriteria],
@@ -4,14 +4,70 @@ OpenLabels Reporter Component.
 Handles report generation in various formats.
 """
 
+import heapq
 import html
 import json
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from operator import itemgetter
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union, TYPE_CHECKING
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union, TYPE_CHECKING
 
 from ..core.types import ScanResult, ReportFormat, ReportConfig
 
+# Optional orjson for faster JSON/JSONL reports
+_ORJSON_AVAILABLE = False
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None  # type: ignore
+
+# Tier rank for sorting, highest risk first when descending
+_TIER_ORDER = {"CRITICAL": 5, "HIGH": 4, "MEDIUM": 3, "LOW": 2, "MINIMAL": 1}
+_TIER_NAMES = tuple(_TIER_ORDER)
+
+# CSV report columns, in order
+_CSV_COLUMNS = ("path", "score", "tier", "size_bytes", "file_type")
+_csv_row = itemgetter(*_CSV_COLUMNS)
+
+# Output buffer for report files, so large reports reach disk in few writes
+_WRITE_BUFFER_SIZE = 1 << 20
+
+_HTML_TIER_COLORS = {
+    "CRITICAL": "#dc3545",
+    "HIGH": "#fd7e14",
+    "MEDIUM": "#ffc107",
+    "LOW": "#28a745",
+    "MINIMAL": "#6c757d",
+}
+
+# One HTML report table row: path, score, tier color, tier, size
+_html_row = """        <tr>
+            <td>{}</td>
+            <td>{}</td>
+            <td><span class="tier" style="background:{}">{}</span></td>
+            <td>{:,}</td>
+        </tr>
+""".format
+
+_SORT_KEYS = {
+    "score": lambda r: r.score,
+    "path": lambda r: r.path,
+    "tier": lambda r: _TIER_ORDER.get(r.tier, 0),
+}
+
+
+def _orjson_dumps(obj: Any, option: int) -> Optional[bytes]:
+    """Encode obj with orjson (which must be available), or None if it rejects obj."""
+    try:
+        return orjson.dumps(obj, option=option)
+    except orjson.JSONEncodeError:
+        # Lone surrogates (non-UTF-8 filenames from the scandir walk) are
+        # rejected by orjson; the json module escapes them instead
+        return None
+
 if TYPE_CHECKING:
     from ..context import Context
     from .scanner import Scanner
@@ -63,22 +119,23 @@ class Reporter:
         if config is None:
             config = ReportConfig(format=format)
 
-        results: List[ScanResult] = []
-        for result in self._scanner.scan(path, recursive=recursive):
-            if not result.error:
-                results.append(result)
-
-        # Sort results
-        if config.sort_by == "score":
-            results.sort(key=lambda r: r.score, reverse=config.sort_descending)
-        elif config.sort_by == "path":
-            results.sort(key=lambda r: r.path, reverse=config.sort_descending)
-        elif config.sort_by == "tier":
-            tier_order = {"CRITICAL": 5, "HIGH": 4, "MEDIUM": 3, "LOW": 2, "MINIMAL": 1}
-            results.sort(key=lambda r: tier_order.get(r.tier, 0), reverse=config.sort_descending)
-
-        if config.limit:
-            results = results[:config.limit]
+        scanned = (
+            result for result in self._scanner.scan(path, recursive=recursive)
+            if not result.error
+        )
+        sort_key = _SORT_KEYS.get(config.sort_by)
+
+        # With a limit only the top results are kept, not the whole scan.
+        # nlargest/nsmallest give the same order as a stable sort + slice.
+        if config.limit and sort_key:
+            select = heapq.nlargest if config.sort_descending else heapq.nsmallest
+            results = select(config.limit, scanned, key=sort_key)
+        elif config.limit:
+            results = list(islice(scanned, config.limit))
+        else:
+            results = list(scanned)
+            if sort_key:
+                results.sort(key=sort_key, reverse=config.sort_descending)
 
         report = self._build_report(results, config)
 
@@ -87,47 +144,93 @@ class Reporter:
 
         return report
 
+    def write_reports(
+        self,
+        report: Dict[str, Any],
+        outputs: Sequence[Tuple[Union[str, Path], ReportFormat]],
+    ) -> None:
+        """
+        Write one report to several files, e.g. as HTML, JSON and CSV.
+
+        Each file is written on its own thread, so slow disks or network
+        filesystems take as long as the slowest file rather than the sum.
+
+        Args:
+            report: Report data, as returned by report()
+            outputs: (output path, format) pairs
+
+        Example:
+            >>> report = reporter.report("/data")
+            >>> reporter.write_reports(report, [
+            ...     ("risk.html", ReportFormat.HTML),
+            ...     ("risk.csv", ReportFormat.CSV),
+            ... ])
+        """
+        if len(outputs) <= 1:
+            for output, format in outputs:
+                self._write_report(report, output, ReportConfig(format=format))
+            return
+
+        with ThreadPoolExecutor(max_workers=len(outputs)) as executor:
+            # list() re-raises the first failed write, once all have finished
+            list(executor.map(
+                lambda target: self._write_report(report, target[0], ReportConfig(format=target[1])),
+                outputs,
+            ))
+
     def _build_report(
         self,
         results: List[ScanResult],
         config: ReportConfig,
     ) -> Dict[str, Any]:
         """Build report data structure."""
-        total_files = len(results)
-        total_size = sum(r.size_bytes for r in results)
-        scores = [r.score for r in results]
+        # One pass over the results for both the summary and the file list
+        total_size = 0
+        total_score = 0
+        max_score = min_score = None
+        tier_counts = dict.fromkeys(_TIER_NAMES, 0)
+        include_entities = config.include_entities
 
-        tier_counts = {"CRITICAL": 0, "HIGH": 0, "MEDIUM": 0, "LOW": 0, "MINIMAL": 0}
+        files = []
         for r in results:
+            score = r.score
+            total_size += r.size_bytes
+            total_score += score
+            if max_score is None:
+                max_score = min_score = score
+            elif score > max_score:
+                max_score = score
+            elif score < min_score:
+                min_score = score
+
             tier = r.tier.upper()
             if tier in tier_counts:
                 tier_counts[tier] += 1
 
-        summary = {
-            "total_files": total_files,
-            "total_size_bytes": total_size,
-            "average_score": sum(scores) / len(scores) if scores else 0,
-            "max_score": max(scores) if scores else 0,
-            "min_score": min(scores) if scores else 0,
-            "tier_distribution": tier_counts,
-        }
-
-        files = []
-        for r in results:
             file_entry = {
                 "path": r.path,
-                "score": r.score,
+                "score": score,
                 "tier": r.tier,
                 "size_bytes": r.size_bytes,
                 "file_type": r.file_type,
             }
-            if config.include_entities and r.entities:
+            if include_entities and r.entities:
                 file_entry["entities"] = [
                     {"type": e.type, "count": e.count, "confidence": e.confidence}
                     for e in r.entities
                 ]
             files.append(file_entry)
 
+        total_files = len(files)
+        summary = {
+            "total_files": total_files,
+            "total_size_bytes": total_size,
+            "average_score": total_score / total_files if total_files else 0,
+            "max_score": max_score if total_files else 0,
+            "min_score": min_score if total_files else 0,
+            "tier_distribution": tier_counts,
+        }
+
         return {
             "title": config.title,
             "generated_at": datetime.utcnow().isoformat(),
@@ -146,30 +249,35 @@ class Reporter:
         output.parent.mkdir(parents=True, exist_ok=True)
 
         if config.format == ReportFormat.JSON:
-            with open(output, 'w') as f:
-                json.dump(report, f, indent=2)
+            data = _orjson_dumps(report, orjson.OPT_INDENT_2) if _ORJSON_AVAILABLE else None
+            if data is not None:
+                output.write_bytes(data)
+            else:
+                with open(output, 'w', buffering=_WRITE_BUFFER_SIZE) as f:
+                    json.dump(report, f, indent=2)
 
         elif config.format == ReportFormat.JSONL:
-            with open(output, 'w') as f:
-                for file_entry in report.get("files", []):
-                    f.write(json.dumps(file_entry) + '\n')
+            files = report.get("files", [])
+            if _ORJSON_AVAILABLE:
+                with open(output, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+                    f.writelines(
+                        _orjson_dumps(file_entry, orjson.OPT_APPEND_NEWLINE)
+                        or (json.dumps(file_entry) + '\n').encode()
+                        for file_entry in files
+                    )
+            else:
+                with open(output, 'w', buffering=_WRITE_BUFFER_SIZE) as f:
+                    f.writelines(json.dumps(file_entry) + '\n' for file_entry in files)
 
         elif config.format == ReportFormat.CSV:
             import csv
-            with open(output, 'w', newline='') as f:
+            with open(output, 'w', newline='', buffering=_WRITE_BUFFER_SIZE) as f:
                 writer = csv.writer(f)
-                writer.writerow(["path", "score", "tier", "size_bytes", "file_type"])
-                for file_entry in report.get("files", []):
-                    writer.writerow([
-                        file_entry["path"],
-                        file_entry["score"],
-                        file_entry["tier"],
-                        file_entry["size_bytes"],
-                        file_entry["file_type"],
-                    ])
+                writer.writerow(_CSV_COLUMNS)
+                writer.writerows(map(_csv_row, report.get("files", [])))
 
         elif config.format == ReportFormat.MARKDOWN:
-            with open(output, 'w') as f:
+            with open(output, 'w', buffering=_WRITE_BUFFER_SIZE) as f:
                 f.write(f"# {report['title']}\n\n")
                 f.write(f"Generated: {report['generated_at']}\n\n")
                 f.write("## Summary\n\n")
@@ -183,29 +291,33 @@ class Reporter:
                 f.write("\n## Files\n\n")
                 f.write("| Path | Score | Tier |\n")
                 f.write("|------|-------|------|\n")
-                for file_entry in report.get("files", []):
-                    f.write(f"| {file_entry['path']} | {file_entry['score']} | {file_entry['tier']} |\n")
+                f.writelines(
+                    f"| {file_entry['path']} | {file_entry['score']} | {file_entry['tier']} |\n"
+                    for file_entry in report.get("files", [])
+                )
 
         elif config.format == ReportFormat.HTML:
-            with open(output, 'w') as f:
-                f.write(self._generate_html_report(report))
+            with open(output, 'w', buffering=_WRITE_BUFFER_SIZE) as f:
+                f.writelines(self._iter_html_report(report))
 
     def _generate_html_report(self, report: Dict[str, Any]) -> str:
         """Generate HTML report content with XSS protection."""
+        return "".join(self._iter_html_report(report))
+
+    def _iter_html_report(self, report: Dict[str, Any]) -> Iterator[str]:
+        """
+        Yield HTML report content piece by piece.
+
+        Yields the header, one piece per file row, then the footer, so a
+        large report can be written without building the whole document.
+        """
         summary = report["summary"]
-        tier_colors = {
-            "CRITICAL": "#dc3545",
-            "HIGH": "#fd7e14",
-            "MEDIUM": "#ffc107",
-            "LOW": "#28a745",
-            "MINIMAL": "#6c757d",
-        }
 
         # Escape user-controlled data to prevent XSS
         safe_title = html.escape(str(report.get('title', '')))
         safe_generated_at = html.escape(str(report.get('generated_at', '')))
 
-        html_content = f"""<!DOCTYPE html>
+        yield f"""<!DOCTYPE html>
 <html>
 <head>
     <title>{safe_title}</title>
@@ -234,18 +346,23 @@ class Reporter:
     <table>
         <tr><th>Path</th><th>Score</th><th>Tier</th><th>Size</th></tr>
 """
+        escape = html.escape
+        # Tiers repeat, so each one's color and escaped name is worked out once
+        tier_cells = {}
         for f in report.get("files", []):
-            safe_tier = html.escape(str(f.get('tier', 'MINIMAL')))
-            tier_color = tier_colors.get(f.get('tier', ''), '#6c757d')
-            safe_path = html.escape(str(f.get('path', '')))
-            html_content += f"""        <tr>
-            <td>{safe_path}</td>
-            <td>{f.get('score', 0)}</td>
-            <td><span class="tier" style="background:{tier_color}">{safe_tier}</span></td>
-            <td>{f.get('size_bytes', 0):,}</td>
-        </tr>
-"""
-        html_content += """    </table>
+            tier = f.get('tier', 'MINIMAL')
+            cells = tier_cells.get(tier)
+            if cells is None:
+                cells = tier_cells[tier] = (
+                    _HTML_TIER_COLORS.get(tier, '#6c757d'),
+                    escape(str(tier)),
+                )
+            yield _html_row(
+                escape(str(f.get('path', ''))),
+                f.get('score', 0),
+                *cells,
+                f.get('size_bytes', 0),
+            )
+        yield """    </table>
 </body>
 </html>"""
-        return html_content
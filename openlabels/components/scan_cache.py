@@ -0,0 +1,161 @@
+"""
+OpenLabels Scan Cache.
+
+On-disk cache of scoring results for incremental rescans.
+
+Entries are keyed by path and checked against the file's mtime_ns, size
+and the exposure it was scored under, so a changed file misses the cache
+automatically. Results are stored as JSON rather than pickled, so a
+tampered cache file can't run code.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+from ..core.constants import SCAN_CACHE_COMMIT_INTERVAL
+from ..core.scorer import RiskTier, ScoringResult
+
+logger = logging.getLogger(__name__)
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scan_cache (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    exposure TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    tier TEXT NOT NULL,
+    content_hash TEXT,
+    result TEXT NOT NULL
+)
+"""
+
+
+class ScanCache:
+    """
+    SQLite-backed cache of per-file scoring results.
+
+    Safe to share between scanner threads: one connection is used,
+    guarded by a lock. Writes are committed in batches of
+    SCAN_CACHE_COMMIT_INTERVAL; call flush() to commit the rest.
+
+    Example:
+        >>> cache = ScanCache("~/.openlabels/scan_cache.db")
+        >>> cached = cache.get("/data/a.csv", st.st_mtime_ns, st.st_size, "PRIVATE")
+        >>> if cached is None:
+        ...     cache.put("/data/a.csv", st.st_mtime_ns, st.st_size, "PRIVATE", result)
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self._path = Path(path).expanduser()
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._pending = 0
+
+        self._conn = sqlite3.connect(str(self._path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def get(
+        self,
+        path: str,
+        mtime_ns: int,
+        size: int,
+        exposure: str,
+    ) -> Optional[Tuple[ScoringResult, Optional[str]]]:
+        """
+        Look up a file's cached result.
+
+        Returns:
+            (ScoringResult, content hash) if the cached entry matches the
+            file's mtime_ns, size and exposure, otherwise None.
+        """
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT mtime_ns, size, exposure, content_hash, result "
+                    "FROM scan_cache WHERE path = ?",
+                    (path,),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Scan cache lookup failed for {path}: {e}")
+            return None
+
+        if row is None or (row[0], row[1], row[2]) != (mtime_ns, size, exposure):
+            return None
+
+        try:
+            data = json.loads(row[4])
+            result = ScoringResult(
+                score=data["score"],
+                tier=RiskTier(data["tier"]),
+                content_score=data["content_score"],
+                exposure_multiplier=data["exposure_multiplier"],
+                co_occurrence_multiplier=data["co_occurrence_multiplier"],
+                co_occurrence_rules=data["co_occurrence_rules"],
+                categories=set(data["categories"]),
+                exposure=data["exposure"],
+            )
+        except (ValueError, KeyError, TypeError) as e:
+            logger.debug(f"Ignoring unreadable scan cache entry for {path}: {e}")
+            return None
+        return result, row[3]
+
+    def put(
+        self,
+        path: str,
+        mtime_ns: int,
+        size: int,
+        exposure: str,
+        result: ScoringResult,
+        content_hash: Optional[str] = None,
+    ) -> None:
+        """Store a file's scoring result, replacing any older entry."""
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO scan_cache "
+                    "(path, mtime_ns, size, exposure, score, tier, content_hash, result) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        path, mtime_ns, size, exposure,
+                        result.score, result.tier.value, content_hash,
+                        json.dumps(result.to_dict()),
+                    ),
+                )
+                self._pending += 1
+                if self._pending >= SCAN_CACHE_COMMIT_INTERVAL:
+                    self._conn.commit()
+                    self._pending = 0
+        except sqlite3.Error as e:
+            logger.warning(f"Scan cache write failed for {path}: {e}")
+
+    def flush(self) -> None:
+        """Commit pending writes."""
+        try:
+            with self._lock:
+                if self._pending:
+                    self._conn.commit()
+                    self._pending = 0
+        except sqlite3.Error as e:
+            logger.warning(f"Scan cache commit failed: {e}")
+
+    def close(self) -> None:
+        """Commit pending writes and close the database."""
+        self.flush()
+        with self._lock:
+            try:
+                self._conn.close()
+            except sqlite3.Error as e:
+                logger.debug(f"Error closing scan cache: {e}")
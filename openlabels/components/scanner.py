@@ -4,25 +4,112 @@ OpenLabels Scanner Component.
 Handles file and directory scanning operations.
 """
 
+import collections
 import fnmatch
+import functools
+import itertools
 import logging
+import os
+import re
 import stat as stat_module
 import time
+from collections.abc import Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Iterator, Optional, Union, TYPE_CHECKING
+from typing import Any, Callable, Iterator, List, Optional, Tuple, Union, TYPE_CHECKING
 
 from ..core.scorer import score as score_entities
 from ..core.types import ScanResult, FilterCriteria, TreeNode
-from ..cli.filter import Filter, parse_filter
+from ..cli.filter import Filter, cached_filter
 from ..utils.hashing import quick_hash
 
 if TYPE_CHECKING:
     from ..context import Context
+    from .scan_cache import ScanCache
     from .scorer import Scorer
 
 logger = logging.getLogger(__name__)
 
+# Scan chunks kept in flight per worker, so the walk stays ahead of the pool
+# without queueing the whole tree
+_IN_FLIGHT_PER_WORKER = 4
+
+# Largest number of files handed to a worker as one task
+_MAX_SCAN_CHUNK = 64
+
+
+@functools.lru_cache(maxsize=32)
+def _path_matcher(pattern: str) -> Callable[[str], Optional["re.Match[str]"]]:
+    """
+    Compiled matcher for a glob pattern, with fnmatch.fnmatch's semantics.
+
+    Built once per pattern and shared by every file of every scan, instead
+    of normalizing and looking the pattern up again for each result.
+    """
+    return re.compile(fnmatch.translate(os.path.normcase(pattern))).match
+
+
+# ScanResult.to_dict() keys read straight off the result
+_SCALAR_FIELDS = frozenset({
+    "path", "size_bytes", "file_type", "score", "tier",
+    "scan_duration_ms", "scanned_at", "content_hash", "error",
+})
+
+
+class _ResultView(Mapping):
+    """
+    Read-only mapping over a ScanResult with the keys of to_dict().
+
+    Filter expressions only read the fields they name, so scalar fields are
+    read off the result on access. to_dict() is only built, once, if an
+    entity, context or trigger field is read.
+    """
+
+    __slots__ = ("_result", "_full")
+
+    def __init__(self, result: ScanResult):
+        self._result = result
+        self._full = None
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _SCALAR_FIELDS:
+            return getattr(self._result, key)
+        if self._full is None:
+            self._full = self._result.to_dict()
+        return self._full[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in _SCALAR_FIELDS or key in ("entities", "context", "scan_triggers")
+
+    def __iter__(self) -> Iterator[str]:
+        if self._full is None:
+            self._full = self._result.to_dict()
+        return iter(self._full)
+
+    def __len__(self) -> int:
+        return len(_SCALAR_FIELDS) + 3
+
+
+_scanner_module = None
+
+
+def _scanner():
+    """The scanner package, imported on first use since it is slow to load."""
+    global _scanner_module
+    if _scanner_module is None:
+        from ..adapters import scanner
+        _scanner_module = scanner
+    return _scanner_module
+
+
+def _scan_chunk(
+    scan_one: Callable[[Tuple[Path, os.stat_result]], Optional[ScanResult]],
+    chunk: List[Tuple[Path, os.stat_result]],
+) -> List[Optional[ScanResult]]:
+    """Scan a chunk of files on one worker."""
+    return [scan_one(file_stat) for file_stat in chunk]
+
 
 class FileModifiedError(Exception):
     """Raised when a file is modified during scanning."""
@@ -49,9 +136,16 @@ class Scanner:
         ...     print(f"{result.path}: {result.score}")
     """
 
-    def __init__(self, context: "Context", scorer: "Scorer"):
+    def __init__(
+        self,
+        context: "Context",
+        scorer: "Scorer",
+        cache: Optional["ScanCache"] = None,
+    ):
         self._ctx = context
         self._scorer = scorer
+        # Optional on-disk cache: unchanged files skip detection
+        self._cache = cache
 
     @property
     def default_exposure(self) -> str:
@@ -66,6 +160,8 @@ class Scanner:
         include_hidden: bool = False,
         max_files: Optional[int] = None,
         on_progress: Optional[Callable[[str], None]] = None,
+        max_workers: int = 1,
+        preserve_order: bool = False,
     ) -> Iterator[ScanResult]:
         """
         Scan files and yield results as they complete.
@@ -78,6 +174,9 @@ class Scanner:
             include_hidden: Include hidden files/directories
             max_files: Maximum number of files to scan
             on_progress: Optional callback for progress updates
+            max_workers: Threads scanning files concurrently (1 = serial)
+            preserve_order: With several workers, yield results in walk
+                order rather than as they complete
 
         Yields:
             ScanResult for each file scanned
@@ -99,27 +198,38 @@ class Scanner:
         if not is_regular_file and not is_directory:
             raise ValueError(f"Not a file or directory: {path}")
 
-        filter_obj = parse_filter(filter_expr) if filter_expr else None
-
-        # Single file
-        if is_regular_file:
-            result = self._scan_single_file(path)
-            if self._matches_filter(result, filter_criteria, filter_obj):
-                yield result
-            return
+        # Shared per expression, so repeat scans reuse its compiled predicate
+        filter_obj = cached_filter(filter_expr) if filter_expr else None
+        # One timestamp for the whole scan rather than one per file
+        scanned_at = datetime.utcnow().isoformat()
 
-        # Directory
-        for file_path in self._iter_files(path, recursive, include_hidden, max_files, on_progress):
-            try:
-                result = self._scan_single_file(file_path)
+        try:
+            # Single file
+            if is_regular_file:
+                result = self._scan_single_file(path, scanned_at=scanned_at)
                 if self._matches_filter(result, filter_criteria, filter_obj):
                     yield result
-            except (OSError, ValueError) as e:
-                logger.warning(f"Error scanning {file_path}: {e}")
-                yield ScanResult(
-                    path=str(file_path),
-                    error=str(e),
-                )
+                return
+
+            # Directory
+            files = self._iter_file_stats(path, recursive, include_hidden, max_files, on_progress)
+            scan_one = functools.partial(
+                self._scan_matching,
+                criteria=filter_criteria,
+                filter_obj=filter_obj,
+                scanned_at=scanned_at,
+            )
+            if max_workers > 1:
+                results = self._scan_files_parallel(scan_one, files, max_workers, preserve_order)
+            else:
+                results = map(scan_one, files)
+
+            for result in results:
+                if result is not None:
+                    yield result
+        finally:
+            if self._cache is not None:
+                self._cache.flush()
 
     def find(
         self,
@@ -158,13 +268,19 @@ class Scanner:
         self,
         path: Union[str, Path],
         max_depth: Optional[int] = None,
+        max_workers: int = 1,
     ) -> TreeNode:
         """
         Build a risk tree for directory visualization.
 
+        The tree is walked first, then its files are scanned (on a thread
+        pool when max_workers > 1) and the directory stats rolled up
+        from the deepest directories to the root.
+
         Args:
             path: Root directory to scan
             max_depth: Maximum depth to recurse
+            max_workers: Threads scanning files concurrently (1 = serial)
 
         Returns:
             TreeNode representing the directory tree with risk data
@@ -174,7 +290,17 @@ class Scanner:
         if not path.exists():
             raise FileNotFoundError(f"Path not found: {path}")
 
-        return self._build_tree_node(path, current_depth=0, max_depth=max_depth)
+        try:
+            files: List[Tuple[TreeNode, Path, os.stat_result]] = []
+            root, directories = self._build_tree(path, max_depth, files)
+            self._score_tree_files(files, max_workers)
+            # Children are walked after their parent, so this is bottom-up
+            for node in reversed(directories):
+                self._aggregate_tree_node(node)
+            return root
+        finally:
+            if self._cache is not None:
+                self._cache.flush()
 
     def _iter_files(
         self,
@@ -185,48 +311,191 @@ class Scanner:
         on_progress: Optional[Callable[[str], None]] = None,
     ) -> Iterator[Path]:
         """Iterate over regular files in a directory. See SECURITY.md for TOCTOU-001."""
-        walker = path.rglob("*") if recursive else path.glob("*")
+        for file_path, _ in self._iter_file_stats(
+            path, recursive, include_hidden, max_files, on_progress,
+        ):
+            yield file_path
+
+    def _iter_file_stats(
+        self,
+        path: Path,
+        recursive: bool = True,
+        include_hidden: bool = False,
+        max_files: Optional[int] = None,
+        on_progress: Optional[Callable[[str], None]] = None,
+    ) -> Iterator[Tuple[Path, os.stat_result]]:
+        """
+        Iterate over regular files in a directory with their lstat results.
+
+        The stat comes from the walk's DirEntry, so scanning the file does
+        not need to stat it again (Windows fills it in from the listing).
+        """
         files_yielded = 0
+        pending = [str(path)]
 
-        for file_path in walker:
+        while pending:
+            files = []
             try:
-                st = file_path.stat(follow_symlinks=False)  # TOCTOU-001
-                # Skip non-regular files (directories, symlinks, devices, etc.)
-                if not stat_module.S_ISREG(st.st_mode):
-                    continue
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        # Hidden directories are pruned rather than walked
+                        if not include_hidden and entry.name.startswith('.'):
+                            continue
+                        try:
+                            # TOCTOU-001: never follow symlinks. DirEntry
+                            # answers from the listing, without a stat per entry.
+                            if entry.is_file(follow_symlinks=False):
+                                files.append(entry)
+                            elif recursive and entry.is_dir(follow_symlinks=False):
+                                pending.append(entry.path)
+                        except OSError:
+                            # Permission denied or vanished - skip
+                            continue
             except OSError:
-                # File doesn't exist, permission denied, or other issue - skip
                 continue
 
-            if not include_hidden and any(part.startswith('.') for part in file_path.parts):
-                continue
+            for entry in files:
+                if max_files and files_yielded >= max_files:
+                    return
 
-            if max_files and files_yielded >= max_files:
-                break
+                try:
+                    st = entry.stat(follow_symlinks=False)  # TOCTOU-001
+                except OSError:
+                    continue
 
-            if on_progress:
-                on_progress(str(file_path))
+                if on_progress:
+                    on_progress(entry.path)
 
-            yield file_path
-            files_yielded += 1
+                yield Path(entry.path), st
+                files_yielded += 1
 
-    def _scan_single_file(self, path: Path) -> ScanResult:
+    def _scan_matching(
+        self,
+        file_stat: Tuple[Path, os.stat_result],
+        criteria: Optional[FilterCriteria],
+        filter_obj: Optional[Filter],
+        scanned_at: Optional[str] = None,
+    ) -> Optional[ScanResult]:
+        """
+        Scan a file within a directory scan.
+
+        Returns the result if it passes the filters, or None if it doesn't.
+        Criteria that only need the path, size and type are checked against
+        the walk's stat first, so files they rule out are never scanned.
+        An unexpected OS or value error is returned as an error result,
+        which is never filtered out.
+        """
+        path, st = file_stat
+        if criteria is not None and not self._matches_file_criteria(
+            str(path), st.st_size, path.suffix.lower() or "unknown", criteria,
+        ):
+            return None
+        try:
+            result = self._scan_single_file(path, st, scanned_at=scanned_at)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Error scanning {path}: {e}")
+            return ScanResult(
+                path=str(path),
+                error=str(e),
+            )
+        return result if self._matches_filter(result, criteria, filter_obj) else None
+
+    def _scan_files_parallel(
+        self,
+        scan_one: Callable[[Tuple[Path, os.stat_result]], Optional[ScanResult]],
+        files: Iterator[Tuple[Path, os.stat_result]],
+        max_workers: int,
+        preserve_order: bool,
+    ) -> Iterator[Optional[ScanResult]]:
+        """
+        Run scan_one over files on a thread pool, with a bounded number in flight.
+
+        Files are submitted in chunks as the walk yields them, so the first
+        results arrive before the walk ends and memory stays flat on large
+        trees. Chunks start at one file, for a fast first result, and double
+        up to _MAX_SCAN_CHUNK as chunks complete, so a large tree needs one
+        future per chunk rather than per file. If the caller stops early,
+        queued scans are cancelled.
+        """
+        window = max_workers * _IN_FLIGHT_PER_WORKER
+        chunk_size = 1
+        files = iter(files)
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+
+        def submit(size: int) -> Optional[Future]:
+            chunk = list(itertools.islice(files, size))
+            return executor.submit(_scan_chunk, scan_one, chunk) if chunk else None
+
+        try:
+            initial = (submit(chunk_size) for _ in range(window))
+            if preserve_order:
+                # Sliding window: always wait on the oldest submission
+                queue = collections.deque(f for f in initial if f is not None)
+                while queue:
+                    results = queue.popleft().result()
+                    chunk_size = min(chunk_size * 2, _MAX_SCAN_CHUNK)
+                    future = submit(chunk_size)
+                    if future is not None:
+                        queue.append(future)
+                    yield from results
+            else:
+                in_flight = {f for f in initial if f is not None}
+                while in_flight:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        chunk_size = min(chunk_size * 2, _MAX_SCAN_CHUNK)
+                        next_future = submit(chunk_size)
+                        if next_future is not None:
+                            in_flight.add(next_future)
+                        yield from future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _scan_single_file(
+        self,
+        path: Path,
+        stat: Optional[os.stat_result] = None,
+        scanned_at: Optional[str] = None,
+    ) -> ScanResult:
         """
         Scan a single file and return ScanResult.
 
         Detects if the file is modified during scanning by comparing
-        quick hashes before and after detection.
+        quick hashes before and after detection. A stat already taken by
+        the directory walk is used as the "before" stat. With a scan cache,
+        a file whose mtime and size are unchanged skips detection.
+        scanned_at is the scan's start time; if None, the current time.
         """
-        from ..adapters.scanner import detect_file
-
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
+        if scanned_at is None:
+            scanned_at = datetime.utcnow().isoformat()
 
         try:
+            pre_stat = stat if stat is not None else path.stat()
+
+            if self._cache is not None:
+                cached = self._cache.get(
+                    str(path), pre_stat.st_mtime_ns, pre_stat.st_size, self.default_exposure,
+                )
+                if cached is not None:
+                    scoring_result, content_hash = cached
+                    return ScanResult(
+                        path=str(path),
+                        size_bytes=pre_stat.st_size,
+                        file_type=path.suffix.lower() or "unknown",
+                        score=scoring_result.score,
+                        tier=scoring_result.tier.value,
+                        scoring_result=scoring_result,
+                        entities=[],
+                        scan_duration_ms=(time.perf_counter_ns() - start_ns) / 1_000_000,
+                        scanned_at=scanned_at,
+                        content_hash=content_hash,
+                    )
+
             # Capture hash before detection to detect concurrent modification
             pre_hash = quick_hash(path)
-            pre_stat = path.stat()
 
-            detection_result = detect_file(path)
+            detection_result = _scanner().detect_file(path)
             entities = self._scorer._normalize_entity_counts(detection_result.entity_counts)
             confidence = self._scorer._calculate_average_confidence(detection_result.spans)
 
@@ -253,7 +522,13 @@ class Scanner:
                     f"File modified during scan: {path} (mtime changed)"
                 )
 
-            duration_ms = (time.time() - start_time) * 1000
+            if self._cache is not None:
+                self._cache.put(
+                    str(path), post_stat.st_mtime_ns, post_stat.st_size,
+                    self.default_exposure, scoring_result, post_hash,
+                )
+
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
 
             return ScanResult(
                 path=str(path),
@@ -264,7 +539,7 @@ class Scanner:
                 scoring_result=scoring_result,
                 entities=[],
                 scan_duration_ms=duration_ms,
-                scanned_at=datetime.utcnow().isoformat(),
+                scanned_at=scanned_at,
                 content_hash=post_hash,  # Include hash for downstream verification
             )
 
@@ -291,6 +566,8 @@ class Scanner:
             return False
 
         if criteria:
+            # Cheapest checks first: number compares, then string
+            # compares, then the glob match
             if criteria.min_score is not None:
                 if result.score is None or result.score < criteria.min_score:
                     return False
@@ -300,106 +577,161 @@ class Scanner:
             if criteria.tier:
                 if result.tier is None or result.tier.upper() != criteria.tier.upper():
                     return False
-            if criteria.path_pattern and not fnmatch.fnmatch(result.path, criteria.path_pattern):
-                return False
-            if criteria.file_type:
-                if not result.file_type.lower().endswith(criteria.file_type.lower()):
-                    return False
-            if criteria.min_size is not None and result.size_bytes < criteria.min_size:
-                return False
-            if criteria.max_size is not None and result.size_bytes > criteria.max_size:
+            if not self._matches_file_criteria(
+                result.path, result.size_bytes, result.file_type, criteria,
+            ):
                 return False
 
         if filter_obj:
-            result_dict = result.to_dict()
-            if not filter_obj.evaluate(result_dict):
+            if not filter_obj.evaluate(_ResultView(result)):
                 return False
 
         return True
 
-    def _build_tree_node(
+    @staticmethod
+    def _matches_file_criteria(
+        path: str,
+        size_bytes: int,
+        file_type: str,
+        criteria: FilterCriteria,
+    ) -> bool:
+        """Check the criteria that need only a file's path, size and type."""
+        if criteria.min_size is not None and size_bytes < criteria.min_size:
+            return False
+        if criteria.max_size is not None and size_bytes > criteria.max_size:
+            return False
+        if criteria.file_type:
+            if not file_type.lower().endswith(criteria.file_type.lower()):
+                return False
+        if criteria.path_pattern:
+            if not _path_matcher(criteria.path_pattern)(os.path.normcase(path)):
+                return False
+        return True
+
+    def _build_tree(
         self,
         path: Path,
-        current_depth: int,
         max_depth: Optional[int],
-    ) -> TreeNode:
-        """Recursively build tree node. See SECURITY.md for TOCTOU-001."""
+        files: List[Tuple[TreeNode, Path, os.stat_result]],
+    ) -> Tuple[TreeNode, List[TreeNode]]:
+        """
+        Walk the tree and build its nodes. See SECURITY.md for TOCTOU-001.
+
+        One os.scandir listing per directory, walked with a stack rather
+        than recursion. Children are typed from their DirEntry, and only
+        regular files are stat'ed, once: the stat is appended to files
+        with the node, for _score_tree_files to reuse.
+
+        Returns:
+            The root node, and the directory nodes in walk order
+            (each directory before its subdirectories)
+        """
         name = path.name or str(path)
 
         try:
             st = path.stat(follow_symlinks=False)  # TOCTOU-001
-            is_regular_file = stat_module.S_ISREG(st.st_mode)
-            is_directory = stat_module.S_ISDIR(st.st_mode)
         except OSError:
             # Can't stat - treat as empty directory node
-            return TreeNode(
-                name=name,
-                path=str(path),
-                is_directory=True,
-            )
+            return TreeNode(name=name, path=str(path), is_directory=True), []
+
+        if stat_module.S_ISREG(st.st_mode):
+            node = TreeNode(name=name, path=str(path), is_directory=False)
+            files.append((node, path, st))
+            return node, []
 
         # Skip symlinks and special files
-        if not is_regular_file and not is_directory:
+        if not stat_module.S_ISDIR(st.st_mode):
             return TreeNode(
                 name=name,
                 path=str(path),
                 is_directory=False,
                 score=0,
                 tier="MINIMAL",
-            )
+            ), []
 
-        if is_regular_file:
-            result = self._scan_single_file(path)
-            return TreeNode(
-                name=name,
-                path=str(path),
-                is_directory=False,
-                score=result.score if not result.error else 0,
-                tier=result.tier if not result.error else "MINIMAL",
-            )
+        root = TreeNode(name=name, path=str(path), is_directory=True)
+        directories = []
+        stack = [(root, path, 0)]
 
-        node = TreeNode(
-            name=name,
-            path=str(path),
-            is_directory=True,
-        )
+        while stack:
+            node, dir_path, depth = stack.pop()
+            directories.append(node)
 
-        if max_depth is not None and current_depth >= max_depth:
-            return node
+            if max_depth is not None and depth >= max_depth:
+                continue
 
-        scores = []
-        try:
-            for child_path in path.iterdir():
-                if child_path.name.startswith('.'):
-                    continue
+            try:
+                with os.scandir(dir_path) as entries:
+                    children = [e for e in entries if not e.name.startswith('.')]
+            except PermissionError:
+                logger.warning(f"Permission denied: {dir_path}")
+                continue
 
-                child_node = self._build_tree_node(
-                    child_path,
-                    current_depth + 1,
-                    max_depth,
-                )
-                node.children.append(child_node)
-
-                if child_node.is_directory:
-                    node.total_files += child_node.total_files
-                    node.total_size += child_node.total_size
-                    if child_node.max_score > 0:
-                        scores.extend([child_node.avg_score] * child_node.total_files)
-                    node.max_score = max(node.max_score, child_node.max_score)
-                    for tier, count in child_node.score_distribution.items():
-                        node.score_distribution[tier] = node.score_distribution.get(tier, 0) + count
-                else:
-                    node.total_files += 1
-                    if child_node.score is not None:
-                        scores.append(child_node.score)
-                        node.max_score = max(node.max_score, child_node.score)
-                        tier = child_node.tier or "MINIMAL"
-                        node.score_distribution[tier] = node.score_distribution.get(tier, 0) + 1
-
-        except PermissionError:
-            logger.warning(f"Permission denied: {path}")
-
-        if scores:
-            node.avg_score = sum(scores) / len(scores)
-
-        return node
+            for entry in children:
+                child_path = Path(entry.path)
+                child = TreeNode(name=entry.name, path=str(child_path), is_directory=False)
+                try:
+                    if entry.is_dir(follow_symlinks=False):  # TOCTOU-001
+                        child.is_directory = True
+                        stack.append((child, child_path, depth + 1))
+                    elif entry.is_file(follow_symlinks=False):
+                        child_stat = entry.stat(follow_symlinks=False)
+                        node.total_size += child_stat.st_size
+                        files.append((child, child_path, child_stat))
+                    else:
+                        # Skip symlinks and special files
+                        child.score = 0
+                        child.tier = "MINIMAL"
+                except OSError:
+                    # Can't stat - treat as empty directory node
+                    child.is_directory = True
+                node.children.append(child)
+
+        return root, directories
+
+    def _score_tree_files(
+        self,
+        files: List[Tuple[TreeNode, Path, os.stat_result]],
+        max_workers: int,
+    ) -> None:
+        """Scan the tree's files and set each file node's score and tier."""
+        def scan_one(item: Tuple[TreeNode, Path, os.stat_result]) -> None:
+            node, path, st = item
+            result = self._scan_single_file(path, st)
+            node.score = result.score if not result.error else 0
+            node.tier = result.tier if not result.error else "MINIMAL"
+
+        if max_workers > 1:
+            collections.deque(
+                self._scan_files_parallel(scan_one, files, max_workers, preserve_order=False),
+                maxlen=0,
+            )
+        else:
+            for item in files:
+                scan_one(item)
+
+    def _aggregate_tree_node(self, node: TreeNode) -> None:
+        """
+        Roll a directory's scored files and subdirectories up into its stats.
+
+        Subdirectories contribute their running score_sum and total_files,
+        so the average costs O(children) per directory, not O(files below).
+        """
+        distribution = collections.Counter()
+        for child_node in node.children:
+            if child_node.is_directory:
+                node.total_files += child_node.total_files
+                node.total_size += child_node.total_size
+                node.score_sum += child_node.score_sum
+                node.max_score = max(node.max_score, child_node.max_score)
+                distribution.update(child_node.score_distribution)
+            else:
+                node.total_files += 1
+                if child_node.score is not None:
+                    node.score_sum += child_node.score
+                    node.max_score = max(node.max_score, child_node.score)
+                    distribution[child_node.tier or "MINIMAL"] += 1
+        node.score_distribution = distribution
+
+        if node.total_files:
+            node.avg_score = node.score_sum / node.total_files
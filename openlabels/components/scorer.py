@@ -15,6 +15,22 @@ from ..core.constants import CONFIDENCE_WHEN_NO_SPANS
 if TYPE_CHECKING:
     from ..context import Context
 
+_scanner_module = None
+
+
+def _scanner():
+    """The scanner package, imported on first use since it is slow to load."""
+    global _scanner_module
+    if _scanner_module is None:
+        from ..adapters import scanner
+        _scanner_module = scanner
+    return _scanner_module
+
+
+# Exposure levels from least to most exposed
+EXPOSURE_BY_RANK = ("PRIVATE", "INTERNAL", "ORG_WIDE", "PUBLIC")
+EXPOSURE_RANK = {exposure: rank for rank, exposure in enumerate(EXPOSURE_BY_RANK)}
+
 
 class Scorer:
     """
@@ -73,9 +89,7 @@ class Scorer:
             return self.score_from_adapters(inputs, exposure=exposure)
 
         # Default: use built-in scanner with context for isolation
-        from ..adapters.scanner import detect_file
-
-        detection_result = detect_file(path, context=self._ctx)
+        detection_result = _scanner().detect_file(path, context=self._ctx)
         entities = self._normalize_entity_counts(detection_result.entity_counts)
         confidence = self._calculate_average_confidence(detection_result.spans)
 
@@ -96,12 +110,10 @@ class Scorer:
         Returns:
             ScoringResult with score, tier, and breakdown
         """
-        from ..adapters.scanner import detect
-
         exposure = (exposure or self.default_exposure).upper()
 
         # Pass context for resource isolation
-        detection_result = detect(text, context=self._ctx)
+        detection_result = _scanner().detect(text, context=self._ctx)
         entities = self._normalize_entity_counts(detection_result.entity_counts)
         confidence = self._calculate_average_confidence(detection_result.spans)
 
@@ -143,6 +155,9 @@ class Scorer:
         entity_counts: Dict[str, int],
     ) -> Dict[str, int]:
         """Normalize entity type names to UPPERCASE."""
+        # Detector output is normally canonical already; reuse it as-is then
+        if all(k.isupper() and k == k.strip() for k in entity_counts):
+            return entity_counts
         return {
             normalize_entity_type(entity_type): count
             for entity_type, count in entity_counts.items()
@@ -166,47 +181,38 @@ class Scorer:
         Returns:
             Tuple of (merged_entities dict, average_confidence)
         """
-        merged: Dict[str, Dict] = {}
+        # Max count and max confidence per type, kept in two flat dicts
+        counts: Dict[str, int] = {}
+        confidences: Dict[str, float] = {}
+        # Few distinct raw types, so each is normalized once
+        normalized: Dict[str, str] = {}
 
         for inp in inputs:
             for entity in inp.entities:
-                entity_type = normalize_entity_type(entity.type)
-
-                if entity_type not in merged:
-                    merged[entity_type] = {
-                        "count": entity.count,
-                        "confidence": entity.confidence,
-                    }
+                entity_type = normalized.get(entity.type)
+                if entity_type is None:
+                    entity_type = normalized[entity.type] = normalize_entity_type(entity.type)
+                count = counts.get(entity_type)
+                if count is None:
+                    counts[entity_type] = entity.count
+                    confidences[entity_type] = entity.confidence
                 else:
-                    merged[entity_type]["count"] = max(
-                        merged[entity_type]["count"],
-                        entity.count,
-                    )
-                    merged[entity_type]["confidence"] = max(
-                        merged[entity_type]["confidence"],
-                        entity.confidence,
-                    )
-
-        entities = {etype: data["count"] for etype, data in merged.items()}
-
-        if merged:
-            avg_confidence = sum(
-                data["confidence"] for data in merged.values()
-            ) / len(merged)
+                    if entity.count > count:
+                        counts[entity_type] = entity.count
+                    if entity.confidence > confidences[entity_type]:
+                        confidences[entity_type] = entity.confidence
+
+        if confidences:
+            avg_confidence = sum(confidences.values()) / len(confidences)
         else:
             avg_confidence = CONFIDENCE_WHEN_NO_SPANS
 
-        return entities, avg_confidence
+        return counts, avg_confidence
 
     def _get_highest_exposure(self, inputs: List[NormalizedInput]) -> str:
         """Get the highest exposure level from inputs."""
-        exposure_order = ["PRIVATE", "INTERNAL", "ORG_WIDE", "PUBLIC"]
-
-        highest_idx = 0
-        for inp in inputs:
-            exposure = inp.context.exposure.upper()
-            if exposure in exposure_order:
-                idx = exposure_order.index(exposure)
-                highest_idx = max(highest_idx, idx)
-
-        return exposure_order[highest_idx]
+        highest = max(
+            (EXPOSURE_RANK.get(inp.context.exposure.upper(), 0) for inp in inputs),
+            default=0,
+        )
+        return EXPOSURE_BY_RANK[highest]
@@ -11,6 +11,8 @@ Usage:
     )
 """
 
+import sys
+
 
 # --- Confidence Thresholds ---
 # Previously hardcoded as 0.90 in multiple places
@@ -56,3 +58,48 @@ MIN_SCORE = 0
 
 MAX_SCORE = 100
 """Maximum risk score (capped)."""
+
+
+# --- Caching ---
+
+
+SCORE_FILE_CACHE_SIZE = 4096
+"""
+Maximum number of file scoring results memoized per Client.
+
+Keyed on (absolute path, mtime_ns, size, exposure), so a modified file
+misses the cache automatically.
+
+Used in:
+- client.py: Client.score_file()
+"""
+
+SCAN_CACHE_COMMIT_INTERVAL = 1000
+"""
+Number of on-disk scan cache writes batched into one SQLite transaction.
+
+Pending writes are also committed when a scan finishes.
+
+Used in:
+- components/scan_cache.py: ScanCache.put()
+"""
+
+
+# --- Dataclasses ---
+
+
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+"""
+Keyword arguments for @dataclass that drop the per-instance __dict__.
+
+Use as @dataclass(**DATACLASS_SLOTS) on classes kept in large numbers.
+slots= needs Python 3.10+; on 3.9 this is empty and the classes keep a
+__dict__, since hand-written __slots__ can't be combined with dataclass
+field defaults there.
+
+Used in:
+- core/types.py: ScanResult
+- components/fileops.py: QuarantineResult, DeleteResult
+- cli/commands/scan.py: ScanResult
+- cli/filter.py: Token, Condition, Filter
+"""
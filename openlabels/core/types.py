@@ -40,8 +40,11 @@ from .labels import Label, LabelSet, VirtualLabelPointer
 # From triggers - Scan triggers
 from .triggers import ScanTrigger
 
+from .constants import DATACLASS_SLOTS
 
-@dataclass
+
+# One ScanResult is kept per scanned file, so it is slotted where supported
+@dataclass(**DATACLASS_SLOTS)
 class ScanResult:
     """
     Complete result from scanning a file or object.
@@ -214,6 +217,7 @@ class TreeNode:
     total_size: int = 0
     max_score: int = 0
     avg_score: float = 0.0
+    score_sum: int = 0  # Sum of file scores, so parents can average without the files
     score_distribution: Dict[str, int] = field(default_factory=dict)  # tier -> count
 
     # File info (for files)
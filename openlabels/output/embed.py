@@ -21,6 +21,7 @@ from .embed import (
     OfficeLabelWriter,
     ImageLabelWriter,
     # Unified interface
+    EMBEDDABLE_EXTENSIONS,
     get_writer,
     supports_embedded_labels,
     write_embedded_label,
@@ -37,6 +38,7 @@ __all__ = [
     'OfficeLabelWriter',
     'ImageLabelWriter',
     # Unified interface
+    'EMBEDDABLE_EXTENSIONS',
     'get_writer',
     'supports_embedded_labels',
     'write_embedded_label',
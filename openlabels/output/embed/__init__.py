@@ -45,6 +45,11 @@ _WRITERS = [
     ImageLabelWriter(),
 ]
 
+# Every extension some writer can handle, for cheap pre-checks by callers
+EMBEDDABLE_EXTENSIONS = frozenset().union(
+    *(writer.SUPPORTED_EXTENSIONS for writer in _WRITERS)
+)
+
 
 def get_writer(path: Union[str, Path]) -> Optional[EmbeddedLabelWriter]:
     """Get the appropriate writer for a file type."""
@@ -122,6 +127,7 @@ __all__ = [
     'OfficeLabelWriter',
     'ImageLabelWriter',
     # Unified interface
+    'EMBEDDABLE_EXTENSIONS',
     'get_writer',
     'supports_embedded_labels',
     'write_embedded_label',
@@ -0,0 +1,516 @@
+"""
+Tests for the CLI filter language.
+
+Tests parsing and evaluation of filter expressions in openlabels.cli.filter.
+"""
+
+import pytest
+
+from openlabels.cli import filter as filter_module
+from openlabels.cli.filter import (
+    Condition,
+    Filter,
+    FilterBuilder,
+    LogicalOperator,
+    TokenType,
+    _Tokenizer,
+    parse_filter,
+)
+
+
+class TestDurations:
+    """Test duration literal handling."""
+
+    def test_duration_to_days(self):
+        """Duration suffixes should convert to days."""
+        cond = Condition(field="last_accessed", operator=">", value="1y")
+        assert cond._duration_to_days("30d") == 30
+        assert cond._duration_to_days("2w") == 14
+        assert cond._duration_to_days("1y") == 365
+        assert cond._duration_to_days("bogus") == 0
+
+    def test_duration_comparison(self):
+        """Duration values should compare against day counts."""
+        f = parse_filter("last_accessed > 1y")
+        assert f.evaluate({"last_accessed": 400}) is True
+        assert f.evaluate({"last_accessed": 100}) is False
+
+    def test_expected_value_resolved_at_build(self, monkeypatch):
+        """Ordering comparisons should convert their literal once, up front."""
+        f = parse_filter("last_accessed > 1y")
+        cond = f.conditions[0]
+        assert cond.value == "1y"
+        assert cond._comparable_value == 365
+
+        calls = []
+        monkeypatch.setattr(
+            Condition, "_duration_to_days",
+            lambda self, duration: calls.append(duration) or 0,
+        )
+        assert f.evaluate({"last_accessed": 400}) is True
+        assert calls == []
+
+
+class TestMatchesOperator:
+    """Test the regex 'matches' operator."""
+
+    def test_pattern_compiled_once(self):
+        """A pattern should be compiled once across many evaluations."""
+        filter_module._compile_user_pattern.cache_clear()
+        f = parse_filter("path matches 'report_[0-9]+'")
+
+        for i in range(10):
+            assert f.evaluate({"path": f"/data/report_{i}.csv"}) is True
+
+        info = filter_module._compile_user_pattern.cache_info()
+        assert info.misses == 1
+        assert info.hits == 9
+
+    def test_rejected_pattern_never_matches(self):
+        """ReDoS-prone patterns should be rejected, not compiled."""
+        assert filter_module._compile_user_pattern("(a+)+") is None
+        f = parse_filter("path matches '(a+)+'")
+        assert f.evaluate({"path": "aaaa"}) is False
+
+    def test_literal_pattern_skips_regex(self, monkeypatch):
+        """Patterns without metacharacters should use substring search."""
+        calls = []
+        monkeypatch.setattr(
+            Condition, "_safe_regex_match",
+            lambda self, pattern, text: calls.append(pattern) or False,
+        )
+        f = parse_filter("path matches 'Payroll'")
+
+        assert f.evaluate({"path": "/hr/PAYROLL_2024.xlsx"}) is True
+        assert f.evaluate({"path": "/hr/benefits.xlsx"}) is False
+        assert f.conditions[0].operator == "matches"
+        assert calls == []
+
+        assert parse_filter("path matches 'pay.*'").evaluate({"path": "payroll"}) is False
+        assert calls == ["pay.*"]
+
+
+class TestParsing:
+    """Test expression scanning."""
+
+    def test_whitespace_variants(self):
+        """Tabs and newlines should separate tokens like spaces."""
+        f = parse_filter("score\t>=\n50\r\nAND  tier = high")
+        assert len(f.conditions) == 2
+        assert f.conditions[0].field == "score"
+        assert f.conditions[0].value == 50
+        assert f.conditions[1].value == "high"
+
+    def test_field_is_lowercased(self):
+        """Field names should be case-insensitive."""
+        f = parse_filter("SCORE > 10")
+        assert f.conditions[0].field == "score"
+
+    def test_value_ending_in_keyword_letters(self):
+        """Values ending in 'or'/'and' should not be truncated."""
+        f = parse_filter("owner = igor AND score > 5")
+        assert f.conditions[0].value == "igor"
+        assert f.evaluate({"owner": "Igor", "score": 10}) is True
+
+        f = parse_filter("owner = rolland OR owner = bob")
+        assert f.conditions[0].value == "rolland"
+        assert len(f.conditions) == 2
+
+    def test_missing_value_before_keyword(self):
+        """A logical keyword where a value belongs is an error."""
+        with pytest.raises(ValueError):
+            parse_filter("score > AND tier = high")
+
+    def test_enum_values_lowercased(self):
+        """Exposure, encryption and tier literals should be lowercased."""
+        f = parse_filter("exposure = PUBLIC OR encryption = None OR tier = Critical")
+        assert [c.value for c in f.conditions] == ["public", "none", "critical"]
+
+    def test_non_enum_string_keeps_case(self):
+        """Free-form strings should keep their original case."""
+        f = parse_filter("owner = Alice")
+        assert f.conditions[0].value == "Alice"
+
+    def test_value_conversion_cached(self):
+        """Repeated literals should be converted once across parses."""
+        filter_module._convert_value.cache_clear()
+        for _ in range(3):
+            f = parse_filter("exposure = PUBLIC AND score > 75 AND last_accessed > 1y")
+        assert [c.value for c in f.conditions] == ["public", 75, "1y"]
+
+        info = filter_module._convert_value.cache_info()
+        assert info.misses == 3
+        assert info.hits == 6
+
+
+class TestMatchesFilter:
+    """Test the matches_filter() convenience function."""
+
+    def test_empty_expression_matches(self):
+        """An empty expression should match everything."""
+        assert filter_module.matches_filter({"score": 0}, "") is True
+
+    def test_expression_parsed_once(self):
+        """Repeated calls with the same expression should reuse the parse."""
+        filter_module.cached_filter.cache_clear()
+        results = [{"score": s} for s in range(0, 100, 10)]
+
+        matched = [r for r in results if filter_module.matches_filter(r, "score >= 50")]
+
+        assert [r["score"] for r in matched] == [50, 60, 70, 80, 90]
+        assert filter_module.cached_filter.cache_info().misses == 1
+
+
+class TestCompile:
+    """Test compiling filters into predicates."""
+
+    def test_compile_is_cached(self):
+        """compile() should build the predicate once."""
+        f = parse_filter("score > 50 AND tier = high")
+        assert f.compile() is f.compile()
+        assert f.conditions[0].compile() is f.conditions[0].compile()
+
+    def test_empty_filter_matches_everything(self):
+        """A filter with no conditions should match any result."""
+        assert Filter().compile()({}) is True
+
+    def test_left_to_right_chaining(self):
+        """AND/OR combine left to right without precedence."""
+        f = parse_filter("score > 90 OR score < 10 AND tier = low")
+        # (False OR True) AND True
+        assert f.evaluate({"score": 5, "tier": "LOW"}) is True
+        # (True OR False) AND False
+        assert f.evaluate({"score": 95, "tier": "HIGH"}) is False
+
+    def test_missing_operator(self):
+        """missing(field) should match only absent fields."""
+        f = parse_filter("missing(owner)")
+        assert f.evaluate({"score": 1}) is True
+        assert f.evaluate({"owner": "alice"}) is False
+
+    def test_field_lookup_precedence(self):
+        """Direct fields should win over context, which falls back to None."""
+        f = parse_filter("exposure = public")
+        assert f.evaluate({"context": {"exposure": "PUBLIC"}}) is True
+        assert f.evaluate({"exposure": "PRIVATE", "context": {"exposure": "PUBLIC"}}) is False
+        assert f.evaluate({"context": None}) is False
+
+    def test_unknown_operator_never_matches(self):
+        """Conditions with unsupported operators should evaluate False."""
+        cond = Condition(field="score", operator="~", value=1)
+        assert cond.evaluate({"score": 1}) is False
+
+
+class TestEntityCount:
+    """Test the derived entity_count field."""
+
+    RESULT = {"entities": [{"type": "SSN", "count": 3}, {"type": "EMAIL"}]}
+
+    def test_entity_count_is_summed(self):
+        """entity_count should sum counts, defaulting each to 1."""
+        assert parse_filter("entity_count = 4").evaluate(self.RESULT) is True
+
+    def test_entity_count_summed_once(self, monkeypatch):
+        """Several entity_count conditions should share one sum."""
+        calls = []
+        original = filter_module._sum_entity_counts
+
+        def counting(result):
+            calls.append(1)
+            return original(result)
+
+        monkeypatch.setitem(filter_module._DERIVED_FIELDS, "entity_count", counting)
+        f = parse_filter("entity_count > 1 AND entity_count < 10 AND entity_count != 5")
+
+        assert f.evaluate(self.RESULT) is True
+        assert len(calls) == 1
+
+    def test_explicit_entity_count_wins(self):
+        """A precomputed entity_count in the result should be used as-is."""
+        f = parse_filter("entity_count > 1 AND entity_count < 10")
+        assert f.evaluate({**self.RESULT, "entity_count": 20}) is False
+
+    def test_context_entity_count_wins(self):
+        """An entity_count in context should be used over the derived sum."""
+        f = parse_filter("entity_count > 1 AND entity_count < 10")
+        assert f.evaluate({**self.RESULT, "context": {"entity_count": 20}}) is False
+
+    def test_shared_derivation_does_not_copy_result(self):
+        """Deriving a shared field should not iterate a Mapping result."""
+        from collections.abc import Mapping
+
+        class LazyResult(Mapping):
+            def __init__(self, data):
+                self._data = data
+
+            def __getitem__(self, key):
+                return self._data[key]
+
+            def __iter__(self):
+                raise AssertionError("result was copied")
+
+            def __len__(self):
+                return len(self._data)
+
+        f = parse_filter("entity_count > 1 AND entity_count < 10 AND score >= 5")
+        assert f.evaluate(LazyResult({**self.RESULT, "score": 5})) is True
+
+
+class TestKeywords:
+    """Test case-insensitive keyword recognition."""
+
+    def test_logical_operators_any_case(self):
+        """AND/OR should be recognized regardless of case."""
+        f = parse_filter("score > 1 and tier = high Or score < 0")
+        assert f.operators == ["AND", "OR"]
+
+    def test_functions_any_case(self):
+        """has() and missing() should be recognized regardless of case."""
+        f = parse_filter("HAS(SSN) AND Missing(owner)")
+        assert [c.operator for c in f.conditions] == ["has", "missing"]
+
+    def test_word_operators_any_case(self):
+        """contains/matches should be recognized regardless of case."""
+        f = parse_filter("path CONTAINS tmp")
+        assert f.conditions[0].operator == "contains"
+
+    def test_keyword_prefix_is_not_keyword(self):
+        """A keyword followed by more letters is not a keyword."""
+        f = parse_filter("score > 1 ANDY tier = high")
+        assert f.operators == []
+        assert len(f.conditions) == 1
+
+    @pytest.mark.parametrize("value", ['"İstanbul"', "İstanbul", "'İzmir İstanbul'"])
+    def test_keyword_after_non_ascii_value(self, value):
+        """Keywords after a value whose lowercase changes length should still match."""
+        f = parse_filter(f"path contains {value} AND score > 50")
+        assert f.operators == ["AND"]
+        assert [c.field for c in f.conditions] == ["path", "score"]
+        assert f.evaluate({"path": "/data/İzmir İstanbul.txt", "score": 1}) is False
+
+
+class TestQuotedValues:
+    """Test quoted string values."""
+
+    @pytest.mark.parametrize("expr,expected", [
+        ("path = 'a b c'", "a b c"),
+        ('path = "a b c"', "a b c"),
+        ("path = 'it\\'s'", "it\\'s"),
+        ("path = 'unclosed", "unclosed"),
+        ("path = ''", ""),
+    ])
+    def test_quoted_value(self, expr, expected):
+        """Quoted values keep spaces and escapes verbatim."""
+        assert parse_filter(expr).conditions[0].value == expected
+
+    def test_quoted_value_followed_by_condition(self):
+        """Parsing should continue after the closing quote."""
+        f = parse_filter("path contains 'my docs' AND score > 1")
+        assert f.conditions[0].value == "my docs"
+        assert f.conditions[1].field == "score"
+
+    def test_long_unquoted_value(self):
+        """Long unquoted values should parse in one pass."""
+        value = "x" * 10_000
+        f = parse_filter(f"path contains {value} AND score > 1")
+        assert f.conditions[0].value == value
+        assert len(f.conditions) == 2
+
+
+class TestEquality:
+    """Test = and != comparisons."""
+
+    @pytest.mark.parametrize("expr,result,expected", [
+        ("score = 75", {"score": 75}, True),
+        ("score = 75", {"score": 76}, False),
+        ("score = 75", {"score": "75"}, True),
+        ("score = 75", {"score": 75.0}, False),
+        ("tier = high", {"tier": "HIGH"}, True),
+        ("tier = high", {"tier": " High "}, True),
+        ("tier = high", {"tier": "low"}, False),
+        ("owner = 42", {"owner": 42}, True),
+        ("score != 75", {"score": 75}, False),
+        ("score != 75", {"score": 10}, True),
+        ("tier != high", {"tier": "HIGH"}, False),
+    ])
+    def test_equality(self, expr, result, expected):
+        """Equality compares normalized string forms."""
+        assert parse_filter(expr).evaluate(result) is expected
+
+
+class TestTokenizer:
+    """Test the single-pass tokenizer."""
+
+    def test_token_stream(self):
+        """A compound expression should tokenize in order, ending with EOF."""
+        tokens = _Tokenizer("score >= 50 AND has(SSN) OR path = 'a b'").tokenize()
+        assert [(t.type, t.value) for t in tokens] == [
+            (TokenType.FIELD, "score"),
+            (TokenType.OPERATOR, ">="),
+            (TokenType.VALUE, "50"),
+            (TokenType.AND, "AND"),
+            (TokenType.HAS, "SSN"),
+            (TokenType.OR, "OR"),
+            (TokenType.FIELD, "path"),
+            (TokenType.OPERATOR, "="),
+            (TokenType.STRING, "a b"),
+            (TokenType.EOF, ""),
+        ]
+
+    def test_token_positions(self):
+        """Tokens should record their start offsets."""
+        tokens = _Tokenizer("score > 5").tokenize()
+        assert [t.position for t in tokens] == [0, 6, 8, 9]
+
+    def test_quoted_number_not_converted(self):
+        """Quoted values stay strings even when they look numeric."""
+        assert parse_filter("owner = '123'").conditions[0].value == "123"
+        assert parse_filter("owner = 123").conditions[0].value == 123
+
+    def test_dangling_logical_operator(self):
+        """A logical operator with no following condition is an error."""
+        with pytest.raises(ValueError, match="Expected condition after AND"):
+            parse_filter("score > 5 AND")
+
+    def test_missing_operator(self):
+        """A field without an operator is an error."""
+        with pytest.raises(ValueError, match="Expected operator after 'score'"):
+            parse_filter("score 5")
+
+    def test_unclosed_function(self):
+        """An unclosed has( is an error."""
+        with pytest.raises(ValueError, match="Unclosed has"):
+            parse_filter("has(SSN")
+
+
+class TestHas:
+    """Test the has() function."""
+
+    RESULT = {"entities": [{"type": "ssn"}, {"type": "Email"}]}
+
+    def test_has_is_case_insensitive(self):
+        """has() should match entity types regardless of case."""
+        assert parse_filter("has(SSN)").evaluate(self.RESULT) is True
+        assert parse_filter("has(email)").evaluate(self.RESULT) is True
+        assert parse_filter("has(IBAN)").evaluate(self.RESULT) is False
+
+    def test_entity_types_derived_once(self, monkeypatch):
+        """Several has() conditions should share one set of types."""
+        calls = []
+        original = filter_module._entity_types
+
+        def counting(result):
+            calls.append(1)
+            return original(result)
+
+        monkeypatch.setitem(filter_module._DERIVED_FIELDS, "has_entity", counting)
+        f = parse_filter("has(IBAN) OR has(EMAIL) AND has(SSN)")
+
+        assert f.evaluate(self.RESULT) is True
+        assert len(calls) == 1
+
+    def test_explicit_has_entity_list(self):
+        """An explicit has_entity list in the result should still work."""
+        assert parse_filter("has(ssn)").evaluate({"has_entity": ["SSN"]}) is True
+
+
+class TestEvaluationOrder:
+    """Test short-circuiting and cost-based ordering."""
+
+    def test_and_run_skips_expensive_condition(self, monkeypatch):
+        """A failing cheap condition should skip a later regex in an AND run."""
+        calls = []
+        monkeypatch.setattr(
+            Condition, "_safe_regex_match",
+            lambda self, pattern, text: calls.append(text) or True,
+        )
+        f = parse_filter("path matches 'x.*' AND score > 50")
+
+        assert f.evaluate({"path": "x1", "score": 10}) is False
+        assert calls == []
+
+        assert f.evaluate({"path": "x1", "score": 90}) is True
+        assert calls == ["x1"]
+
+    def test_or_run_short_circuits(self, monkeypatch):
+        """A true cheap condition should skip the rest of an OR run."""
+        calls = []
+        monkeypatch.setattr(
+            Condition, "_safe_regex_match",
+            lambda self, pattern, text: calls.append(text) or False,
+        )
+        f = parse_filter("path matches 'x.*' OR score > 50")
+
+        assert f.evaluate({"path": "y", "score": 90}) is True
+        assert calls == []
+
+    @pytest.mark.parametrize("score,tier,path,expected", [
+        (5, "low", "a", True),
+        (95, "high", "a", False),
+        (95, "low", "a", True),
+        (50, "low", "a", False),
+        (50, "low", "zzz", True),
+    ])
+    def test_mixed_runs_keep_left_to_right_semantics(self, score, tier, path, expected):
+        """Reordering within runs must not change left-to-right results."""
+        f = parse_filter(
+            "score > 90 OR score < 10 AND tier = low OR path contains zzz"
+        )
+        result = {"score": score, "tier": tier, "path": path}
+        # ((score > 90 OR score < 10) AND tier = low) OR path contains zzz
+        reference = ((score > 90 or score < 10) and tier == "low") or "zzz" in path
+        assert f.evaluate(result) is reference is expected
+
+
+class TestLogicalOperators:
+    """Test canonical AND/OR storage."""
+
+    def test_parsed_operators_are_enum(self):
+        """Parsed operators should be LogicalOperator members."""
+        f = parse_filter("score > 1 and tier = high or has(SSN)")
+        assert f.operators == [LogicalOperator.AND, LogicalOperator.OR]
+        assert f.operators == ["AND", "OR"]
+
+    def test_to_dict_uses_plain_strings(self):
+        """to_dict() should emit plain "AND"/"OR" strings."""
+        f = parse_filter("score > 1 AND tier = high")
+        assert f.to_dict()["operators"] == ["AND"]
+        assert type(f.to_dict()["operators"][0]) is str
+
+    def test_string_operators_still_accepted(self):
+        """Filters built with plain or lowercase strings should still evaluate."""
+        f = Filter(
+            conditions=[
+                Condition(field="score", operator=">", value=50),
+                Condition(field="tier", operator="=", value="high"),
+            ],
+            operators=["or"],
+        )
+        assert f.evaluate({"score": 10, "tier": "HIGH"}) is True
+        assert f.evaluate({"score": 10, "tier": "LOW"}) is False
+
+    def test_builder(self):
+        """FilterBuilder should produce canonical operators."""
+        f = FilterBuilder().where("score", ">", 50).or_("tier", "=", "high").has("SSN").build()
+        assert f.operators == [LogicalOperator.OR, LogicalOperator.AND]
+        assert f.evaluate({"score": 90, "entities": [{"type": "SSN"}]}) is True
+
+
+@pytest.mark.skipif(
+    not filter_module.DATACLASS_SLOTS, reason="slotted dataclasses need Python 3.10+"
+)
+class TestSlots:
+    """Test that parser objects don't carry a per-instance __dict__."""
+
+    def test_no_instance_dict(self):
+        """Token, Condition and Filter should use __slots__."""
+        f = parse_filter("score > 1 AND has(SSN)")
+        token = _Tokenizer("score > 1").tokenize()[0]
+        for obj in (f, f.conditions[0], token):
+            assert not hasattr(obj, "__dict__")
+
+    def test_compiled_filter_still_cached(self):
+        """The compiled predicate should still be stored on the slotted filter."""
+        f = parse_filter("score > 1")
+        assert f.compile() is f.compile()
+        assert f == parse_filter("score > 1")
@@ -6,10 +6,12 @@ and result matching.
 """
 
 import json
-import pytest
+import sys
 import tempfile
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
 
 from openlabels.cli.commands.find import add_find_parser
 
@@ -132,6 +134,20 @@ class TestFindOutputFormats:
         assert "SSN(2)" in output or "EMAIL(5)" in output
         assert "\t" in output  # Tab-separated
 
+    def test_text_output_entities_sorted(self):
+        """Entities should be listed by type, and '-' when there are none."""
+        from openlabels.cli.commands.find import format_find_result
+        from openlabels.cli.commands.scan import ScanResult
+
+        result = ScanResult(
+            path="/test/file.txt", score=75, tier="HIGH",
+            entities={"SSN": 2, "EMAIL": 5}, exposure="PRIVATE",
+        )
+        assert format_find_result(result, "text").endswith("\tEMAIL(5), SSN(2)")
+
+        result.entities = {}
+        assert format_find_result(result, "text").endswith("\t-")
+
     def test_json_output_format(self):
         """Test JSON output format via format_find_result."""
         from openlabels.cli.commands.find import format_find_result
@@ -188,14 +204,72 @@ class TestFindOutputFormats:
         assert output is not None
 
 
+class TestFindCommandOutput:
+    """Test what cmd_find writes to stdout."""
+
+    def test_jsonl_lines_not_wrapped(self, tmp_path, capsys):
+        """Long JSONL records should stay on one line each."""
+        import argparse
+        from openlabels.cli.commands.find import cmd_find
+
+        deep = tmp_path / ("long_directory_name_" * 5)
+        deep.mkdir()
+        (deep / "patient_records_with_a_long_name.txt").write_text("SSN: 123-45-6789")
+        (deep / "notes.txt").write_text("Hello world")
+
+        parser = argparse.ArgumentParser()
+        find_parser = add_find_parser(parser.add_subparsers())
+        args = find_parser.parse_args([str(tmp_path), "--format", "jsonl"])
+
+        assert cmd_find(args) == 0
+
+        lines = capsys.readouterr().out.splitlines()
+        records = [json.loads(line) for line in lines]
+        assert sorted(Path(r["path"]).name for r in records) == [
+            "notes.txt", "patient_records_with_a_long_name.txt",
+        ]
+
+    def test_text_matches_written_in_blocks(self, tmp_path, monkeypatch):
+        """Piped text matches should be written a block at a time."""
+        import argparse
+        from io import StringIO
+
+        from openlabels.cli import output as output_module
+        from openlabels.cli.commands import find as find_module
+
+        for i in range(5):
+            (tmp_path / f"file{i}.txt").write_text("Hello world")
+        writes = []
+
+        class Sink(StringIO):
+            def write(self, text):
+                writes.append(text)
+                return super().write(text)
+
+        monkeypatch.setattr(output_module, "_fast", True)
+        monkeypatch.setattr(output_module, "console", output_module._LazyConsole())
+        monkeypatch.setattr(sys, "stdout", Sink())
+        monkeypatch.setattr(find_module, "OUTPUT_BLOCK_SIZE", 2)
+
+        parser = argparse.ArgumentParser()
+        find_parser = add_find_parser(parser.add_subparsers())
+        args = find_parser.parse_args([str(tmp_path), "--limit", "5"])
+
+        assert find_module.cmd_find(args) == 0
+
+        match_writes = [w for w in writes if ".txt" in w]
+        assert [w.count(".txt") for w in match_writes] == [2, 2, 1]
+        assert output_module.console._console is None
+
+
 class TestFindIntegration:
     """Integration tests for find command."""
 
     @pytest.fixture
     def temp_dir_with_index(self):
         """Create a temporary directory with indexed files."""
-        import tempfile
         import shutil
+        import tempfile
 
         temp = tempfile.mkdtemp()
 
@@ -258,9 +332,10 @@ class TestFindIntegration:
 
     def test_find_with_limit(self, temp_dir_with_index):
         """Test that find correctly applies result limits."""
+        import itertools
+
         from openlabels import Client
         from openlabels.cli.commands.find import find_matching
-        import itertools
 
         client = Client()
         path = Path(temp_dir_with_index)
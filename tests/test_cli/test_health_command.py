@@ -221,7 +221,7 @@ class TestCmdHealthJsonOutput:
         args.verbose = False
         return args
 
-    def test_outputs_json(self, mock_args):
+    def test_outputs_json(self, mock_args, capsys):
         """Should output JSON when --json flag set."""
         mock_report = MagicMock()
         mock_report.checks = []
@@ -233,12 +233,10 @@ class TestCmdHealthJsonOutput:
 
         with patch("openlabels.cli.commands.health.HealthChecker") as MockChecker:
             MockChecker.return_value.run_all.return_value = mock_report
-            with patch("openlabels.cli.commands.health.echo") as mock_echo:
-                result = cmd_health(mock_args)
+            result = cmd_health(mock_args)
 
-        # Should have called echo with JSON
-        call_args = mock_echo.call_args[0][0]
-        parsed = json.loads(call_args)
+        # Should have written JSON to stdout
+        parsed = json.loads(capsys.readouterr().out)
         assert parsed["healthy"] is True
         assert result == 0
 
@@ -0,0 +1,48 @@
+"""
+Tests for the heatmap CLI command.
+
+Tests building the risk tree that the heatmap renders.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from openlabels.cli.commands import heatmap as heatmap_module
+from openlabels.cli.commands.heatmap import build_tree
+from openlabels.cli.commands.scan import ScanResult
+
+
+def fake_scan(path, client, exposure):
+    return ScanResult(str(path), 10, "LOW", {"EMAIL": 1}, exposure)
+
+
+class TestBuildTree:
+    """Test risk tree construction."""
+
+    @pytest.fixture
+    def tree(self, tmp_path):
+        (tmp_path / "a.TXT").write_text("a")
+        (tmp_path / "b.csv").write_text("b")
+        (tmp_path / "c.pdf").write_text("c")
+        (tmp_path / ".hidden.txt").write_text("h")
+        return tmp_path
+
+    def _child_names(self, node):
+        return sorted(child.name for child in node.children)
+
+    def test_extension_filter(self, tree):
+        """Extensions should match case-insensitively, with or without a dot."""
+        with patch.object(heatmap_module, "scan_file", side_effect=fake_scan):
+            node = build_tree(tree, Mock(), extensions=[".txt", " csv"])
+
+        assert self._child_names(node) == ["a.TXT", "b.csv"]
+        assert node.file_count == 2
+        assert node.entity_counts == {"EMAIL": 2}
+
+    def test_no_extension_filter(self, tree):
+        """Without extensions every visible file should be included."""
+        with patch.object(heatmap_module, "scan_file", side_effect=fake_scan):
+            node = build_tree(tree, Mock())
+
+        assert self._child_names(node) == ["a.TXT", "b.csv", "c.pdf"]
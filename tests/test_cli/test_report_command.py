@@ -76,6 +76,24 @@ class TestReportFormats:
         assert parsed["results"][0]["path"] == "/a.txt"
         assert parsed["results"][0]["score"] == 95
 
+    def test_summary_score_distribution(self):
+        """Scores on tier thresholds should land in the higher bucket."""
+        from openlabels.cli.commands.report import generate_summary
+        from openlabels.cli.commands.scan import ScanResult
+        from openlabels.core.scorer import TIER_THRESHOLDS
+
+        scores = [TIER_THRESHOLDS[t] for t in ("critical", "high", "medium", "low")] + [0]
+        results = [
+            ScanResult(path=f"/{i}.txt", score=s, tier="LOW", entities={"SSN": 1}, exposure="PRIVATE")
+            for i, s in enumerate(scores)
+        ]
+
+        summary = generate_summary(results)
+
+        assert list(summary["score_distribution"].values()) == [1, 1, 1, 1, 1]
+        assert summary["max_score"] == TIER_THRESHOLDS["critical"]
+        assert summary["by_entity"] == {"SSN": 5}
+
     def test_csv_format(self):
         """Test results_to_csv produces valid CSV with all fields."""
         import csv
@@ -5,17 +5,31 @@ Tests CLI argument parsing, output formatting, error handling,
 and integration with the scanner.
 """
 
+import argparse
 import json
 import pytest
+import sys
 import tempfile
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 from io import StringIO
 
+from openlabels.cli.commands import scan as scan_module
+from openlabels.cli import output as output_module
+from openlabels.cli.output import write_json
 from openlabels.cli.commands.scan import (
     ScanResult,
     scan_file,
     add_scan_parser,
+    cmd_scan,
+    collect_files,
+    is_network_path,
+    iter_regular_files,
+    read_file_list,
+    scan_directory,
+    scan_directory_parallel,
+    scan_directory_processes,
+    to_jsonl,
 )
 
 
@@ -132,6 +146,426 @@ class TestScanFile:
             Path(f.name).unlink()
 
 
+class TestCollectFiles:
+    """Test directory file collection."""
+
+    @pytest.fixture
+    def tree(self, tmp_path):
+        """Create a small nested directory tree."""
+        (tmp_path / "a.txt").write_text("a")
+        (tmp_path / "b.CSV").write_text("b")
+        (tmp_path / "sub" / "deeper").mkdir(parents=True)
+        (tmp_path / "sub" / "c.txt").write_text("c")
+        (tmp_path / "sub" / "deeper" / "d.pdf").write_text("d")
+        return tmp_path
+
+    def test_non_recursive(self, tree):
+        """Only top-level regular files should be collected."""
+        assert collect_files(tree) == [tree / "a.txt", tree / "b.CSV"]
+
+    def test_recursive(self, tree):
+        """Nested files should be collected, sorted by path."""
+        assert collect_files(tree, recursive=True) == [
+            tree / "a.txt",
+            tree / "b.CSV",
+            tree / "sub" / "c.txt",
+            tree / "sub" / "deeper" / "d.pdf",
+        ]
+
+    def test_extension_filter(self, tree):
+        """Extensions should match case-insensitively, with or without a dot."""
+        files = collect_files(tree, recursive=True, extensions=[".txt", "csv"])
+        assert [f.name for f in files] == ["a.txt", "b.CSV", "c.txt"]
+
+    def test_extension_list_from_cli(self, tree):
+        """Split CLI extension lists may carry spaces and empty entries."""
+        (tree / "backup.tar.gz").write_text("e")
+        files = collect_files(tree, extensions="pdf, ,tar.gz,".split(","), recursive=True)
+        assert [f.name for f in files] == ["backup.tar.gz", "d.pdf"]
+
+    def test_skips_symlinks(self, tree):
+        """Symlinked files and directories should not be followed."""
+        try:
+            (tree / "link.txt").symlink_to(tree / "a.txt")
+            (tree / "linkdir").symlink_to(tree / "sub", target_is_directory=True)
+        except (OSError, NotImplementedError):
+            pytest.skip("symlinks not supported")
+
+        files = collect_files(tree, recursive=True)
+        assert tree / "link.txt" not in files
+        assert not any("linkdir" in f.parts for f in files)
+
+    def test_single_worker_walk(self, tree):
+        """The walk should complete with a single listing worker."""
+        files = set(iter_regular_files(tree, recursive=True, max_workers=1))
+        assert len(files) == 4
+
+    def test_size_bounds(self, tree):
+        """Files outside the size bounds should be skipped."""
+        (tree / "big.txt").write_text("x" * 100)
+        (tree / "empty.txt").write_text("")
+
+        files = collect_files(tree, recursive=True, min_size=1, max_size=10)
+        assert tree / "big.txt" not in files
+        assert tree / "empty.txt" not in files
+        assert len(files) == 4
+
+    def test_parse_size(self):
+        """Sizes should accept plain bytes and K/M/G suffixes."""
+        assert scan_module.parse_size("512") == 512
+        assert scan_module.parse_size("10k") == 10 * 1024
+        assert scan_module.parse_size("1.5M") == 1536 * 1024
+        assert scan_module.parse_size("2GB") == 2 * 1024 ** 3
+        for text in ("lots", "inf", "1e400", "nan", "-1"):
+            with pytest.raises(argparse.ArgumentTypeError):
+                scan_module.parse_size(text)
+
+    def test_missing_directory(self, tmp_path):
+        """A missing directory should yield nothing."""
+        assert collect_files(tmp_path / "nope", recursive=True) == []
+
+    def test_scan_directory_streams(self, tree):
+        """Scanning should start before the walk has finished."""
+        scanned = []
+
+        def fake_scan(path, client, exposure):
+            scanned.append(path)
+            return ScanResult(str(path), 0, "MINIMAL", {}, exposure)
+
+        with patch.object(scan_module, "scan_file", side_effect=fake_scan):
+            results = scan_directory(tree, Mock(), recursive=True)
+            first = next(results)
+            assert len(scanned) == 1
+            rest = list(results)
+
+        assert sorted(Path(r.path) for r in [first, *rest]) == collect_files(tree, recursive=True)
+
+    def test_readahead_window(self, tree, monkeypatch):
+        """Each file should be advised depth files before it is yielded."""
+        advised = []
+        monkeypatch.setattr(scan_module, "_advise_willneed", advised.append)
+        files = [tree / f"f{i}" for i in range(5)]
+
+        seen = []
+        for file_path in scan_module.iter_readahead(files, depth=2):
+            seen.append((file_path, len(advised)))
+
+        assert advised == files
+        assert seen == [(files[0], 3), (files[1], 4), (files[2], 5),
+                        (files[3], 5), (files[4], 5)]
+
+    def test_advise_willneed_tolerates_bad_paths(self, tree):
+        """Missing files and directories should be skipped silently."""
+        scan_module._advise_willneed(tree / "missing.txt")
+        scan_module._advise_willneed(tree / "sub")
+        assert list(scan_module.iter_readahead([tree / "a.txt"])) == [tree / "a.txt"]
+
+
+class TestNetworkPaths:
+    """Test detection of paths on network filesystems."""
+
+    @pytest.fixture
+    def mounts(self, tmp_path, monkeypatch):
+        """Point mount lookups at a fake mount table."""
+        table = tmp_path / "mounts"
+        table.write_text(
+            "/dev/sda1 / ext4 rw 0 0\n"
+            "server:/export /mnt/nfs nfs4 rw 0 0\n"
+            "//host/share /mnt/my\\040share cifs rw 0 0\n"
+            "/dev/sdb1 /mnt/nfs/local ext4 rw 0 0\n"
+        )
+        monkeypatch.setattr(scan_module, "_PROC_MOUNTS", str(table))
+
+    def test_unc_path(self):
+        """UNC-style paths should count as network paths."""
+        assert is_network_path(Path("//fileserver/share/docs")) is True
+
+    def test_mount_table_lookup(self, mounts):
+        """The longest matching mount point should decide the filesystem type."""
+        assert is_network_path(Path("/mnt/nfs/data")) is True
+        assert is_network_path(Path("/mnt/my share/x")) is True
+        assert is_network_path(Path("/mnt/nfs/local/data")) is False
+        assert is_network_path(Path("/mnt/nfsother")) is False
+
+    def test_missing_mount_table(self, tmp_path, monkeypatch):
+        """Without a mount table, local-looking paths are not network paths."""
+        monkeypatch.setattr(scan_module, "_PROC_MOUNTS", str(tmp_path / "absent"))
+        assert is_network_path(tmp_path) is False
+
+
+class TestFilesFrom:
+    """Test scanning an explicit list of files."""
+
+    @staticmethod
+    def _parse(*argv):
+        import argparse
+        parser = argparse.ArgumentParser()
+        return add_scan_parser(parser.add_subparsers()).parse_args(list(argv))
+
+    def test_read_file_list(self, tmp_path, monkeypatch):
+        """Paths should be read one per line, skipping blank lines."""
+        listing = tmp_path / "files.txt"
+        listing.write_text("/a.txt\n\n  /b c.txt  \n")
+        assert read_file_list(str(listing)) == [Path("/a.txt"), Path("/b c.txt")]
+
+        monkeypatch.setattr("sys.stdin", StringIO("/x.txt\n/y.txt\n"))
+        assert read_file_list("-") == [Path("/x.txt"), Path("/y.txt")]
+
+    def test_read_file_list_undecodable_names(self, tmp_path, monkeypatch):
+        """Names that aren't valid UTF-8 should round-trip to the same bytes."""
+        import io
+        import os
+
+        raw = b"/data/caf\xe9.txt"
+        listing = tmp_path / "files.txt"
+        listing.write_bytes(raw + b"\n")
+        monkeypatch.setattr("sys.stdin", io.TextIOWrapper(io.BytesIO(raw + b"\r\n")))
+
+        for source in (str(listing), "-"):
+            assert [os.fsencode(p) for p in read_file_list(source)] == [raw]
+
+    def test_scan_listed_files(self, tmp_path, monkeypatch, capsys):
+        """Only the listed files should be scanned."""
+        (tmp_path / "a.txt").write_text("Patient SSN: 123-45-6789")
+        (tmp_path / "b.txt").write_text("Hello world")
+        (tmp_path / "unlisted.txt").write_text("Hello world")
+        monkeypatch.setattr(
+            "sys.stdin", StringIO(f"{tmp_path / 'a.txt'}\n{tmp_path / 'b.txt'}\n"),
+        )
+
+        args = self._parse("--files-from", "-", "--format", "jsonl", "-j", "1")
+        assert cmd_scan(args) == 0
+
+        lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert sorted(Path(r["path"]).name for r in lines) == ["a.txt", "b.txt"]
+
+    def test_requires_path_or_list(self):
+        """Without a path or --files-from the command should fail."""
+        assert cmd_scan(self._parse()) == 1
+
+    @pytest.mark.parametrize("option", [
+        ["--min-size", "1K"], ["--max-size", "0"], ["--extensions", "txt"],
+    ])
+    def test_walk_filters_rejected_with_list(self, option, tmp_path):
+        """Walk-only filters should be rejected rather than silently ignored."""
+        listing = tmp_path / "files.txt"
+        listing.write_text(f"{tmp_path / 'a.txt'}\n")
+
+        with patch.object(scan_module, "read_file_list") as read_list:
+            assert cmd_scan(self._parse("--files-from", str(listing), *option)) == 1
+        read_list.assert_not_called()
+
+    def test_text_results_written_in_blocks(self, tmp_path, monkeypatch):
+        """Piped text output should be written a block of results at a time, without rich."""
+        for i in range(5):
+            (tmp_path / f"file{i}.txt").write_text("Hello world")
+        writes = []
+
+        class Sink(StringIO):
+            def write(self, text):
+                writes.append(text)
+                return super().write(text)
+
+        sink = Sink()
+        monkeypatch.setattr(output_module, "_fast", True)
+        monkeypatch.setattr(output_module, "console", output_module._LazyConsole())
+        monkeypatch.setattr(sys, "stdout", sink)
+        monkeypatch.setattr(scan_module, "OUTPUT_BLOCK_SIZE", 2)
+
+        assert cmd_scan(self._parse(str(tmp_path), "-j", "1")) == 0
+
+        result_writes = [w for w in writes if ".txt" in w]
+        assert [w.count(".txt") for w in result_writes] == [2, 2, 1]
+        assert "Scanned: 5 files" in sink.getvalue()
+        # Piped output never needs the rich console
+        assert output_module.console._console is None
+
+
+class TestJsonOutput:
+    """Test the json output of the scan command."""
+
+    def test_long_paths_not_wrapped(self, tmp_path, capsys):
+        """JSON should bypass the console, so long paths and brackets survive."""
+        nested = tmp_path / ("[x]" + "d" * 100)
+        nested.mkdir()
+        (nested / "a.txt").write_text("Hello world")
+
+        args = TestFilesFrom._parse(str(nested), "--format", "json", "-j", "1")
+        assert cmd_scan(args) == 0
+
+        output = json.loads(capsys.readouterr().out)
+        assert output["results"][0]["path"] == str(nested / "a.txt")
+
+    def test_skip_clean(self, tmp_path, capsys):
+        """--skip-clean should list only files with findings, but count all."""
+        (tmp_path / "clean.txt").write_text("Hello world")
+        (tmp_path / "pii.txt").write_text("Contact jane.doe@example.com today")
+
+        args = TestFilesFrom._parse(
+            str(tmp_path), "--format", "json", "-j", "1", "--skip-clean",
+        )
+        assert cmd_scan(args) == 0
+
+        output = json.loads(capsys.readouterr().out)
+        assert output["summary"]["total_files"] == 2
+        assert [Path(r["path"]).name for r in output["results"]] == ["pii.txt"]
+
+    @pytest.mark.parametrize("isatty, expected", [
+        (False, '{"a":[1,2]}\n'),
+        (True, '{\n  "a": [\n    1,\n    2\n  ]\n}\n'),
+    ])
+    def test_indent_only_on_terminal(self, isatty, expected, monkeypatch, capsys):
+        """Piped JSON should be compact; a terminal gets it indented."""
+        monkeypatch.setattr(sys.stdout, "isatty", lambda: isatty)
+        write_json({"a": [1, 2]})
+        assert capsys.readouterr().out == expected
+
+
+class TestPlainOutput:
+    """Test the non-terminal output path that bypasses rich."""
+
+    def test_strip_markup(self):
+        """Markup should be removed the way rich renders it."""
+        assert output_module.strip_markup("[bold]a[/bold] [x]b") == "a b"
+        assert output_module.strip_markup(r"keep \[bold] literal") == "keep [bold] literal"
+        assert output_module.strip_markup("EMAIL(2) [1, 2]") == "EMAIL(2) [1, 2]"
+
+    def test_messages_written_plain(self, monkeypatch, capsys):
+        """Piped messages should be written without markup or wrapping."""
+        monkeypatch.setattr(output_module, "_fast", True)
+        long_path = "/data/" + "d" * 200 + ".txt"
+
+        output_module.echo(f"{long_path}: [red]ERROR[/red]")
+        output_module.warn("careful")
+        output_module.echo("no newline", nl=False)
+
+        assert capsys.readouterr().out == (
+            f"{long_path}: ERROR\nWarning: careful\nno newline"
+        )
+
+    def test_divider_reuses_bar(self, monkeypatch, capsys):
+        """Repeated dividers of one width should reuse the same line."""
+        monkeypatch.setattr(output_module, "_fast", True)
+        monkeypatch.setenv("COLUMNS", "12")
+
+        output_module.divider("=")
+        output_module.divider("=")
+
+        assert capsys.readouterr().out == "=" * 12 + "\n" + "=" * 12 + "\n"
+        assert output_module._bar("=", 12) is output_module._bar("=", 12)
+
+
+class TestProgress:
+    """Test the progress bar context manager."""
+
+    def test_nested_calls_share_display(self, monkeypatch):
+        """Nested progress() calls should add tasks to one running display."""
+        monkeypatch.setattr(output_module, "is_progress_enabled", lambda: True)
+        monkeypatch.setattr(output_module.console, "file", StringIO())
+
+        with output_module.progress("outer", total=2) as outer:
+            shared = output_module._shared_progress
+            with output_module.progress("inner") as inner:
+                assert inner._progress is shared
+                assert len(shared.tasks) == 2
+            assert len(shared.tasks) == 1
+            outer.advance()
+
+        assert output_module._shared_progress is None
+        assert not shared.live.is_started
+
+    def test_columns_reused_between_calls(self, monkeypatch):
+        """Successive progress bars should reuse the same column objects."""
+        monkeypatch.setattr(output_module, "is_progress_enabled", lambda: True)
+        monkeypatch.setattr(output_module.console, "file", StringIO())
+
+        with output_module.progress("first", total=1):
+            first = output_module._shared_progress.columns
+        with output_module.progress("second", total=1):
+            second = output_module._shared_progress.columns
+
+        assert first == second
+        assert all(a is b for a, b in zip(first, second))
+
+
+class TestWorkerOptions:
+    """Test how scan sizes its listing and scanning pools."""
+
+    @pytest.fixture
+    def calls(self, tmp_path, monkeypatch):
+        (tmp_path / "a.txt").write_text("Hello world")
+        calls = {}
+
+        def fake_collect(path, recursive, extensions, max_workers, **size_bounds):
+            calls["io_workers"] = max_workers
+            return [tmp_path / "a.txt"]
+
+        def fake_pool(files, exposure, max_workers, callback):
+            calls["workers"] = max_workers
+            return []
+
+        monkeypatch.setattr(scan_module, "collect_files", fake_collect)
+        monkeypatch.setattr(scan_module, "scan_directory_processes", fake_pool)
+        monkeypatch.setattr(scan_module, "scan_directory_parallel", fake_pool)
+        # Keep the defaults above 1 so single-core machines don't go sequential
+        monkeypatch.setattr(scan_module, "DEFAULT_WORKERS", 4)
+        monkeypatch.setattr(scan_module, "DEFAULT_PROCESS_WORKERS", 6)
+        return calls
+
+    def _run(self, tmp_path, *argv):
+        return cmd_scan(TestFilesFrom._parse(str(tmp_path), "-q", *argv))
+
+    def test_process_default_uses_every_core(self, tmp_path, calls):
+        """--processes without --workers should size the pool to the cores."""
+        self._run(tmp_path, "--processes")
+        assert calls["workers"] == 6
+
+    def test_thread_default(self, tmp_path, calls):
+        """Local threaded scans should keep the thread default."""
+        self._run(tmp_path)
+        assert calls["workers"] == 4
+        assert calls["io_workers"] == scan_module.DEFAULT_WALK_WORKERS
+
+    def test_io_and_scan_workers_are_independent(self, tmp_path, calls):
+        """--io-workers should size the walk without touching the scan pool."""
+        self._run(tmp_path, "--io-workers", "3", "--workers", "5")
+        assert calls == {"io_workers": 3, "workers": 5}
+
+
+class TestProcessPoolScan:
+    """Test scanning in worker processes."""
+
+    def test_matches_thread_pool(self, tmp_path):
+        """Process and thread scans should agree, with results in input order."""
+        for i in range(6):
+            content = "Patient SSN: 123-45-6789" if i % 2 else "Hello world"
+            (tmp_path / f"file{i}.txt").write_text(content)
+        files = collect_files(tmp_path)
+        seen = []
+
+        results = scan_directory_processes(files, max_workers=2, callback=seen.append)
+        threaded = scan_directory_parallel(files, max_workers=2)
+
+        assert [r.path for r in results] == [str(f) for f in files]
+        assert seen == results
+        by_path = {r.path: r.to_dict() for r in threaded}
+        assert [r.to_dict() for r in results] == [by_path[r.path] for r in results]
+
+    def test_thread_pool_ordered(self, tmp_path):
+        """ordered=True should return thread results in input order."""
+        for name in ("c.txt", "a.txt", "b.txt"):
+            (tmp_path / name).write_text("Hello world")
+        files = [tmp_path / "c.txt", tmp_path / "a.txt", tmp_path / "b.txt"]
+
+        results = scan_directory_parallel(files, max_workers=3, ordered=True)
+
+        assert [r.path for r in results] == [str(f) for f in files]
+
+    def test_empty_file_list(self):
+        """No files should mean no worker pool and no results."""
+        assert scan_directory_processes([]) == []
+
+
 class TestScanCommandIntegration:
     """Integration tests for scan command - tests REAL scanning, not mocks."""
 
@@ -268,6 +702,51 @@ class TestOutputFormats:
             assert "path" in parsed
             assert "score" in parsed
 
+    @pytest.mark.parametrize("use_orjson", [False, True])
+    def test_write_jsonl(self, use_orjson, monkeypatch, capsys):
+        """write_jsonl should emit one record per line, with or without orjson."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        monkeypatch.setattr(scan_module, "_ORJSON_AVAILABLE", use_orjson)
+        results = [
+            ScanResult(path="/a.txt", score=10, tier="LOW", entities={}, exposure="PRIVATE"),
+            ScanResult(path="/é.txt", score=80, tier="HIGH", entities={"SSN": 1}, exposure="PRIVATE"),
+        ]
+
+        scan_module.write_jsonl(results)
+
+        lines = capsys.readouterr().out.splitlines()
+        assert [json.loads(line) for line in lines] == [r.to_dict() for r in results]
+
+    @pytest.mark.parametrize("use_orjson", [False, True])
+    def test_write_jsonl_surrogate_escaped_path(self, use_orjson, monkeypatch, capsys):
+        """Non-UTF-8 filenames (lone surrogates) should not stop JSONL output."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        monkeypatch.setattr(scan_module, "_ORJSON_AVAILABLE", use_orjson)
+        results = [
+            ScanResult(path="/data/caf\udce9.txt", score=10, tier="LOW", entities={}, exposure="PRIVATE"),
+            ScanResult(path="/data/b.txt", score=80, tier="HIGH", entities={"SSN": 1}, exposure="PRIVATE"),
+        ]
+
+        scan_module.write_jsonl(results)
+
+        lines = capsys.readouterr().out.splitlines()
+        assert [json.loads(line)["path"] for line in lines] == [r.path for r in results]
+
+    def test_to_jsonl_is_compact_single_line(self):
+        """to_jsonl should emit one compact line that round-trips."""
+        result = ScanResult(
+            path="/a b.txt", score=80, tier="HIGH",
+            entities={"SSN": 1}, exposure="PRIVATE",
+        )
+
+        line = to_jsonl(result)
+
+        assert "\n" not in line
+        assert ", " not in line and '": ' not in line
+        assert json.loads(line) == result.to_dict()
+
 
 class TestErrorHandling:
     """Test error handling in scan command."""
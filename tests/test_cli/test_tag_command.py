@@ -0,0 +1,127 @@
+"""
+Tests for the tag CLI command.
+
+Tests embedded vs virtual label writes, error counting, and the
+concurrent label writer pool.
+"""
+
+import argparse
+import os
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from openlabels.cli.commands import tag as tag_module
+from openlabels.cli.commands.tag import add_tag_parser, cmd_tag
+
+
+def _parse(*argv):
+    parser = argparse.ArgumentParser()
+    return add_tag_parser(parser.add_subparsers()).parse_args(list(argv))
+
+
+def _match(path, score=50):
+    return SimpleNamespace(
+        path=path,
+        score=score,
+        tier="MEDIUM",
+        label_set=SimpleNamespace(label_id=f"label-{path}"),
+    )
+
+
+@pytest.fixture
+def tag_env(tmp_path):
+    """cmd_tag with scanning and label writers mocked out."""
+    matches = [
+        _match(str(tmp_path / "report.pdf")),
+        _match(str(tmp_path / "notes.txt")),
+        _match(str(tmp_path / "slides.docx")),
+        _match(str(tmp_path / "data.csv")),
+    ]
+    env = SimpleNamespace(
+        source=str(tmp_path),
+        matches=matches,
+        # report.pdf embeds; slides.docx has a writer that declines
+        write_embedded=MagicMock(side_effect=lambda path, label_set: path.endswith(".pdf")),
+        write_virtual=MagicMock(return_value=True),
+        store=MagicMock(return_value=True),
+        audit=MagicMock(),
+        warn=MagicMock(),
+        dim=MagicMock(),
+    )
+    with patch.object(tag_module, "Client"), \
+            patch.object(tag_module, "find_matching", return_value=iter(matches)), \
+            patch.object(tag_module, "write_embedded_label", env.write_embedded), \
+            patch.object(tag_module, "write_virtual_label", env.write_virtual), \
+            patch.object(tag_module, "store_label", env.store), \
+            patch.object(tag_module, "audit", env.audit), \
+            patch.object(tag_module, "warn", env.warn), \
+            patch.object(tag_module, "dim", env.dim):
+        yield env
+
+
+def _tagged(env):
+    """{path: embedded} from the per-file audit records."""
+    return {
+        call.kwargs["path"]: call.kwargs["embedded"]
+        for call in env.audit.file_tag.call_args_list
+    }
+
+
+class TestCmdTag:
+    """Test tagging files with embedded and virtual labels."""
+
+    def test_embedded_and_virtual_counts(self, tag_env):
+        """Embeddable formats should embed; the rest get virtual labels."""
+        assert cmd_tag(_parse(tag_env.source, "-q")) == 0
+
+        names = {os.path.basename(p): e for p, e in _tagged(tag_env).items()}
+        assert names == {
+            "report.pdf": True,
+            "notes.txt": False,
+            "slides.docx": False,
+            "data.csv": False,
+        }
+        # Only formats with an embed writer are tried
+        embedded_tried = sorted(
+            os.path.basename(c.args[0]) for c in tag_env.write_embedded.call_args_list
+        )
+        assert embedded_tried == ["report.pdf", "slides.docx"]
+        dim_messages = [c.args[0] for c in tag_env.dim.call_args_list]
+        assert "  Embedded: 1" in dim_messages
+        assert "  Virtual: 3" in dim_messages
+
+    def test_virtual_label_written_with_label_set(self, tag_env):
+        """Virtual labels should be written as (file path, label set)."""
+        assert cmd_tag(_parse(tag_env.source, "-q", "--no-embed")) == 0
+
+        tag_env.write_embedded.assert_not_called()
+        assert sorted(c.args for c in tag_env.write_virtual.call_args_list) == sorted(
+            (m.path, m.label_set) for m in tag_env.matches
+        )
+
+    def test_worker_error_counted(self, tag_env):
+        """An error raised in a label writer should count as a failed file."""
+        def write_virtual(path, label_set):
+            if path.endswith("notes.txt"):
+                raise OSError("xattrs not supported")
+            return True
+
+        tag_env.write_virtual.side_effect = write_virtual
+
+        assert cmd_tag(_parse(tag_env.source, "-q")) == 1
+
+        assert len(_tagged(tag_env)) == 3
+        tag_env.warn.assert_called_with("Tagged: 3 files (1 errors)")
+
+    def test_single_worker_matches_pool(self, tag_env):
+        """--workers 1 should tag the same files the same way as the pool."""
+        assert cmd_tag(_parse(tag_env.source, "-q")) == 0
+        pooled = _tagged(tag_env)
+
+        tag_env.audit.reset_mock()
+        with patch.object(tag_module, "find_matching", return_value=iter(tag_env.matches)):
+            assert cmd_tag(_parse(tag_env.source, "-q", "--workers", "1")) == 0
+
+        assert _tagged(tag_env) == pooled
@@ -72,6 +72,59 @@ class TestVersion:
         assert result.returncode == 0
         assert "openlabels" in result.stdout.lower() or "openrisk" in result.stdout.lower()
 
+    def test_version_skips_command_imports(self):
+        """A bare --version should not import the command modules."""
+        code = (
+            "import sys\n"
+            "from openlabels.cli.main import main\n"
+            "main(['--version'])\n"
+            "print('commands loaded:', 'openlabels.cli.commands' in sys.modules)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, timeout=30,
+        )
+
+        assert result.returncode == 0
+        assert "commands loaded: False" in result.stdout
+
+    def test_rich_imported_on_first_use(self):
+        """Rich should only be imported once the console is used."""
+        code = (
+            "import sys\n"
+            "from openlabels.cli.commands import scan\n"
+            "from openlabels.cli.output import console, write_json\n"
+            "write_json({})\n"
+            "print('before:', 'rich' in sys.modules)\n"
+            "console.print('x')\n"
+            "print('after:', 'rich' in sys.modules)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, timeout=30,
+        )
+
+        assert result.returncode == 0
+        assert "before: False" in result.stdout
+        assert "after: True" in result.stdout
+
+
+class TestCommandSelection:
+    """Tests for picking the one command parser to register."""
+
+    @pytest.mark.parametrize("argv, expected", [
+        (["scan", "./data"], "scan"),
+        (["-v", "--no-progress", "find", "."], "find"),
+        (["--log-file", "scan", "report", "."], "report"),
+        (["--log", "out.log", "health"], "health"),
+        (["--log-file=out.log", "read", "a.pdf"], "read"),
+        (["--help"], None),
+        (["-h", "scan"], None),
+        (["bogus"], None),
+        ([], None),
+    ])
+    def test_requested_command(self, argv, expected):
+        from openlabels.cli.main import _requested_command
+        assert _requested_command(argv) == expected
+
 
 # =============================================================================
 # Help Tests
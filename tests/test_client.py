@@ -76,6 +76,43 @@ class TestScoreFile:
         with pytest.raises(FileNotFoundError):
             client.score_file("/nonexistent/path/file.txt")
 
+    def test_repeat_score_is_cached(self, tmp_path):
+        """Scoring an unchanged file twice should hit the cache."""
+        client = Client()
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("SSN: 123-45-6789\n")
+
+        first = client.score_file(str(test_file))
+        second = client.score_file(test_file)
+
+        assert second is first
+        assert client._score_file_cached.cache_info().hits == 1
+
+    def test_modified_file_is_rescored(self, tmp_path):
+        """Changing a file's size should invalidate its cached score."""
+        client = Client()
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("Hello, this is just a normal message.\n")
+
+        first = client.score_file(str(test_file))
+        test_file.write_text("Patient SSN: 123-45-6789, Card: 4532015112830366\n")
+        second = client.score_file(str(test_file))
+
+        assert second is not first
+        assert second.score > first.score
+
+    def test_use_cache_false_bypasses_cache(self, tmp_path):
+        """use_cache=False should always re-scan."""
+        client = Client()
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("SSN: 123-45-6789\n")
+
+        first = client.score_file(str(test_file))
+        second = client.score_file(str(test_file), use_cache=False)
+
+        assert second is not first
+        assert second.score == first.score
+
 
 class TestScoreFromAdapters:
     """Tests for Client.score_from_adapters()."""
@@ -147,6 +184,42 @@ class TestScoreFromAdapters:
         assert isinstance(result, ScoringResult)
         assert result.exposure == "PUBLIC"
 
+    def test_normalize_entity_counts(self):
+        """Canonical counts should be reused; others rebuilt in canonical form."""
+        scorer = Client()._scorer
+
+        canonical = {"SSN": 2, "CREDIT_CARD": 1}
+        assert scorer._normalize_entity_counts(canonical) is canonical
+        assert scorer._normalize_entity_counts({"ssn": 2, " EMAIL ": 1}) == {"SSN": 2, "EMAIL": 1}
+
+    def test_merge_takes_max_per_type(self):
+        """Merged counts and confidences should be the max per entity type."""
+        client = Client()
+        context = NormalizedContext(
+            exposure="PRIVATE",
+            encryption="none",
+            owner="user",
+            path="/file.txt",
+            size_bytes=512,
+            last_modified="2025-01-01T00:00:00Z",
+            file_type="text/plain",
+            is_archive=False,
+        )
+        inputs = [
+            NormalizedInput(entities=[
+                Entity(type="ssn", count=4, confidence=0.70, source="a"),
+                Entity(type="EMAIL", count=1, confidence=0.60, source="a"),
+            ], context=context),
+            NormalizedInput(entities=[
+                Entity(type=" SSN ", count=2, confidence=0.90, source="b"),
+            ], context=context),
+        ]
+
+        entities, confidence = client._scorer._merge_inputs(inputs)
+
+        assert entities == {"SSN": 4, "EMAIL": 1}
+        assert confidence == pytest.approx((0.90 + 0.60) / 2)
+
     def test_empty_inputs(self):
         """Empty inputs should produce zero score."""
         client = Client()
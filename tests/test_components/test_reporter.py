@@ -4,14 +4,15 @@ Tests for openlabels.components.reporter module.
 Tests report generation in various formats.
 """
 
-import pytest
-import tempfile
-import os
-import json
 import csv
-from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+import json
+import os
+import tempfile
 from datetime import datetime
+from pathlib import Path
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
 
 
 @pytest.fixture
@@ -38,7 +39,7 @@ def reporter(mock_context, mock_scanner):
 @pytest.fixture
 def sample_scan_results():
     """Create sample scan results."""
-    from openlabels.core.types import ScanResult, Entity
+    from openlabels.core.types import Entity, ScanResult
 
     results = [
         ScanResult(
@@ -226,10 +227,16 @@ class TestBuildReport:
 class TestWriteReport:
     """Tests for _write_report method."""
 
-    def test_write_json_report(self, reporter, sample_scan_results):
-        """Should write valid JSON."""
+    @pytest.mark.parametrize("use_orjson", [False, True])
+    def test_write_json_report(self, reporter, sample_scan_results, use_orjson, monkeypatch):
+        """Should write valid JSON, with or without orjson."""
+        from openlabels.components import reporter as reporter_module
         from openlabels.core.types import ReportConfig, ReportFormat
 
+        if use_orjson:
+            pytest.importorskip("orjson")
+        monkeypatch.setattr(reporter_module, "_ORJSON_AVAILABLE", use_orjson)
+
         config = ReportConfig(format=ReportFormat.JSON)
         report = reporter._build_report(sample_scan_results, config)
 
@@ -246,10 +253,16 @@ class TestWriteReport:
         finally:
             os.unlink(output_path)
 
-    def test_write_jsonl_report(self, reporter, sample_scan_results):
-        """Should write valid JSONL."""
+    @pytest.mark.parametrize("use_orjson", [False, True])
+    def test_write_jsonl_report(self, reporter, sample_scan_results, use_orjson, monkeypatch):
+        """Should write valid JSONL, with or without orjson."""
+        from openlabels.components import reporter as reporter_module
         from openlabels.core.types import ReportConfig, ReportFormat
 
+        if use_orjson:
+            pytest.importorskip("orjson")
+        monkeypatch.setattr(reporter_module, "_ORJSON_AVAILABLE", use_orjson)
+
         config = ReportConfig(format=ReportFormat.JSONL)
         report = reporter._build_report(sample_scan_results, config)
 
@@ -262,12 +275,40 @@ class TestWriteReport:
             with open(output_path) as f:
                 lines = f.readlines()
 
-            assert len(lines) == 3
-            for line in lines:
-                json.loads(line)  # Should be valid JSON
+            assert [json.loads(line) for line in lines] == report["files"]
         finally:
             os.unlink(output_path)
 
+    @pytest.mark.parametrize("use_orjson", [False, True])
+    @pytest.mark.parametrize("format_name", ["JSON", "JSONL"])
+    def test_write_surrogate_escaped_path(
+        self, reporter, use_orjson, format_name, monkeypatch, tmp_path,
+    ):
+        """Non-UTF-8 filenames (lone surrogates) should not stop JSON reports."""
+        from openlabels.components import reporter as reporter_module
+        from openlabels.core.types import ReportConfig, ReportFormat, ScanResult
+
+        if use_orjson:
+            pytest.importorskip("orjson")
+        monkeypatch.setattr(reporter_module, "_ORJSON_AVAILABLE", use_orjson)
+
+        results = [
+            ScanResult(path="/data/caf\udce9.txt", score=40, tier="MEDIUM"),
+            ScanResult(path="/data/b.txt", score=10, tier="LOW"),
+        ]
+        config = ReportConfig(format=ReportFormat[format_name])
+        report = reporter._build_report(results, config)
+        output_path = tmp_path / "report.out"
+
+        reporter._write_report(report, output_path, config)
+
+        text = output_path.read_text()
+        if format_name == "JSON":
+            files = json.loads(text)["files"]
+        else:
+            files = [json.loads(line) for line in text.splitlines()]
+        assert files == report["files"]
+
     def test_write_csv_report(self, reporter, sample_scan_results):
         """Should write valid CSV."""
         from openlabels.core.types import ReportConfig, ReportFormat
@@ -288,6 +329,7 @@ class TestWriteReport:
             # Header + 3 data rows
             assert len(rows) == 4
             assert rows[0] == ["path", "score", "tier", "size_bytes", "file_type"]
+            assert rows[1] == ["/data/file1.txt", "85", "HIGH", "1024", "text/plain"]
         finally:
             os.unlink(output_path)
 
@@ -333,6 +375,7 @@ class TestWriteReport:
             assert "<!DOCTYPE html>" in content
             assert "<title>Test Report</title>" in content
             assert "<table>" in content
+            assert content == reporter._generate_html_report(report)
         finally:
             os.unlink(output_path)
 
@@ -350,6 +393,41 @@ class TestWriteReport:
             assert os.path.exists(output_path)
 
 
+class TestWriteReports:
+    """Tests for write_reports method."""
+
+    def test_writes_each_format(self, reporter, sample_scan_results, tmp_path):
+        """Each output should match a single-format write."""
+        from openlabels.core.types import ReportConfig, ReportFormat
+
+        report = reporter._build_report(sample_scan_results, ReportConfig())
+        formats = [ReportFormat.HTML, ReportFormat.JSON, ReportFormat.CSV]
+
+        reporter.write_reports(report, [
+            (tmp_path / f"multi.{fmt.value}", fmt) for fmt in formats
+        ])
+
+        for fmt in formats:
+            single = tmp_path / f"single.{fmt.value}"
+            reporter._write_report(report, single, ReportConfig(format=fmt))
+            assert (tmp_path / f"multi.{fmt.value}").read_text() == single.read_text()
+
+    def test_write_error_raised(self, reporter, tmp_path):
+        """A failed write should be raised after the others finish."""
+        from openlabels.core.types import ReportFormat
+
+        # No title or summary, so only the Markdown write fails
+        report = {"files": [{"path": "/a"}]}
+
+        with pytest.raises(KeyError):
+            reporter.write_reports(report, [
+                (tmp_path / "report.md", ReportFormat.MARKDOWN),
+                (tmp_path / "report.jsonl", ReportFormat.JSONL),
+            ])
+
+        assert json.loads((tmp_path / "report.jsonl").read_text()) == {"path": "/a"}
+
+
 class TestGenerateHtmlReport:
     """Tests for _generate_html_report method."""
 
@@ -434,7 +512,7 @@ class TestReport:
 
     def test_report_filters_errors(self, reporter, mock_scanner):
         """Should filter out results with errors."""
-        from openlabels.core.types import ScanResult, ReportFormat
+        from openlabels.core.types import ReportFormat, ScanResult
 
         mock_scanner.scan.return_value = [
             ScanResult(path="/good", score=50, tier="MEDIUM", size_bytes=100,
@@ -449,7 +527,7 @@ class TestReport:
 
     def test_report_sorts_by_score(self, reporter, mock_scanner):
         """Should sort by score when configured."""
-        from openlabels.core.types import ScanResult, ReportFormat, ReportConfig
+        from openlabels.core.types import ReportConfig, ReportFormat, ScanResult
 
         mock_scanner.scan.return_value = [
             ScanResult(path="/low", score=10, tier="LOW", size_bytes=100,
@@ -465,7 +543,7 @@ class TestReport:
 
     def test_report_sorts_by_path(self, reporter, mock_scanner):
         """Should sort by path when configured."""
-        from openlabels.core.types import ScanResult, ReportFormat, ReportConfig
+        from openlabels.core.types import ReportConfig, ReportFormat, ScanResult
 
         mock_scanner.scan.return_value = [
             ScanResult(path="/z_file", score=50, tier="MEDIUM", size_bytes=100,
@@ -481,7 +559,7 @@ class TestReport:
 
     def test_report_sorts_by_tier(self, reporter, mock_scanner):
         """Should sort by tier when configured."""
-        from openlabels.core.types import ScanResult, ReportFormat, ReportConfig
+        from openlabels.core.types import ReportConfig, ReportFormat, ScanResult
 
         mock_scanner.scan.return_value = [
             ScanResult(path="/low", score=10, tier="LOW", size_bytes=100,
@@ -497,7 +575,7 @@ class TestReport:
 
     def test_report_respects_limit(self, reporter, mock_scanner):
         """Should limit results when configured."""
-        from openlabels.core.types import ScanResult, ReportFormat, ReportConfig
+        from openlabels.core.types import ReportConfig, ReportFormat, ScanResult
 
         mock_scanner.scan.return_value = [
             ScanResult(path=f"/file{i}", score=50, tier="MEDIUM", size_bytes=100,
@@ -510,9 +588,32 @@ class TestReport:
 
         assert len(report["files"]) == 5
 
+    @pytest.mark.parametrize("sort_by", ["score", "path", "tier"])
+    @pytest.mark.parametrize("descending", [True, False])
+    def test_report_limit_matches_full_sort(self, reporter, mock_scanner, sort_by, descending):
+        """A limited report should hold the head of the fully sorted report."""
+        from openlabels.core.types import ReportConfig, ReportFormat, ScanResult
+
+        tiers = ["LOW", "HIGH", "MEDIUM", "CRITICAL", "MINIMAL"]
+        mock_scanner.scan.return_value = [
+            ScanResult(path=f"/file{i:02d}", score=(i * 37) % 100, tier=tiers[i % 5],
+                      size_bytes=100, file_type="text", entities=[], error=None)
+            for i in range(20)
+        ]
+
+        full = reporter.report("/test", config=ReportConfig(
+            format=ReportFormat.JSON, sort_by=sort_by, sort_descending=descending,
+        ))
+        limited = reporter.report("/test", config=ReportConfig(
+            format=ReportFormat.JSON, sort_by=sort_by, sort_descending=descending, limit=7,
+        ))
+
+        assert [f["path"] for f in limited["files"]] == \
+            [f["path"] for f in full["files"]][:7]
+
     def test_report_writes_to_output(self, reporter, mock_scanner):
         """Should write to output file when specified."""
-        from openlabels.core.types import ScanResult, ReportFormat
+        from openlabels.core.types import ReportFormat, ScanResult
 
         mock_scanner.scan.return_value = [
             ScanResult(path="/test", score=50, tier="MEDIUM", size_bytes=100,
@@ -534,7 +635,7 @@ class TestReport:
 
     def test_report_returns_data_without_output(self, reporter, mock_scanner):
         """Should return report data even without output file."""
-        from openlabels.core.types import ScanResult, ReportFormat
+        from openlabels.core.types import ReportFormat, ScanResult
 
         mock_scanner.scan.return_value = [
             ScanResult(path="/test", score=50, tier="MEDIUM", size_bytes=100,
@@ -549,7 +650,7 @@ class TestReport:
 
     def test_report_default_config(self, reporter, mock_scanner):
         """Should use default config when not specified."""
-        from openlabels.core.types import ScanResult, ReportFormat
+        from openlabels.core.types import ReportFormat, ScanResult
 
         mock_scanner.scan.return_value = []
         report = reporter.report("/test", format=ReportFormat.JSON)
@@ -580,7 +681,7 @@ class TestEdgeCases:
 
     def test_report_with_zero_size_files(self, reporter, mock_scanner):
         """Should handle zero-size files."""
-        from openlabels.core.types import ScanResult, ReportFormat
+        from openlabels.core.types import ReportFormat, ScanResult
 
         mock_scanner.scan.return_value = [
             ScanResult(path="/empty", score=0, tier="MINIMAL", size_bytes=0,
@@ -593,7 +694,7 @@ class TestEdgeCases:
 
     def test_report_with_special_characters_in_path(self, reporter, mock_scanner):
         """Should handle special characters in paths."""
-        from openlabels.core.types import ScanResult, ReportFormat
+        from openlabels.core.types import ReportFormat, ScanResult
 
         mock_scanner.scan.return_value = [
             ScanResult(path="/path with spaces/file (1).txt", score=50,
@@ -607,7 +708,7 @@ class TestEdgeCases:
 
     def test_report_with_unicode_in_path(self, reporter, mock_scanner):
         """Should handle unicode in paths."""
-        from openlabels.core.types import ScanResult, ReportFormat
+        from openlabels.core.types import ReportFormat, ScanResult
 
         mock_scanner.scan.return_value = [
             ScanResult(path="/数据/文件.txt", score=50, tier="MEDIUM",
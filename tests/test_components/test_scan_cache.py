@@ -0,0 +1,127 @@
+"""
+Tests for the on-disk scan cache.
+
+Tests cache lookups, batched commits, and the Scanner skipping
+detection for unchanged files.
+"""
+
+import sqlite3
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+@pytest.fixture
+def scoring_result():
+    from openlabels.core.scorer import score
+    return score({"SSN": 2, "EMAIL": 1}, exposure="PRIVATE")
+
+
+@pytest.fixture
+def cache(tmp_path):
+    from openlabels.components.scan_cache import ScanCache
+    cache = ScanCache(tmp_path / "cache" / "scan.db")
+    yield cache
+    cache.close()
+
+
+class TestScanCache:
+    """Tests for ScanCache get/put."""
+
+    def test_round_trip(self, cache, scoring_result):
+        """A stored result should come back unchanged."""
+        cache.put("/data/a.txt", 100, 10, "PRIVATE", scoring_result, "abc123")
+
+        result, content_hash = cache.get("/data/a.txt", 100, 10, "PRIVATE")
+
+        assert result == scoring_result
+        assert content_hash == "abc123"
+
+    @pytest.mark.parametrize("mtime_ns, size, exposure", [
+        (101, 10, "PRIVATE"),
+        (100, 11, "PRIVATE"),
+        (100, 10, "PUBLIC"),
+    ])
+    def test_changed_file_misses(self, cache, scoring_result, mtime_ns, size, exposure):
+        """A different mtime, size or exposure should miss the cache."""
+        cache.put("/data/a.txt", 100, 10, "PRIVATE", scoring_result)
+
+        assert cache.get("/data/a.txt", mtime_ns, size, exposure) is None
+        assert cache.get("/data/other.txt", 100, 10, "PRIVATE") is None
+
+    def test_writes_committed_on_flush(self, cache, scoring_result):
+        """Batched writes should be visible to other connections after flush()."""
+        cache.put("/data/a.txt", 100, 10, "PRIVATE", scoring_result)
+
+        def stored():
+            conn = sqlite3.connect(str(cache.path))
+            try:
+                return conn.execute("SELECT COUNT(*) FROM scan_cache").fetchone()[0]
+            finally:
+                conn.close()
+
+        assert stored() == 0
+        cache.flush()
+        assert stored() == 1
+
+
+class TestScannerWithCache:
+    """Tests for Scanner using a ScanCache."""
+
+    @pytest.fixture
+    def scanner(self, cache):
+        from openlabels.components.scanner import Scanner
+        from openlabels.components.scorer import Scorer
+
+        ctx = MagicMock()
+        ctx.default_exposure = "PRIVATE"
+        return Scanner(ctx, Scorer(ctx), cache=cache)
+
+    def test_rescan_skips_unchanged_files(self, scanner, tmp_path):
+        """Only new or modified files should be run through detection."""
+        data = tmp_path / "data"
+        data.mkdir()
+        (data / "a.txt").write_text("a")
+        (data / "b.txt").write_text("b")
+
+        detection = MagicMock(entity_counts={"SSN": 1}, spans=[])
+        with patch("openlabels.adapters.scanner.detect_file", return_value=detection) as detect:
+            first = {r.path: r.score for r in scanner.scan(data)}
+            assert detect.call_count == 2
+
+            second = {r.path: r.score for r in scanner.scan(data)}
+            assert detect.call_count == 2
+            assert second == first
+
+            (data / "b.txt").write_text("changed")
+            list(scanner.scan(data))
+            assert detect.call_count == 3
+
+
+class TestClientScanCache:
+    """Tests for a Client's on-disk scan cache lifetime."""
+
+    def test_close_commits_and_releases(self, tmp_path):
+        """Closing the client should commit the cache and close its database."""
+        from openlabels import Client
+
+        data = tmp_path / "data"
+        data.mkdir()
+        (data / "a.txt").write_text("a")
+        db_path = tmp_path / "scan.db"
+
+        detection = MagicMock(entity_counts={"SSN": 1}, spans=[])
+        with patch("openlabels.adapters.scanner.detect_file", return_value=detection):
+            with Client(cache_path=db_path) as client:
+                list(client.scanner.scan(data))
+
+        assert client._scan_cache is None
+        # Closing the last connection checkpoints and removes the WAL file
+        assert not db_path.with_name(db_path.name + "-wal").exists()
+        conn = sqlite3.connect(str(db_path))
+        try:
+            assert conn.execute("SELECT COUNT(*) FROM scan_cache").fetchone()[0] == 1
+        finally:
+            conn.close()
+
+        client.close()  # Closing again is a no-op
@@ -9,12 +9,12 @@ import stat
 import tempfile
 import time
 from pathlib import Path
-from unittest.mock import MagicMock, patch, PropertyMock
+from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
 
-from openlabels.components.scanner import Scanner, FileModifiedError
-from openlabels.core.types import ScanResult, FilterCriteria, TreeNode
+from openlabels.components.scanner import FileModifiedError, Scanner
+from openlabels.core.types import FilterCriteria, ScanResult, TreeNode
 
 
 # =============================================================================
@@ -118,6 +118,16 @@ class TestIterFiles:
         filenames = [f.name for f in files]
         assert ".hidden_file" in filenames
 
+    def test_hidden_root_still_scanned(self, scanner, tmp_path):
+        """Only entries below the root count as hidden, not the root itself."""
+        root = tmp_path / ".cache" / "data"
+        root.mkdir(parents=True)
+        (root / "file.txt").write_text("content")
+
+        files = list(scanner._iter_files(root, recursive=True, include_hidden=False))
+
+        assert [f.name for f in files] == ["file.txt"]
+
     def test_non_recursive_only_top_level(self, scanner, temp_dir):
         """Test that non-recursive mode only returns top-level files."""
         files = list(scanner._iter_files(temp_dir, recursive=False, include_hidden=False))
@@ -151,6 +161,20 @@ class TestIterFiles:
         for f in files:
             assert f.is_file()
 
+    def test_stats_come_from_walk(self, scanner, temp_dir):
+        """Directory scans should reuse the walk's stat for each file."""
+        for file_path, st in scanner._iter_file_stats(temp_dir, include_hidden=True):
+            assert st.st_size == file_path.stat().st_size
+
+        with patch.object(scanner, '_scan_single_file') as mock_scan:
+            mock_scan.side_effect = lambda p, st=None, scanned_at=None: ScanResult(path=str(p), score=1, tier="LOW")
+            list(scanner.scan(temp_dir))
+
+        assert mock_scan.call_count > 0
+        for call in mock_scan.call_args_list:
+            path, st = call.args
+            assert st.st_ino == path.stat().st_ino
+
 
 # =============================================================================
 # Filter Matching Tests
@@ -221,6 +245,43 @@ class TestMatchesFilter:
         criteria = FilterCriteria(path_pattern="*/admin/*")
         assert scanner._matches_filter(result, criteria, None) is False
 
+    def test_path_pattern_matches_fnmatch(self, scanner):
+        """Compiled patterns should agree with fnmatch and be built once."""
+        import fnmatch
+
+        from openlabels.components.scanner import _path_matcher
+
+        paths = ["/data/a.txt", "/data/sub/b.csv", "/data/[x].txt", "/other/a.txt"]
+        patterns = ["/data/*", "*.txt", "/data/?.txt", "*[[]x[]]*", "/data/sub/*.c?v"]
+        for pattern in patterns:
+            criteria = FilterCriteria(path_pattern=pattern)
+            for path in paths:
+                result = ScanResult(path=path, score=50, tier="LOW")
+                assert scanner._matches_filter(result, criteria, None) is \
+                    fnmatch.fnmatch(path, pattern)
+
+        assert _path_matcher("*.txt") is _path_matcher("*.txt")
+
+    def test_filter_expression_matches_dict(self, scanner):
+        """Filter expressions should see the same fields as to_dict()."""
+        from openlabels.adapters.base import Entity
+        from openlabels.cli.filter import parse_filter
+
+        result = ScanResult(
+            path="/data/users/file.txt", size_bytes=2048, file_type=".txt",
+            score=50, tier="MEDIUM",
+            entities=[Entity(type="SSN", count=2, confidence=0.9, source="test")],
+        )
+        expressions = [
+            "score > 40", "score > 60", "tier = MEDIUM", "has(SSN)",
+            "has(EMAIL)", "entity_count >= 1", "path contains users",
+            "score > 40 AND has(SSN)", "exposure = public", "missing(encryption)",
+        ]
+        for expression in expressions:
+            filter_obj = parse_filter(expression)
+            assert scanner._matches_filter(result, None, filter_obj) is \
+                filter_obj.evaluate(result.to_dict()), expression
+
     def test_file_type_filter(self, scanner):
         """Test file_type filter."""
         result = ScanResult(path="/test", score=50, tier="LOW", file_type=".txt")
@@ -334,7 +395,7 @@ class TestScan:
         with patch.object(scanner, '_scan_single_file') as mock_scan:
             # Return different scores for different files
             call_count = [0]
-            def mock_return(*args):
+            def mock_return(*args, **kwargs):
                 call_count[0] += 1
                 return ScanResult(
                     path=str(args[0]),
@@ -353,7 +414,7 @@ class TestScan:
     def test_scan_handles_file_errors(self, scanner, temp_dir):
         """Test that scan handles errors gracefully."""
         with patch.object(scanner, '_scan_single_file') as mock_scan:
-            def mock_return(path):
+            def mock_return(path, st=None, scanned_at=None):
                 if "file1" in str(path):
                     raise OSError("Permission denied")
                 return ScanResult(path=str(path), score=10, tier="LOW")
@@ -368,6 +429,111 @@ class TestScan:
             assert len(errors) >= 1
             assert len(successes) >= 1
 
+    @pytest.mark.parametrize("preserve_order", [False, True])
+    def test_scan_parallel_matches_serial(self, scanner, tmp_path, preserve_order):
+        """A thread pool should yield the same filtered results as a serial scan."""
+        for i in range(20):
+            (tmp_path / f"f{i:02d}.txt").write_text("x")
+
+        def mock_return(path, st=None, scanned_at=None):
+            if path.name == "f03.txt":
+                raise OSError("Permission denied")
+            # Stagger completion so parallel results finish out of order
+            time.sleep(0.001 * (int(path.stem[1:]) % 4))
+            return ScanResult(path=str(path), score=int(path.stem[1:]) * 5, tier="LOW")
+
+        criteria = FilterCriteria(min_score=20)
+        with patch.object(scanner, '_scan_single_file', side_effect=mock_return):
+            serial = list(scanner.scan(tmp_path, filter_criteria=criteria))
+            parallel = list(scanner.scan(
+                tmp_path, filter_criteria=criteria,
+                max_workers=3, preserve_order=preserve_order,
+            ))
+
+        if preserve_order:
+            assert [r.path for r in parallel] == [r.path for r in serial]
+        assert sorted(r.path for r in parallel) == sorted(r.path for r in serial)
+        # 16 files at score >= 20, plus the error result for f03
+        assert len(parallel) == 17
+        assert [r.path for r in parallel if r.error] == [str(tmp_path / "f03.txt")]
+
+    def test_scan_reuses_parsed_filter(self, scanner, temp_dir):
+        """Scans with the same expression should share one parsed Filter."""
+        from openlabels.cli.filter import Filter
+
+        with patch.object(scanner, '_scan_single_file') as mock_scan, \
+                patch.object(Filter, "parse", wraps=Filter.parse) as parse:
+            mock_scan.side_effect = lambda p, st=None, scanned_at=None: ScanResult(path=str(p), score=60, tier="HIGH")
+            expression = "score > 55 AND tier = HIGH AND score < 99"
+            first = list(scanner.scan(temp_dir, filter_expr=expression))
+            second = list(scanner.scan(temp_dir, filter_expr=expression))
+
+        assert len(first) == len(second) == 3
+        assert parse.call_count <= 1
+
+    def test_scan_parallel_submits_chunks(self, scanner, tmp_path):
+        """Large parallel scans should need far fewer tasks than files."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        for i in range(300):
+            (tmp_path / f"f{i:03d}.txt").write_text("x")
+
+        submitted = []
+        original_submit = ThreadPoolExecutor.submit
+
+        def counting_submit(self, *args, **kwargs):
+            submitted.append(args)
+            return original_submit(self, *args, **kwargs)
+
+        with patch.object(scanner, '_scan_single_file') as mock_scan, \
+                patch.object(ThreadPoolExecutor, "submit", counting_submit):
+            mock_scan.side_effect = lambda p, st=None, scanned_at=None: ScanResult(path=str(p), score=1, tier="LOW")
+            results = list(scanner.scan(tmp_path, max_workers=2, preserve_order=True))
+
+        assert len(results) == 300
+        assert len({r.path for r in results}) == 300
+        assert len(submitted) < 30
+
+    def test_scan_shares_one_timestamp(self, scanner, temp_dir):
+        """Every result of one scan should carry the scan's start time."""
+        detection = MagicMock(entity_counts={}, spans=[])
+        with patch("openlabels.adapters.scanner.detect_file", return_value=detection):
+            results = list(scanner.scan(temp_dir))
+
+        assert len(results) == 3
+        assert len({r.scanned_at for r in results}) == 1
+        assert results[0].scanned_at
+
+    def test_scan_skips_files_ruled_out_by_stat(self, scanner, tmp_path):
+        """Files failing path, size or type criteria should never be scanned."""
+        (tmp_path / "a.csv").write_text("x" * 100)
+        (tmp_path / "b.csv").write_text("x")
+        (tmp_path / "c.txt").write_text("x" * 100)
+
+        with patch.object(scanner, '_scan_single_file') as mock_scan:
+            mock_scan.side_effect = lambda p, st=None, scanned_at=None: ScanResult(
+                path=str(p), size_bytes=st.st_size, file_type=p.suffix,
+                score=10, tier="LOW",
+            )
+            criteria = FilterCriteria(file_type=".csv", min_size=50)
+            results = list(scanner.find(tmp_path, filter_criteria=criteria))
+
+        assert [Path(r.path).name for r in results] == ["a.csv"]
+        assert [c.args[0].name for c in mock_scan.call_args_list] == ["a.csv"]
+
+    def test_scan_parallel_stops_early(self, scanner, tmp_path):
+        """Closing a parallel scan early should not scan the whole tree."""
+        for i in range(200):
+            (tmp_path / f"f{i:03d}.txt").write_text("x")
+
+        with patch.object(scanner, '_scan_single_file') as mock_scan:
+            mock_scan.side_effect = lambda p, st=None, scanned_at=None: ScanResult(path=str(p), score=1, tier="LOW")
+            results = scanner.scan(tmp_path, max_workers=2)
+            next(results)
+            results.close()
+
+        assert mock_scan.call_count < 200
+
 
 # =============================================================================
 # Find Method Tests
@@ -448,7 +614,7 @@ class TestScanTree:
         scores = [10, 50, 90]
         call_count = [0]
 
-        def mock_scan(path):
+        def mock_scan(path, st=None):
             idx = call_count[0] % len(scores)
             call_count[0] += 1
             return ScanResult(
@@ -463,6 +629,79 @@ class TestScanTree:
             # max_score should be the highest child score
             assert result.max_score >= 0
 
+    def test_scan_tree_children_from_listing(self, scanner, temp_dir):
+        """Children should be typed from the listing, skipping hidden and symlinks."""
+        try:
+            (temp_dir / "link.txt").symlink_to(temp_dir / "file1.txt")
+        except (OSError, NotImplementedError):
+            pytest.skip("symlinks not supported")
+
+        with patch.object(scanner, '_scan_single_file') as mock_scan:
+            mock_scan.side_effect = lambda p, st=None: ScanResult(path=str(p), score=40, tier="MEDIUM")
+            result = scanner.scan_tree(temp_dir)
+
+        children = {c.name: c for c in result.children}
+        assert sorted(children) == ["file1.txt", "file2.txt", "link.txt", "subdir"]
+        assert children["subdir"].is_directory is True
+        assert children["link.txt"].score == 0
+        assert mock_scan.call_count == 3
+        assert result.max_score == 40
+
+    def test_scan_tree_averages_over_all_files(self, scanner, tmp_path):
+        """avg_score should be the mean over every file below the directory."""
+        (tmp_path / "high.txt").write_text("x")
+        (tmp_path / "clean").mkdir()
+        (tmp_path / "clean" / "a.txt").write_text("x")
+        (tmp_path / "mixed").mkdir()
+        (tmp_path / "mixed" / "b.txt").write_text("x")
+        (tmp_path / "mixed" / "c.txt").write_text("x")
+
+        file_scores = {"high.txt": 90, "a.txt": 0, "b.txt": 20, "c.txt": 50}
+        with patch.object(scanner, '_scan_single_file') as mock_scan:
+            mock_scan.side_effect = lambda p, st=None: ScanResult(
+                path=str(p), score=file_scores[p.name], tier="LOW",
+            )
+            result = scanner.scan_tree(tmp_path)
+
+        children = {c.name: c for c in result.children}
+        assert children["mixed"].avg_score == 35
+        assert children["clean"].avg_score == 0
+        assert result.total_files == 4
+        assert result.score_sum == 160
+        assert result.avg_score == 40
+        assert result.score_distribution == {"LOW": 4}
+        assert children["mixed"].to_dict()["score_distribution"] == {"LOW": 2}
+
+    def test_scan_tree_reuses_walk_stat(self, scanner, temp_dir):
+        """Files should be scanned with the walk's stat, and their sizes summed."""
+        with patch.object(scanner, '_scan_single_file') as mock_scan:
+            mock_scan.side_effect = lambda p, st=None: ScanResult(path=str(p), score=10, tier="LOW")
+            result = scanner.scan_tree(temp_dir)
+
+        stats = {c.args[0].name: c.args[1] for c in mock_scan.call_args_list}
+        assert stats["file1.txt"].st_size == (temp_dir / "file1.txt").stat().st_size
+        visible = ["file1.txt", "file2.txt", "subdir/nested.txt"]
+        assert result.total_size == sum((temp_dir / p).stat().st_size for p in visible)
+
+    def test_scan_tree_parallel_matches_serial(self, scanner, tmp_path):
+        """Scanning the tree's files on a thread pool should give the same tree."""
+        for d in ("a", "b", "b/c"):
+            (tmp_path / d).mkdir()
+            for i in range(5):
+                (tmp_path / d / f"f{i}.txt").write_text("x")
+
+        def mock_scan(path, st=None):
+            score = int(path.stem[1:]) * 20 + len(path.parent.name)
+            return ScanResult(path=str(path), score=score, tier="HIGH" if score > 50 else "LOW")
+
+        with patch.object(scanner, '_scan_single_file', side_effect=mock_scan):
+            serial = scanner.scan_tree(tmp_path)
+            parallel = scanner.scan_tree(tmp_path, max_workers=3)
+
+        assert parallel.to_dict() == serial.to_dict()
+        assert parallel.total_files == 15
+        assert parallel.max_score == 81
+
 
 # =============================================================================
 # FileModifiedError Tests
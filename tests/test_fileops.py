@@ -224,12 +224,51 @@ class TestFileOpsMove:
         dest = tmp_path / "dest.txt"
 
         # Mock to simulate permission error
-        with patch('shutil.move', side_effect=PermissionError("Access denied")):
+        with patch('os.replace', side_effect=PermissionError("Access denied")):
             result = fileops.move(source, dest)
 
         assert result.success is False
         assert result.metadata["error_type"] == FileErrorType.PERMISSION_DENIED.value
 
+    def test_move_renames_in_place(self, fileops, tmp_path):
+        """A same-filesystem move should be a single rename."""
+        source = tmp_path / "source.txt"
+        source.write_text("content")
+        dest = tmp_path / "dest.txt"
+
+        with patch('shutil.move') as mock_move:
+            result = fileops.move(source, dest)
+
+        assert result.success is True
+        mock_move.assert_not_called()
+        assert dest.read_text() == "content"
+
+    def test_move_falls_back_across_devices(self, fileops, tmp_path):
+        """A cross-device rename should fall back to shutil.move."""
+        import errno
+
+        source = tmp_path / "source.txt"
+        source.write_text("content")
+        dest = tmp_path / "dest.txt"
+
+        with patch('os.replace', side_effect=OSError(errno.EXDEV, "Invalid cross-device link")):
+            result = fileops.move(source, dest)
+
+        assert result.success is True
+        assert dest.read_text() == "content"
+
+    def test_move_into_existing_directory(self, fileops, tmp_path):
+        """Moving onto a directory should move the file into it."""
+        source = tmp_path / "source.txt"
+        source.write_text("content")
+        dest_dir = tmp_path / "archive"
+        dest_dir.mkdir()
+
+        result = fileops.move(source, dest_dir)
+
+        assert result.success is True
+        assert (dest_dir / "source.txt").read_text() == "content"
+
 
 class TestFileOpsQuarantine:
     """Tests for FileOps.quarantine() method."""
@@ -341,6 +380,59 @@ class TestFileOpsQuarantine:
         assert result.error_count == 1
         assert result.moved_count == 0
 
+    def test_quarantine_makes_each_directory_once(self, fileops, tmp_path):
+        """Files sharing a destination directory should mkdir it once."""
+        ops, scanner = fileops
+        source = tmp_path / "source"
+        (source / "sub").mkdir(parents=True)
+        files = [source / "sub" / f"f{i}.txt" for i in range(3)] + [source / "top.txt"]
+        for f in files:
+            f.write_text(f.name)
+
+        scanner.scan.return_value = [
+            MagicMock(path=str(f), score=90, tier="CRITICAL", error=None) for f in files
+        ]
+
+        quarantine_dir = tmp_path / "quarantine"
+        original_mkdir = Path.mkdir
+        made = []
+
+        def tracking_mkdir(self, *args, **kwargs):
+            made.append(self)
+            return original_mkdir(self, *args, **kwargs)
+
+        with patch.object(Path, "mkdir", tracking_mkdir):
+            result = ops.quarantine(source, quarantine_dir, dry_run=False)
+
+        assert result.moved_count == 4
+        assert made == [quarantine_dir, quarantine_dir / "sub"]
+        assert all(not f.exists() for f in files)
+        assert (quarantine_dir / "sub" / "f2.txt").read_text() == "f2.txt"
+
+    def test_quarantine_parallel_matches_serial(self, fileops, tmp_path):
+        """Parallel moves should report files in scan order and keep the manifest whole."""
+        ops, scanner = fileops
+        source = tmp_path / "source"
+        source.mkdir()
+        files = [source / f"d{i % 3}" / f"f{i:02d}.txt" for i in range(30)]
+        for f in files:
+            f.parent.mkdir(exist_ok=True)
+            f.write_text(f.name)
+
+        scanner.scan.return_value = iter(
+            [MagicMock(path="/bad", score=None, tier=None, error="Scan failed")]
+            + [MagicMock(path=str(f), score=90, tier="CRITICAL", error=None) for f in files]
+        )
+
+        quarantine_dir = tmp_path / "quarantine"
+        result = ops.quarantine(source, quarantine_dir, max_workers=4)
+
+        assert result.moved_count == 30
+        assert result.error_count == 1
+        assert [m["source"] for m in result.moved_files] == [str(f) for f in files]
+        manifest = json.loads((quarantine_dir / QUARANTINE_MANIFEST).read_text())
+        assert set(manifest["processed"]) == {str(f) for f in files}
+
 
 class TestFileOpsIdempotentMove:
     """Tests for idempotent move operation."""
@@ -505,6 +597,27 @@ class TestFileOpsDelete:
         assert not file1.exists()
         assert not file2.exists()
 
+    def test_delete_directory_parallel(self, fileops, tmp_path):
+        """Parallel deletes should report files in scan order."""
+        ops, scanner = fileops
+        source = tmp_path / "source"
+        source.mkdir()
+        files = [source / f"file{i:02d}.txt" for i in range(20)]
+        for f in files:
+            f.write_text("content")
+
+        scanner.scan.return_value = iter(
+            [MagicMock(path=str(f), score=90, tier="CRITICAL", error=None) for f in files]
+            + [MagicMock(path=str(source / "gone.txt"), score=90, tier="HIGH", error=None)]
+        )
+
+        result = ops.delete(source, dry_run=False, max_workers=4)
+
+        assert result.deleted_files == [str(f) for f in files]
+        assert result.error_count == 1
+        assert result.errors[0]["error_type"] == FileErrorType.NOT_FOUND.value
+        assert not any(f.exists() for f in files)
+
     def test_delete_handles_permission_error(self, fileops, tmp_path):
         """Should handle permission errors gracefully."""
         ops, scanner = fileops
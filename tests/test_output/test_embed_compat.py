@@ -61,6 +61,15 @@ class TestEmbedReexports:
         from openlabels.output.embed import read_embedded_label
         assert callable(read_embedded_label)
 
+    def test_imports_embeddable_extensions(self):
+        """Should re-export EMBEDDABLE_EXTENSIONS covering every writer."""
+        from openlabels.output.embed import EMBEDDABLE_EXTENSIONS, supports_embedded_labels
+        assert isinstance(EMBEDDABLE_EXTENSIONS, frozenset)
+        assert {'.pdf', '.docx', '.png'} <= EMBEDDABLE_EXTENSIONS
+        assert '.txt' not in EMBEDDABLE_EXTENSIONS
+        for ext in EMBEDDABLE_EXTENSIONS:
+            assert supports_embedded_labels(f"file{ext}")
+
 
 class TestAllExports:
     """Tests for __all__ exports."""
@@ -82,6 +91,7 @@ class TestAllExports:
             'PDFLabelWriter',
             'OfficeLabelWriter',
             'ImageLabelWriter',
+            'EMBEDDABLE_EXTENSIONS',
             'get_writer',
             'supports_embedded_labels',
             'write_embedded_label',
@@ -462,3 +462,86 @@ class TestMetadataHandling:
         assert context.versioning is True
         assert context.access_logging is True
         assert context.retention_policy is True
+
+
+class TestSharedDetector:
+    """Tests for detector reuse in the detect()/detect_file() helpers."""
+
+    def test_reused_for_same_overrides(self):
+        """Same overrides should share one detector; different ones should not."""
+        from openlabels.adapters.scanner.adapter import _get_detector
+
+        first = _get_detector(None, {"min_confidence": 0.5})
+        assert _get_detector(None, {"min_confidence": 0.5}) is first
+        assert _get_detector(None, {"min_confidence": 0.9}) is not first
+
+    def test_rebuilt_after_default_context_reset(self):
+        """A reset default context should not leave a stale shared detector."""
+        from openlabels.adapters.scanner.adapter import _get_detector
+        from openlabels.context import reset_default_context
+
+        first = _get_detector(None, {})
+        reset_default_context()
+
+        assert _get_detector(None, {}) is not first
+
+    def test_explicit_context_not_shared(self):
+        """A caller's own context should always get its own detector."""
+        from openlabels.adapters.scanner.adapter import _get_detector
+        from openlabels.context import Context
+
+        ctx = Context()
+        try:
+            assert _get_detector(ctx, {}) is not _get_detector(ctx, {})
+        finally:
+            ctx.close()
+
+
+class TestChunkedDetection:
+    """Tests for splitting large text across concurrent detections."""
+
+    def test_split_chunks_cover_text(self):
+        """Chunks should overlap, end on newlines and cover the whole text."""
+        from openlabels.adapters.scanner.adapter import _split_chunks
+
+        text = "".join(f"line {i:04d}\n" for i in range(500))
+        chunks = _split_chunks(text, size=1000, overlap=50)
+
+        assert len(chunks) > 1
+        assert chunks[0][0] == 0
+        for (offset, chunk), (next_offset, _) in zip(chunks, chunks[1:]):
+            assert text[offset:offset + len(chunk)] == chunk
+            assert chunk.endswith("\n")
+            assert next_offset == offset + len(chunk) - 50
+        last_offset, last = chunks[-1]
+        assert last_offset + len(last) == len(text)
+
+    def test_chunked_matches_whole_text(self):
+        """Chunked detection should find the same entities with shifted offsets."""
+        from openlabels.adapters.scanner import adapter
+        from openlabels.adapters.scanner.adapter import Detector
+        from openlabels.adapters.scanner.config import Config
+
+        filler = "Nothing sensitive on this line at all.\n" * 40
+        text = "".join(
+            f"{filler}Contact user{i}@example.com for details.\n" for i in range(6)
+        )
+
+        with patch.object(adapter, "DETECT_CHUNK_SIZE", 2000), \
+                patch.object(adapter, "DETECT_CHUNK_OVERLAP", 64):
+            chunked = Detector(Config(chunk_threshold=1000)).detect(text)
+        whole = Detector(Config()).detect(text)
+
+        def emails(result):
+            return [(s.start, s.end, s.text) for s in result.spans if s.entity_type == "EMAIL"]
+
+        assert len(emails(whole)) == 6
+        assert emails(chunked) == emails(whole)
+        assert chunked.detectors_used == whole.detectors_used
+
+    def test_negative_threshold_rejected(self):
+        """Config should reject a negative chunk threshold."""
+        from openlabels.adapters.scanner.config import Config
+
+        with pytest.raises(ValueError):
+            Config(chunk_threshold=-1)
@@ -15,6 +15,7 @@ All fixed locations:
 - components/scanner.py: _iter_files(), _build_tree_node()
 """
 
+import contextlib
 import os
 import stat
 import tempfile
@@ -294,15 +295,26 @@ class TestScannerTOCTOU:
             mock_scorer = MagicMock()
             scanner = Scanner(ctx, mock_scorer)
 
-            # Mock stat to raise PermissionError for file1
-            original_stat = Path.stat
+            # Make the file-type check raise PermissionError for file1
+            original_scandir = os.scandir
 
-            def mock_stat(self, *args, **kwargs):
-                if "file1" in str(self):
+            class DeniedEntry:
+                def __init__(self, entry):
+                    self.name, self.path = entry.name, entry.path
+
+                def is_file(self, follow_symlinks=True):
                     raise PermissionError("Access denied")
-                return original_stat(self, *args, **kwargs)
 
-            with patch.object(Path, "stat", mock_stat):
+                is_dir = is_file
+
+            def mock_scandir(directory):
+                with original_scandir(directory) as entries:
+                    listed = [
+                        DeniedEntry(e) if "file1" in e.name else e for e in entries
+                    ]
+                return contextlib.nullcontext(listed)
+
+            with patch.object(os, "scandir", mock_scandir):
                 files = list(scanner._iter_files(Path(tmpdir), recursive=False))
 
             # Should only have file2